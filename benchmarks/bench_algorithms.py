@@ -0,0 +1,387 @@
+"""
+Throughput and scaling benchmark for every scheduling algorithm.
+
+Times every registered algorithm over request counts from 10^2
+to 10^7, several workload distributions and both sweep directions. Every
+case records the best wall time, ns/request, peak traced memory and the
+empirical scaling exponent (least-squares slope of log time against log
+size). Results are saved as JSON so runs can be compared across commits;
+with --compare, cases that got slower than the tolerance (or whose
+scaling exponent grew) are reported and the exit status is 1. With
+--profile, every case is run once more at its largest size under a
+Profiler: the share of the run spent in each phase (sort, partition,
+...) and outside of them ("self") is printed and saved, and the phases
+are written as a Chrome trace.
+
+Run from the repository root:
+    python -m benchmarks.bench_algorithms --output results.json
+    python -m benchmarks.bench_algorithms --max-size 100000 --compare results.json
+    python -m benchmarks.bench_algorithms --max-size 100000 --profile trace.json
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from src.disk_scheduling_simulator.algorithms import BACKENDS, DiskScheduler
+from src.disk_scheduling_simulator.parallel import generate_workload
+from src.disk_scheduling_simulator.profiling import Profiler
+from src.disk_scheduling_simulator.registry import algorithm_names, get_algorithm
+from src.disk_scheduling_simulator.utils import _load_numpy
+
+SIZES = [10 ** exponent for exponent in range(2, 8)]
+DISTRIBUTIONS = ["uniform", "zipf", "sequential", "bursty"]
+DIRECTIONS = ["Right", "Left"]
+DISK_SIZE = 1_000_000
+SEED = 0
+REPEATS = 5
+# Fast cases are looped so that every timed sample lasts at least this long
+MIN_SAMPLE = 0.02
+# Stop repeating a case once this much time has been spent on it
+REPEAT_BUDGET = 2.0
+# Sizes above a case that took longer than this are skipped
+TIME_LIMIT = 30.0
+# Sizes below this are dominated by call overhead and left out of the fit
+FIT_MIN_SIZE = 10_000
+# Peak memory is traced (which is slow) only up to this size
+MEMORY_MAX_SIZE = 1_000_000
+TOLERANCE = 0.25
+EXPONENT_TOLERANCE = 0.3
+
+
+def make_workload(distribution, num_requests, disk_size, backend):
+    """Build a seeded workload in the backend's native input type."""
+    np = _load_numpy()
+    if np is None:
+        if distribution != "uniform":
+            raise ValueError(f"The {distribution} distribution requires NumPy")
+        return list(generate_workload(num_requests, disk_size, SEED))
+
+    from src.disk_scheduling_simulator.workloads import generate
+    requests = generate(distribution, num_requests, disk_size, seed=SEED).requests
+    return requests if backend == "numpy" else requests.tolist()
+
+
+def time_case(run, repeats=REPEATS):
+    """Return the best per-call wall time (seconds) of run() with the garbage collector paused."""
+    loops = 1
+    best = float("inf")
+    spent = 0.0
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(loops):
+                run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / loops)
+        spent += elapsed
+        if spent > REPEAT_BUDGET:
+            break
+        if elapsed < MIN_SAMPLE:
+            loops = max(loops, int(MIN_SAMPLE / max(elapsed / loops, 1e-9)) + 1)
+    return best
+
+
+def calibrate():
+    """Time a fixed pure-Python workload, used to factor out machine speed when comparing."""
+    values = list(range(200_000, 0, -1))
+    return time_case(lambda: sorted(value ^ 0x5555 for value in values))
+
+
+def peak_memory(run):
+    """Return the peak traced allocation (bytes) during one call of run()."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def scaling_exponent(points):
+    """
+    Fit time ~ size^k by least squares in log-log space.
+
+    Args:
+        points (list): (size, seconds) pairs
+
+    Returns:
+        float: The exponent k, or None with fewer than two usable points
+    """
+    fit = [(size, seconds) for size, seconds in points if size >= FIT_MIN_SIZE and seconds > 0]
+    if len(fit) < 2:
+        fit = [(size, seconds) for size, seconds in points if seconds > 0]
+    if len(fit) < 2:
+        return None
+    xs = [math.log(size) for size, _ in fit]
+    ys = [math.log(seconds) for _, seconds in fit]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def run_suite(sizes, distributions, algorithms, backend, disk_size, measure_memory=True,
+              time_limit=TIME_LIMIT, log=print):
+    """
+    Run every (algorithm, distribution, direction, size) case.
+
+    Returns:
+        list: One dictionary per (algorithm, distribution, direction) with a
+            "runs" list of per-size measurements and the fitted exponent
+    """
+    scheduler = DiskScheduler(disk_size=disk_size, initial_head=disk_size // 2, backend=backend)
+    cases = {}
+    stopped = set()
+    for distribution in distributions:
+        for size in sizes:
+            requests = make_workload(distribution, size, disk_size, backend)
+            for algorithm in algorithms:
+                directions = DIRECTIONS if get_algorithm(algorithm).directional else [None]
+                for direction in directions:
+                    key = (algorithm, distribution, direction)
+                    case = cases.setdefault(key, {
+                        "algorithm": algorithm,
+                        "distribution": distribution,
+                        "direction": direction,
+                        "runs": [],
+                    })
+                    if key in stopped:
+                        continue
+
+                    def run(algorithm=algorithm, direction=direction or "Right"):
+                        scheduler.run_algorithm(algorithm, requests, direction)
+
+                    seconds = time_case(run)
+                    measurement = {
+                        "size": size,
+                        "seconds": seconds,
+                        "ns_per_request": seconds / size * 1e9,
+                    }
+                    if measure_memory and size <= MEMORY_MAX_SIZE:
+                        peak = peak_memory(run)
+                        measurement["peak_bytes"] = peak
+                        measurement["bytes_per_request"] = peak / size
+                    case["runs"].append(measurement)
+                    log(_format_row(case, measurement))
+                    if seconds > time_limit:
+                        stopped.add(key)
+            del requests
+
+    for case in cases.values():
+        case["exponent"] = scaling_exponent(
+            [(run["size"], run["seconds"]) for run in case["runs"]])
+    return list(cases.values())
+
+
+def profile_cases(cases, backend, disk_size):
+    """
+    Run every case once more at its largest measured size under a Profiler.
+
+    Adds to every case the profiled run's "profile_seconds" and a "phases"
+    mapping (phase path below the algorithm -> seconds), in which "self"
+    is the run's time outside of its phases.
+
+    Returns:
+        Profiler: The profiler holding every phase
+    """
+    profiler = Profiler()
+    scheduler = DiskScheduler(disk_size=disk_size, initial_head=disk_size // 2, backend=backend,
+                              profiler=profiler)
+    workload_key = requests = None
+    for case in cases:
+        if not case["runs"]:
+            continue
+        size = case["runs"][-1]["size"]
+        if workload_key != (case["distribution"], size):
+            workload_key = (case["distribution"], size)
+            requests = make_workload(case["distribution"], size, disk_size, backend)
+        first = len(profiler.phases)
+        scheduler.run_algorithm(case["algorithm"], requests, case["direction"] or "Right")
+        phases = {}
+        run_time = children_time = 0
+        for phase in profiler.phases[first:]:
+            if len(phase.path) == 1:
+                run_time = phase.duration
+                continue
+            if len(phase.path) == 2:
+                children_time += phase.duration
+            path = "/".join(phase.path[1:])
+            phases[path] = phases.get(path, 0) + phase.duration / 1e9
+        phases["self"] = max(run_time - children_time, 0) / 1e9
+        case["profile_seconds"] = run_time / 1e9
+        case["phases"] = phases
+    return profiler
+
+
+def _format_phases(case):
+    # Shares of the whole run, so "self" covers the time no phase accounts for
+    total = case["profile_seconds"]
+    shares = sorted(case["phases"].items(), key=lambda item: -item[1])
+    return ", ".join(f"{path} {seconds / total:.0%}" for path, seconds in shares) if total else "-"
+
+
+def compare_results(current, baseline, tolerance=TOLERANCE, speed_ratio=1.0):
+    """
+    Find cases that regressed against a baseline result file.
+
+    A case regresses when its ns/request, averaged geometrically over the
+    sizes used for the scaling fit, grew by more than the tolerance, or when
+    its scaling exponent grew by more than EXPONENT_TOLERANCE.
+
+    Args:
+        current (list): Cases from run_suite()
+        baseline (list): Cases loaded from an earlier JSON result
+        tolerance (float): Allowed relative slowdown in ns/request
+        speed_ratio (float): Calibration time of this machine divided by
+            the baseline's, to compare results from different machines
+
+    Returns:
+        list: Human-readable regression messages
+    """
+    previous = {(case["algorithm"], case["distribution"], case["direction"]): case
+                for case in baseline}
+    regressions = []
+    for case in current:
+        label = _case_label(case)
+        old = previous.get((case["algorithm"], case["distribution"], case["direction"]))
+        if old is None:
+            continue
+        old_runs = {run["size"]: run["ns_per_request"] for run in old["runs"]}
+        matched = [(run["size"], run["ns_per_request"] / (old_runs[run["size"]] * speed_ratio))
+                   for run in case["runs"] if run["size"] in old_runs]
+        ratios = ([ratio for size, ratio in matched if size >= FIT_MIN_SIZE]
+                  or [ratio for _, ratio in matched])
+        if ratios:
+            slowdown = math.exp(sum(math.log(ratio) for ratio in ratios) / len(ratios))
+            if slowdown > 1 + tolerance:
+                regressions.append(f"{label}: {slowdown:.2f}x slower per request")
+        if (case["exponent"] is not None and old["exponent"] is not None
+                and case["exponent"] > old["exponent"] + EXPONENT_TOLERANCE):
+            regressions.append(
+                f"{label}: scaling exponent {old['exponent']:.2f} -> {case['exponent']:.2f}")
+    return regressions
+
+
+def environment(backend, disk_size, calibration):
+    """Describe the machine and code version a result was measured on."""
+    np = _load_numpy()
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "backend": backend,
+        "disk_size": disk_size,
+        "seed": SEED,
+        "calibration_seconds": calibration,
+    }
+
+
+def _case_label(case):
+    direction = f" {case['direction']}" if case["direction"] else ""
+    return f"{case['algorithm']}{direction} ({case['distribution']})"
+
+
+def _format_row(case, run):
+    memory = f"{run['peak_bytes'] / 2 ** 20:>9.1f}" if "peak_bytes" in run else f"{'-':>9}"
+    return (f"{_case_label(case):<28} | {run['size']:>10} | {run['seconds']:>10.4f} | "
+            f"{run['ns_per_request']:>10.0f} | {memory}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark every disk scheduling algorithm.")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1],
+                        help=f"Largest request count (default: {SIZES[-1]})")
+    parser.add_argument("--distribution", action="append", dest="distributions",
+                        choices=DISTRIBUTIONS, help="Workload distribution (repeatable)")
+    parser.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                        choices=algorithm_names(), help="Algorithm to run (repeatable, default: all)")
+    parser.add_argument("--backend", choices=BACKENDS, default="python",
+                        help="DiskScheduler backend (default: python)")
+    parser.add_argument("--disk-size", type=int, default=DISK_SIZE,
+                        help=f"Total number of cylinders (default: {DISK_SIZE})")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT,
+                        help="Skip larger sizes once a case takes this many seconds")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the (slower) peak memory measurement")
+    parser.add_argument("-o", "--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="Earlier JSON result to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Allowed relative slowdown (default: {TOLERANCE})")
+    parser.add_argument("--profile", metavar="TRACE",
+                        help="Break each case down by phase and write a Chrome trace to this file")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    np = _load_numpy()
+    distributions = args.distributions or (DISTRIBUTIONS if np is not None else ["uniform"])
+    algorithms = args.algorithms or algorithm_names()
+    sizes = [size for size in SIZES if size <= args.max_size]
+
+    print(f"Algorithm benchmark ({args.backend} backend, disk size {args.disk_size})")
+    print("=" * 80)
+    print(f"{'case':<28} | {'requests':>10} | {'time (s)':>10} | {'ns/request':>10} | "
+          f"{'peak MiB':>9}")
+    print("-" * 80)
+    calibration = calibrate()
+    cases = run_suite(sizes, distributions, algorithms, args.backend, args.disk_size,
+                      measure_memory=not args.no_memory, time_limit=args.time_limit)
+    print("-" * 80)
+    for case in cases:
+        exponent = f"{case['exponent']:.2f}" if case["exponent"] is not None else "-"
+        print(f"{_case_label(case):<28} | scaling exponent {exponent}")
+    print("=" * 80)
+
+    if args.profile:
+        profiler = profile_cases(cases, args.backend, args.disk_size)
+        for case in cases:
+            if "phases" in case:
+                print(f"{_case_label(case):<28} | {_format_phases(case)}")
+        profiler.write_chrome_trace(args.profile)
+        print("Chrome trace written to", args.profile)
+        print("=" * 80)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"environment": environment(args.backend, args.disk_size, calibration),
+                       "cases": cases}, file, indent=2)
+            file.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        baseline_calibration = baseline["environment"].get("calibration_seconds")
+        speed_ratio = calibration / baseline_calibration if baseline_calibration else 1.0
+        regressions = compare_results(cases, baseline["cases"], args.tolerance, speed_ratio)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print("No regressions against", args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
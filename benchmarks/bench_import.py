@@ -0,0 +1,69 @@
+"""
+Cold-start import benchmark.
+
+Times the import of the library and its headless entry point in a fresh
+interpreter (excluding interpreter start-up) and lists any heavy optional
+modules (tkinter, matplotlib, numpy) that were loaded.
+Exits with status 1 if an import exceeds its budget, so it can run in CI.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+REPEATS = 7
+HEAVY_MODULES = ("tkinter", "matplotlib", "numpy")
+
+# Import budgets in milliseconds
+TARGETS = {
+    "disk_scheduling_simulator": 50,
+    "disk_scheduling_simulator.cli": 60,
+}
+
+
+def time_import(module):
+    """Return (median seconds, heavy modules loaded) for importing module in a fresh process."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r}))\n"
+        "print(elapsed, ','.join(heavy))\n"
+    )
+    timings = []
+    heavy = ""
+    for _ in range(REPEATS):
+        output = subprocess.run([sys.executable, "-c", code], cwd=SRC, check=True,
+                                capture_output=True, text=True).stdout.split()
+        timings.append(float(output[0]))
+        heavy = output[1] if len(output) > 1 else ""
+    return statistics.median(timings), heavy
+
+
+def main():
+    print("Import time benchmark")
+    print("=" * 60)
+    print(f"{'module':<32} | {'ms':>7} | {'budget':>6} | heavy modules")
+    print("-" * 60)
+
+    failed = False
+    for module, budget in TARGETS.items():
+        elapsed, heavy = time_import(module)
+        milliseconds = elapsed * 1000
+        over = milliseconds > budget or heavy
+        failed = failed or over
+        flag = "  <-- regression" if over else ""
+        print(f"{module:<32} | {milliseconds:>7.1f} | {budget:>6} | {heavy or '-'}{flag}")
+
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Scaling benchmark for the SSTF algorithm.
+
+Times SSTF on uniformly random request lists of growing size and reports the
+empirical scaling exponent between consecutive sizes. An O(n log n)
+implementation should stay close to 1.0; a quadratic one approaches 2.0.
+
+Run from the repository root:
+    python -m benchmarks.bench_sstf
+"""
+
+import math
+import random
+import time
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DISK_SIZE = 1_000_000
+REPEATS = 3
+
+
+def time_sstf(num_requests, seed=0):
+    """Return the best wall time (seconds) of SSTF over REPEATS runs."""
+    rng = random.Random(seed)
+    requests = [rng.randrange(DISK_SIZE) for _ in range(num_requests)]
+    scheduler = DiskScheduler(disk_size=DISK_SIZE, initial_head=DISK_SIZE // 2)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        scheduler.run_algorithm("SSTF", requests)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print("SSTF scaling benchmark")
+    print("=" * 50)
+    print(f"{'requests':>10} | {'time (s)':>10} | {'ns/request':>10} | {'exponent':>8}")
+    print("-" * 50)
+
+    previous = None
+    for size in SIZES:
+        elapsed = time_sstf(size)
+        if previous is None:
+            exponent = "-"
+        else:
+            prev_size, prev_elapsed = previous
+            exponent = f"{math.log(elapsed / prev_elapsed) / math.log(size / prev_size):.2f}"
+        print(f"{size:>10} | {elapsed:>10.4f} | {elapsed / size * 1e9:>10.0f} | {exponent:>8}")
+        previous = (size, elapsed)
+
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
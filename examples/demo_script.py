@@ -4,6 +4,7 @@ Demo script showing how to use the disk scheduling algorithms programmatically.
 """
 
 from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import compare
 
 def main():
     # Initialize scheduler
@@ -12,18 +13,17 @@ def main():
     # Set requests
     requests = [98, 183, 37, 122, 14, 124, 65, 67]
     
-    # Run all algorithms
-    algorithms = ['FCFS', 'SSTF', 'SCAN', 'C-SCAN', 'LOOK', 'C-LOOK']
-    
     print("Disk Scheduling Algorithms Comparison")
     print("=" * 50)
     print(f"Initial Head: {scheduler.initial_head}")
     print(f"Requests: {requests}")
     print("-" * 50)
     
-    for algo in algorithms:
-        sequence, total_movement = scheduler.run_algorithm(algo, requests, direction='Right')
-        print(f"{algo:8}: Total Movement = {total_movement:3} | Sequence: {sequence}")
+    # Run all algorithms, sorting the requests only once
+    for result in compare(requests, scheduler.initial_head, direction='Right',
+                          disk_size=scheduler.disk_size):
+        print(f"{result.algorithm:8}: Total Movement = {result.total_movement:3} | "
+              f"Sequence: {result.sequence}")
     
     print("=" * 50)
 
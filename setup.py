@@ -39,9 +39,13 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "numpy": ["numpy>=1.20"],
+    },
     entry_points={
         "console_scripts": [
             "disk-scheduler=disk_scheduling_simulator.gui:run_simulator",  # Removed 'src.' prefix
+            "disk-scheduler-cli=disk_scheduling_simulator.cli:main",
         ],
     },
     include_package_data=True,
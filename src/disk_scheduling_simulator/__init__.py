@@ -9,5 +9,13 @@ GitHub: https://github.com/attilaasghari
 __version__ = "1.0.0"
 __author__ = "Attila Asghari"
 
-from .gui import run_simulator
-from .algorithms import DiskScheduler
\ No newline at end of file
+from .algorithms import DiskScheduler
+from .batch import compare, rank_by_throughput, run_batch
+from .disk_model import DiskModel
+
+def __getattr__(name):
+    # The GUI pulls in tkinter and matplotlib, so load it only when asked for
+    if name == "run_simulator":
+        from .gui import run_simulator
+        return run_simulator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,27 +2,91 @@
 Implementation of disk scheduling algorithms.
 """
 
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import islice
+
+from .disk_model import DiskModel, ServiceSummary
+from .registry import algorithm_names, get_algorithm, register
+from .sequence import HeadSequence
+from .utils import _is_ndarray, _load_numpy
+
+# NumPy is optional; it is imported when the first "numpy" backend is created
+np = None
+
+BACKENDS = ("python", "numpy")
+
+# Elements converted per step when streaming from a NumPy array
+STREAM_CHUNK_SIZE = 65536
+
+# (circular, to_edge) for each algorithm handled by the sweep engine
+SWEEP_CONFIGS = {
+    "SCAN": (False, True),
+    "C-SCAN": (True, True),
+    "LOOK": (False, False),
+    "C-LOOK": (True, False),
+}
+
+# Policies run on the online engine with every request arriving at time 0
+ONLINE_POLICIES = ("N-Step-SCAN", "FSCAN", "Deadline", "SATF")
+
+# Markers for the C-SCAN jump, whose seek covers the return sweep
+_RETURN_TO_START = object()
+_RETURN_TO_END = object()
+
+MovementSummary = namedtuple(
+    "MovementSummary", ["total_movement", "num_requests", "num_moves", "average_seek"])
+
+
 class DiskScheduler:
     """Class implementing various disk scheduling algorithms."""
     
-    def __init__(self, disk_size=200, initial_head=0):
+    def __init__(self, disk_size=200, initial_head=0, backend="python", model=None, step_size=16,
+                 cache=None, profiler=None, compact=False):
         """
         Initialize the disk scheduler.
         
         Args:
             disk_size (int): Total number of cylinders (default: 200)
             initial_head (int): Initial position of disk head (default: 0)
+            backend (str): "python" for lists (default) or "numpy" to take
+                and return NumPy arrays
+            model (DiskModel): Physical disk model used by service_time()
+                and for timing Deadline and SATF (default: DiskModel())
+            step_size (int): Batch size for N-Step-SCAN (default: 16)
+            cache (ResultCache): Reuse the results of identical
+                run_algorithm() calls (default: None)
+            profiler (Profiler): Record the phases of run_algorithm()
+                calls (default: None)
+            compact (bool): Return run_algorithm() sequences as packed
+                HeadSequence objects instead of lists or arrays (default: False)
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if backend == "numpy":
+            _require_numpy()
+        
         self.disk_size = disk_size
         self.initial_head = initial_head
-        self.algorithms = {
-            "FCFS": self._fcfs,
-            "SSTF": self._sstf,
-            "SCAN": self._scan,
-            "C-SCAN": self._c_scan,
-            "LOOK": self._look,
-            "C-LOOK": self._c_look
-        }
+        self.backend = backend
+        self.model = model if model is not None else DiskModel()
+        self.step_size = step_size
+        self.cache = cache
+        self.profiler = profiler
+        self.compact = compact
+        # Bound implementations of every registered algorithm, in registry order
+        self.algorithms = {name: self._bind(get_algorithm(name)) for name in algorithm_names()}
+    
+    def _bind(self, info):
+        """Wrap a registered algorithm as a method for this scheduler's backend."""
+        if self.backend == "numpy" and info.numpy_function is not None:
+            return info.numpy_function.__get__(self)
+        if self.backend == "numpy":
+            def run_on_list(requests, direction):
+                sequence, total_movement = info.function(self, requests.tolist(), direction)
+                return np.asarray(sequence, dtype=np.int64), total_movement
+            return run_on_list
+        return info.function.__get__(self)
     
     def run_algorithm(self, algorithm_name, requests, direction="Right"):
         """
@@ -30,220 +94,1048 @@ class DiskScheduler:
         
         Args:
             algorithm_name (str): Name of the algorithm to run
-            requests (list): List of disk requests (cylinder numbers)
+            requests (list): List of disk requests (cylinder numbers); any
+                sequence or array is accepted by the numpy backend
             direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
             
         Returns:
-            tuple: (sequence of head movements, total head movement)
+            tuple: (sequence of head movements, total head movement); the
+                sequence is an ndarray with the numpy backend and a
+                HeadSequence with compact set
+        """
+        if algorithm_name not in self.algorithms:
+            raise ValueError(f"Algorithm {algorithm_name} not implemented")
+        
+        if self.profiler is not None:
+            sequence, total_movement = self._run_profiled(algorithm_name, requests, direction)
+        else:
+            sequence, total_movement = self._run(algorithm_name, requests, direction)
+        if self.compact:
+            sequence = HeadSequence(sequence)
+        return sequence, total_movement
+    
+    def _run(self, algorithm_name, requests, direction):
+        """Convert the requests and run the algorithm, through the cache if there is one."""
+        if self.backend == "numpy":
+            requests = np.asarray(requests)
+        else:
+            requests = list(_python_ints(requests))
+        if self.cache is None:
+            return self.algorithms[algorithm_name](requests, direction)
+        
+        key = self.cache_key(algorithm_name, requests, direction)
+        cached = self.cache.get(key, self._cache_backend())
+        if cached is not None:
+            return cached.sequence, cached.total_movement
+        sequence, total_movement = self.algorithms[algorithm_name](requests, direction)
+        self.cache.put(key, sequence, total_movement)
+        return sequence, total_movement
+    
+    def _run_profiled(self, algorithm_name, requests, direction):
+        """run_algorithm() with each of its steps recorded as a profiler phase."""
+        profiler = self.profiler
+        with profiler.phase(algorithm_name, backend=self.backend, direction=direction) as run:
+            with profiler.phase("convert"):
+                if self.backend == "numpy":
+                    requests = np.asarray(requests)
+                else:
+                    requests = list(_python_ints(requests))
+            run.count("requests", len(requests))
+            if self.cache is None:
+                return self.algorithms[algorithm_name](requests, direction)
+            
+            with profiler.phase("cache") as lookup:
+                key = self.cache_key(algorithm_name, requests, direction)
+                cached = self.cache.get(key, self._cache_backend())
+                lookup.count("hits", int(cached is not None))
+            if cached is not None:
+                return cached.sequence, cached.total_movement
+            sequence, total_movement = self.algorithms[algorithm_name](requests, direction)
+            with profiler.phase("cache"):
+                self.cache.put(key, sequence, total_movement)
+            return sequence, total_movement
+    
+    def _cache_backend(self):
+        """Form to take cached sequences in, avoiding a conversion to a list when compact."""
+        return "compact" if self.compact else self.backend
+    
+    def cache_key(self, algorithm_name, requests, direction="Right"):
+        """
+        Build the ResultCache key of a run on this scheduler.
+        
+        The key covers the requests and every setting the result depends
+        on; the direction is left out for algorithms that ignore it.
+        
+        Args:
+            algorithm_name (str): Name of the algorithm
+            requests (sequence): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        
+        Returns:
+            tuple: Key for ResultCache.get() and put()
+        """
+        from .cache import cache_key, fingerprint
+        options = ()
+        if algorithm_name not in SWEEP_CONFIGS and algorithm_name not in ("FCFS", "SSTF"):
+            # Online policies (and possibly plug-ins) also use the model and step size
+            options = (self.step_size, tuple(sorted(vars(self.model).items())))
+        if not get_algorithm(algorithm_name).directional:
+            direction = None
+        return cache_key(fingerprint(requests), algorithm_name, self.disk_size,
+                         self.initial_head, direction, options)
+    
+    def iter_moves(self, algorithm_name, requests, direction="Right"):
+        """
+        Lazily yield the head moves of a run, one step at a time.
+        
+        Step 0 is the initial head position, so the cylinders line up with
+        the sequence returned by run_algorithm() and the seek distances add
+        up to its total movement (the C-SCAN jump reports the return sweep).
+        Streaming algorithms (see the registry) produce moves as they go:
+        FCFS consumes the requests as it goes, SSTF yields each pick as soon
+        as it is made, and the sweep algorithms stream from the sorted legs.
+        Other algorithms are run to completion first.
+        
+        Args:
+            algorithm_name (str): Name of the algorithm to run
+            requests (iterable): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        
+        Returns:
+            generator: Yields (step, cylinder, seek_distance) tuples
         """
         if algorithm_name not in self.algorithms:
             raise ValueError(f"Algorithm {algorithm_name} not implemented")
         
-        return self.algorithms[algorithm_name](requests.copy(), direction)
+        if self.backend == "python":
+            requests = _python_ints(requests)
+        moves = get_algorithm(algorithm_name).moves_function
+        if moves is not None:
+            cylinders = _python_ints(moves(self, requests, direction))
+        else:
+            cylinders = self._iter_sequence(algorithm_name, requests, direction)
+        
+        return self._iter_steps(cylinders)
+    
+    def _iter_sequence(self, algorithm_name, requests, direction):
+        """Run an algorithm without streaming support and yield its cylinders."""
+        if self.backend == "numpy":
+            requests = np.asarray(requests)
+        else:
+            requests = list(requests)
+        sequence, _ = self.algorithms[algorithm_name](requests, direction)
+        yield from _python_ints(sequence[1:])
+    
+    def _iter_steps(self, cylinders):
+        """Number the cylinders and attach the seek distance of each step."""
+        current = self.initial_head
+        last_cylinder = self.disk_size - 1
+        yield 0, current, 0
+        for step, cylinder in enumerate(cylinders, 1):
+            if cylinder is _RETURN_TO_START:
+                # C-SCAN Right: travel to the end, then return to cylinder 0
+                yield step, 0, (last_cylinder - current) + last_cylinder
+                current = 0
+            elif cylinder is _RETURN_TO_END:
+                # C-SCAN Left: travel to cylinder 0, then return to the end
+                yield step, last_cylinder, current + last_cylinder
+                current = last_cylinder
+            else:
+                yield step, cylinder, abs(cylinder - current)
+                current = cylinder
     
+    def iter_service(self, algorithm_name, requests, direction="Right"):
+        """
+        Lazily yield the requests of a run in the order they are served.
+        
+        Unlike iter_moves(), only moves that serve a request are yielded:
+        head travel that services nothing (SCAN reaching the disk edge, the
+        C-SCAN return sweep, the C-LOOK jump, the sweep turns of N-Step-SCAN
+        and FSCAN) is added to the seek distance of the next request, as in
+        service_time(). Streaming algorithms stream like iter_moves(); other
+        algorithms are run to completion first.
+        
+        Args:
+            algorithm_name (str): Name of the algorithm to run
+            requests (iterable): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        
+        Returns:
+            generator: Yields (position, cylinder, seek_distance) tuples,
+                with positions counting from 1; its return value is the head
+                travel after the last request, such as SCAN running on to
+                the disk edge, so the seeks plus it add up to the total
+                movement
+        
+        Raises:
+            ValueError: If a plug-in algorithm visits cylinders other than
+                the requests, so its moves cannot be matched to requests
+        """
+        if algorithm_name not in self.algorithms:
+            raise ValueError(f"Algorithm {algorithm_name} not implemented")
+        
+        if self.backend == "python":
+            requests = _python_ints(requests)
+        if algorithm_name in SWEEP_CONFIGS:
+            values, first_leg, turn, second_leg = self._sweep_plan(
+                algorithm_name, requests, direction)
+            moves = self._iter_steps(self._iter_sweep_legs(
+                algorithm_name, values, first_leg, turn, second_leg, direction))
+            turn_step = first_leg[1] - first_leg[0] + 1 if turn is not None else None
+            return _skip_turns(moves, turn_step)
+        if algorithm_name in ONLINE_POLICIES:
+            return self._iter_online_service(algorithm_name, requests, direction)
+        if get_algorithm(algorithm_name).streaming:
+            # Moves of other algorithms than the sweeps each serve a request
+            return _skip_turns(self.iter_moves(algorithm_name, requests, direction), None)
+        
+        requests = np.asarray(requests) if self.backend == "numpy" else list(requests)
+        sequence, _ = self.algorithms[algorithm_name](requests, direction)
+        if len(sequence) != len(requests) + 1:
+            raise ValueError(f"{algorithm_name} visits cylinders other than the requests, "
+                             "so its moves cannot be matched to requests")
+        return _skip_turns(self._iter_steps(_python_ints(sequence[1:])), None)
+    
+    def _iter_online_service(self, algorithm_name, requests, direction):
+        """Yield the requests of an online policy in completion order."""
+        requests = requests.tolist() if _is_ndarray(requests) else list(requests)
+        result = self._run_online(algorithm_name, requests, direction)
+        # Every request arrives at time 0 and takes time, so completions are distinct
+        order = sorted(range(result.num_requests), key=result.response_times.__getitem__)
+        seeks = result.seek_distances
+        for position, request_id in enumerate(order, 1):
+            yield position, requests[request_id], seeks[request_id]
+    
+    def _sweep_plan(self, algorithm_name, requests, direction):
+        """
+        Sort the requests and lay out the legs of a sweep.
+        
+        Returns:
+            tuple: (sorted requests, first leg, turn-around cylinder or None,
+                second leg)
+        """
+        circular, to_edge = SWEEP_CONFIGS[algorithm_name]
+        if self.backend == "numpy":
+            values = np.sort(np.asarray(requests).astype(np.int64, copy=False))
+            side = "left" if direction == "Right" else "right"
+            split = int(np.searchsorted(values, self.initial_head, side=side))
+        else:
+            values = sorted(requests)
+            if direction == "Right":
+                split = bisect_left(values, self.initial_head)
+            else:
+                split = bisect_right(values, self.initial_head)
+        
+        first_leg, turn, second_leg, _ = _plan_sweep(
+            values, split, self.initial_head, self.disk_size - 1,
+            direction, circular, to_edge)
+        return values, first_leg, turn, second_leg
+    
+    def _iter_sweep(self, algorithm_name, requests, direction):
+        """Yield the cylinders of a sweep straight from its sorted legs."""
+        values, first_leg, turn, second_leg = self._sweep_plan(algorithm_name, requests, direction)
+        return self._iter_sweep_legs(algorithm_name, values, first_leg, turn, second_leg, direction)
+    
+    def _iter_sweep_legs(self, algorithm_name, values, first_leg, turn, second_leg, direction):
+        """Yield the cylinders of a planned sweep, with its turn in between the legs."""
+        circular, to_edge = SWEEP_CONFIGS[algorithm_name]
+        yield from _iter_leg(values, first_leg)
+        if turn is not None:
+            if circular and to_edge:
+                yield _RETURN_TO_START if direction == "Right" else _RETURN_TO_END
+            else:
+                yield int(turn)
+        yield from _iter_leg(values, second_leg)
+    
+    def total_movement(self, algorithm_name, requests, direction="Right"):
+        """
+        Compute only the total head movement, without building the sequence.
+        
+        See summarize() for the memory characteristics.
+        
+        Returns:
+            int: Total head movement
+        """
+        return self.summarize(algorithm_name, requests, direction).total_movement
+    
+    def summarize(self, algorithm_name, requests, direction="Right"):
+        """
+        Compute the total head movement and summary statistics of a run.
+        
+        No head sequence is built for totals_only algorithms (see the
+        registry). With the python backend, FCFS and the sweep algorithms
+        make a single pass over any iterable with O(1) extra memory; the
+        numpy backend uses vectorized reductions instead. Sweep totals are
+        computed in closed form from the lowest and highest request on each
+        side of the head. SSTF still needs its O(n) request index. Other
+        algorithms are run and their sequence counted.
+        
+        Args:
+            algorithm_name (str): Name of the algorithm to run
+            requests (iterable): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        
+        Returns:
+            MovementSummary: (total_movement, num_requests, num_moves, average_seek),
+                where num_moves also counts edge visits and jumps
+        """
+        if algorithm_name not in self.algorithms:
+            raise ValueError(f"Algorithm {algorithm_name} not implemented")
+        
+        if self.backend == "numpy":
+            requests = np.asarray(requests).astype(np.int64, copy=False)
+        else:
+            requests = _python_ints(requests)
+        
+        totals = get_algorithm(algorithm_name).totals_function
+        if totals is not None:
+            total_movement, num_requests, num_moves = totals(self, requests, direction)
+        else:
+            # No totals-only path: run the algorithm and count its sequence
+            if self.backend == "python":
+                requests = list(requests)
+            sequence, total_movement = self.algorithms[algorithm_name](requests, direction)
+            num_requests = len(requests)
+            num_moves = len(sequence) - 1
+        
+        total_movement = int(total_movement)
+        average_seek = total_movement / num_requests if num_requests else 0.0
+        return MovementSummary(total_movement, num_requests, num_moves, average_seek)
+    
+    def service_time(self, algorithm_name, requests, direction="Right", sizes=None):
+        """
+        Estimate the service time of a run with the scheduler's disk model.
+        
+        Each request costs a seek, half a revolution and its transfer time.
+        Head travel that services no request (SCAN reaching the disk edge,
+        the C-SCAN return sweep, the C-LOOK jump) is timed as separate seeks
+        and charged to the request that follows it. Needs NumPy, with
+        either backend.
+        
+        Args:
+            algorithm_name (str): Name of the algorithm to run
+            requests (iterable): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+            sizes (sequence): Bytes of each request, in the same order as
+                requests (default: the model's request_size; not supported
+                by the policies in ONLINE_POLICIES)
+        
+        Returns:
+            ServiceSummary: (total_time, num_requests, iops, mean_latency,
+                max_latency, latencies), with latencies in service order
+        """
+        if algorithm_name not in self.algorithms:
+            raise ValueError(f"Algorithm {algorithm_name} not implemented")
+        _require_numpy()
+        requests = np.asarray(requests if _is_ndarray(requests) else list(requests))
+        requests = requests.astype(np.int64, copy=False)
+        
+        if algorithm_name in ONLINE_POLICIES:
+            if sizes is not None:
+                raise ValueError(f"{algorithm_name} does not support per-request sizes")
+            return self._online_service(algorithm_name, requests, direction)
+        
+        overhead = None
+        if algorithm_name in SWEEP_CONFIGS:
+            served, seeks, extra_seeks, turn_step = self._sweep_service(
+                algorithm_name, requests, direction)
+            overhead = np.zeros(len(served) + 1)
+            overhead[turn_step] = sum(self.model.seek_time(distance) for distance in extra_seeks)
+        else:
+            served = self._served_order(algorithm_name, requests, direction)
+            seeks = np.abs(np.diff(served, prepend=self.initial_head))
+        
+        if sizes is not None:
+            sizes = np.asarray(sizes, dtype=np.float64)
+            if len(sizes) != len(requests):
+                raise ValueError("sizes must have one entry per request")
+            sizes = sizes[_service_order(requests, served)]
+        return self.model.evaluate(seeks, sizes, overhead)
+    
+    def _online_service(self, algorithm_name, requests, direction):
+        """Service summary of an online policy, timed by the online engine itself."""
+        result = self._run_online(algorithm_name, requests, direction)
+        completions = np.sort(np.frombuffer(result.response_times, dtype=np.float64))
+        latencies = np.diff(completions, prepend=0.0)
+        num_requests = result.num_requests
+        return ServiceSummary(
+            total_time=result.makespan,
+            num_requests=num_requests,
+            iops=num_requests / (result.makespan / 1000.0) if result.makespan else 0.0,
+            mean_latency=float(latencies.mean()) if num_requests else 0.0,
+            max_latency=float(latencies.max()) if num_requests else 0.0,
+            latencies=latencies,
+        )
+    
+    def _served_order(self, algorithm_name, requests, direction):
+        """Cylinders in the order an algorithm serves them, from its moves if it streams."""
+        backend_requests = requests if self.backend == "numpy" else requests.tolist()
+        moves = get_algorithm(algorithm_name).moves_function
+        if moves is not None:
+            served = moves(self, backend_requests, direction)
+            if not _is_ndarray(served):
+                served = np.fromiter(served, dtype=np.int64)
+        else:
+            sequence, _ = self.algorithms[algorithm_name](backend_requests, direction)
+            served = np.asarray(sequence, dtype=np.int64)[1:]
+        if len(served) != len(requests):
+            raise ValueError(f"{algorithm_name} visits cylinders other than the requests, "
+                             "so its service time cannot be estimated")
+        return served
+    
+    def _sweep_service(self, algorithm_name, requests, direction):
+        """
+        Lay out a sweep for service_time().
+        
+        Returns:
+            tuple: (requests in service order, seek distance of each request,
+                distances of the head moves that service nothing, index of
+                the first request after those moves)
+        """
+        circular, to_edge = SWEEP_CONFIGS[algorithm_name]
+        values = np.sort(requests)
+        side = "left" if direction == "Right" else "right"
+        split = int(np.searchsorted(values, self.initial_head, side=side))
+        last_cylinder = self.disk_size - 1
+        
+        first_leg, turn, second_leg, _ = _plan_sweep(
+            values, split, self.initial_head, last_cylinder, direction, circular, to_edge)
+        first = _leg_view(values, first_leg)
+        second = _leg_view(values, second_leg)
+        first_seeks = np.abs(np.diff(first, prepend=self.initial_head))
+        current = int(first[-1]) if len(first) else self.initial_head
+        
+        extra_seeks = []
+        if turn is not None:
+            if circular and to_edge:
+                # Run to the far edge, then return across the whole disk
+                edge = last_cylinder if direction == "Right" else 0
+                extra_seeks = [abs(edge - current), last_cylinder]
+            else:
+                extra_seeks = [abs(int(turn) - current)]
+            current = int(turn)
+        second_seeks = np.abs(np.diff(second, prepend=current))
+        
+        served = np.concatenate((first, second))
+        seeks = np.concatenate((first_seeks, second_seeks))
+        return served, seeks, extra_seeks, len(first)
+    
+    def _sweep_endpoints(self, requests, direction, circular):
+        """
+        Find the (first, last) request of each sweep leg in one pass.
+        
+        Returns:
+            tuple: (first leg ends or None, second leg ends or None, request count)
+        """
+        head = self.initial_head
+        if self.backend == "numpy":
+            upper = requests >= head if direction == "Right" else requests > head
+            upper_count = int(np.count_nonzero(upper))
+            lower_count = len(requests) - upper_count
+            info = np.iinfo(np.int64)
+            upper_ends = lower_ends = None
+            if upper_count:
+                upper_ends = (int(np.min(requests, where=upper, initial=info.max)),
+                              int(np.max(requests, where=upper, initial=info.min)))
+            if lower_count:
+                lower = ~upper
+                lower_ends = (int(np.min(requests, where=lower, initial=info.max)),
+                              int(np.max(requests, where=lower, initial=info.min)))
+            num_requests = len(requests)
+        else:
+            upper_min = upper_max = lower_min = lower_max = None
+            num_requests = 0
+            for req in requests:
+                num_requests += 1
+                if req > head or (req == head and direction == "Right"):
+                    if upper_min is None or req < upper_min:
+                        upper_min = req
+                    if upper_max is None or req > upper_max:
+                        upper_max = req
+                else:
+                    if lower_min is None or req < lower_min:
+                        lower_min = req
+                    if lower_max is None or req > lower_max:
+                        lower_max = req
+            upper_ends = None if upper_min is None else (upper_min, upper_max)
+            lower_ends = None if lower_min is None else (lower_min, lower_max)
+        
+        return _orient_legs(upper_ends, lower_ends, direction, circular) + (num_requests,)
+    
+    @register("FCFS",
+              description="First-Come, First-Served: Processes requests in the order they arrive.")
     def _fcfs(self, requests, direction=None):
         """First-Come, First-Served algorithm."""
+        steps = self.profiler and self.profiler.steps()
         sequence = [self.initial_head] + requests
+        if steps:
+            steps.mark("sequence")
         total_movement = sum(abs(sequence[i] - sequence[i-1]) for i in range(1, len(sequence)))
+        if steps:
+            steps.mark("movement")
         return sequence, total_movement
     
+    @register("SSTF",
+              description="Shortest Seek Time First: Always chooses the request closest to the current head position.")
     def _sstf(self, requests, direction=None):
-        """Shortest Seek Time First algorithm."""
-        current = self.initial_head
-        sequence = [current]
-        total_movement = 0
+        """
+        Shortest Seek Time First algorithm.
         
-        while requests:
-            closest = min(requests, key=lambda x: abs(x - current))
-            total_movement += abs(closest - current)
-            current = closest
-            sequence.append(current)
-            requests.remove(current)
+        Pending cylinders are kept as a sorted array of distinct values linked
+        to their live neighbours, so every step only compares the closest
+        pending request on each side of the head. Runs in O(n log n).
         
-        return sequence, total_movement
+        Ties between two requests at the same distance go to the one that
+        appears first in the original request list, matching a linear
+        min() scan over the pending list.
+        """
+        steps = self.profiler and self.profiler.steps()
+        if steps and steps.count_comparisons:
+            from .profiling import counted_sort
+            index = _sstf_index(requests, sort=False)
+            steps.mark("index", distinct=len(index[0]), comparisons=counted_sort(index[0]))
+        else:
+            index = _sstf_index(requests)
+            if steps:
+                steps.mark("index", distinct=len(index[0]))
+        result = _sstf_walk(index, self.initial_head)
+        if steps:
+            steps.mark("walk")
+        return result
     
+    @register("SCAN", directional=True,
+              description="Elevator Algorithm: Moves head in one direction servicing requests until the end, then reverses.")
     def _scan(self, requests, direction):
         """SCAN (Elevator) algorithm."""
-        requests = sorted(requests)
-        current = self.initial_head
-        sequence = [current]
-        total_movement = 0
-        
-        if direction == "Right":
-            right_requests = [r for r in requests if r >= current]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if current < self.disk_size - 1:
-                total_movement += (self.disk_size - 1) - current
-                current = self.disk_size - 1
-                sequence.append(current)
-            
-            left_requests = [r for r in requests if r < self.initial_head]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        else:  # Left
-            left_requests = [r for r in requests if r <= current]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if current > 0:
-                total_movement += current
-                current = 0
-                sequence.append(current)
-            
-            right_requests = [r for r in requests if r > self.initial_head]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        
-        return sequence, total_movement
+        return self._sweep(requests, direction, circular=False, to_edge=True)
     
+    @register("C-SCAN", directional=True,
+              description="Circular SCAN: Moves head in one direction servicing requests, then jumps to the beginning and continues.")
     def _c_scan(self, requests, direction):
         """C-SCAN (Circular SCAN) algorithm."""
-        requests = sorted(requests)
-        current = self.initial_head
-        sequence = [current]
-        total_movement = 0
-        
-        if direction == "Right":
-            right_requests = [r for r in requests if r >= current]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if right_requests or [r for r in requests if r < self.initial_head]:
-                total_movement += (self.disk_size - 1) - current + (self.disk_size - 1)
-                current = 0
-                sequence.append(current)
-            
-            left_requests = [r for r in requests if r < self.initial_head]
-            left_requests.sort()
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        else:  # Left
-            left_requests = [r for r in requests if r <= current]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if left_requests or [r for r in requests if r > self.initial_head]:
-                total_movement += current + (self.disk_size - 1)
-                current = self.disk_size - 1
-                sequence.append(current)
-            
-            right_requests = [r for r in requests if r > self.initial_head]
-            right_requests.sort(reverse=True)
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        
-        return sequence, total_movement
+        return self._sweep(requests, direction, circular=True, to_edge=True)
     
+    @register("LOOK", directional=True,
+              description="Similar to SCAN but doesn't go all the way to the end; reverses when no more requests in current direction.")
     def _look(self, requests, direction):
         """LOOK algorithm."""
-        requests = sorted(requests)
-        current = self.initial_head
-        sequence = [current]
+        return self._sweep(requests, direction, circular=False, to_edge=False)
+    
+    @register("C-LOOK", directional=True,
+              description="Circular LOOK: Similar to C-SCAN but doesn't go all the way to the end; jumps to the first request in the other direction.")
+    def _c_look(self, requests, direction):
+        """C-LOOK algorithm."""
+        return self._sweep(requests, direction, circular=True, to_edge=False)
+    
+    @register("FCFS", kind="moves")
+    def _fcfs_moves(self, requests, direction=None):
+        """FCFS serves the requests as they come."""
+        return requests
+    
+    @register("SSTF", kind="moves")
+    def _sstf_moves(self, requests, direction=None):
+        """Yield each SSTF pick as soon as it is made."""
+        if _is_ndarray(requests):
+            requests = requests.tolist()
+        return _sstf_order(_sstf_index(requests), self.initial_head)
+    
+    @register("SCAN", kind="moves")
+    def _scan_moves(self, requests, direction):
+        """SCAN (Elevator) moves, streamed from the sorted legs."""
+        return self._iter_sweep("SCAN", requests, direction)
+    
+    @register("C-SCAN", kind="moves")
+    def _c_scan_moves(self, requests, direction):
+        """C-SCAN (Circular SCAN) moves, streamed from the sorted legs."""
+        return self._iter_sweep("C-SCAN", requests, direction)
+    
+    @register("LOOK", kind="moves")
+    def _look_moves(self, requests, direction):
+        """LOOK moves, streamed from the sorted legs."""
+        return self._iter_sweep("LOOK", requests, direction)
+    
+    @register("C-LOOK", kind="moves")
+    def _c_look_moves(self, requests, direction):
+        """C-LOOK moves, streamed from the sorted legs."""
+        return self._iter_sweep("C-LOOK", requests, direction)
+    
+    @register("FCFS", kind="totals")
+    def _fcfs_totals(self, requests, direction=None):
+        """Return (total movement, request count, head moves) for FCFS in one pass."""
+        if self.backend == "numpy":
+            if len(requests) == 0:
+                return 0, 0, 0
+            total_movement = abs(int(requests[0]) - self.initial_head) + np.abs(np.diff(requests)).sum()
+            return total_movement, len(requests), len(requests)
+        
         total_movement = 0
+        num_requests = 0
+        current = self.initial_head
+        for req in requests:
+            total_movement += abs(req - current)
+            current = req
+            num_requests += 1
+        return total_movement, num_requests, num_requests
+    
+    @register("SSTF", kind="totals")
+    def _sstf_totals(self, requests, direction=None):
+        """Walk the SSTF index without recording the sequence."""
+        if _is_ndarray(requests):
+            requests = requests.tolist()
+        index = _sstf_index(requests)
+        total_movement = _sstf_walk(index, self.initial_head, record_sequence=False)[1]
+        return total_movement, index[2], index[2]
+    
+    @register("SCAN", kind="totals")
+    def _scan_totals(self, requests, direction):
+        """SCAN (Elevator) totals, without building the sequence."""
+        return self._sweep_totals("SCAN", requests, direction)
+    
+    @register("C-SCAN", kind="totals")
+    def _c_scan_totals(self, requests, direction):
+        """C-SCAN (Circular SCAN) totals, without building the sequence."""
+        return self._sweep_totals("C-SCAN", requests, direction)
+    
+    @register("LOOK", kind="totals")
+    def _look_totals(self, requests, direction):
+        """LOOK totals, without building the sequence."""
+        return self._sweep_totals("LOOK", requests, direction)
+    
+    @register("C-LOOK", kind="totals")
+    def _c_look_totals(self, requests, direction):
+        """C-LOOK totals, without building the sequence."""
+        return self._sweep_totals("C-LOOK", requests, direction)
+    
+    def _sweep_totals(self, algorithm_name, requests, direction):
+        """Sweep totals in closed form from the endpoints of its legs."""
+        circular, to_edge = SWEEP_CONFIGS[algorithm_name]
+        first_ends, second_ends, num_requests = self._sweep_endpoints(
+            requests, direction, circular)
+        turn, total_movement = _sweep_movement(
+            first_ends, second_ends, self.initial_head, self.disk_size - 1,
+            direction, circular, to_edge)
+        return total_movement, num_requests, num_requests + (turn is not None)
+    
+    @register("N-Step-SCAN", directional=True,
+              description="N-Step-SCAN: Serves the queue in frozen batches of N requests, each with a SCAN sweep.")
+    def _n_step_scan(self, requests, direction):
+        """N-Step-SCAN: SCAN over frozen batches of step_size requests in list order."""
+        return self._online_result("N-Step-SCAN", requests, direction)
+    
+    @register("FSCAN", directional=True,
+              description="Freezes the queue and serves it with SCAN; requests arriving meanwhile wait for the next sweep.")
+    def _fscan(self, requests, direction):
+        """FSCAN; with every request queued up front, one frozen batch served with SCAN."""
+        return self._online_result("FSCAN", requests, direction)
+    
+    @register("Deadline",
+              description="One-way elevator that serves a request first once its read or write deadline has expired.")
+    def _deadline(self, requests, direction=None):
+        """Deadline: a one-way elevator that serves expired reads (timed by the model) first."""
+        return self._online_result("Deadline", requests, direction)
+    
+    @register("SATF",
+              description="Shortest Access Time First: Chooses the request reachable soonest, counting seek and rotation.")
+    def _satf(self, requests, direction=None):
+        """Shortest Access Time First; without rotational positions it orders by seek time."""
+        return self._online_result("SATF", requests, direction)
+    
+    def _online_result(self, algorithm_name, requests, direction):
+        """Run an online policy and return (sequence, total movement)."""
+        result = self._run_online(algorithm_name, requests, direction)
+        return result.sequence, result.total_movement
+    
+    def _run_online(self, algorithm_name, requests, direction):
+        """Run a policy from ONLINE_POLICIES with every request arriving at time 0."""
+        from .online import OnlineScheduler
+        steps = self.profiler and self.profiler.steps()
+        if _is_ndarray(requests):
+            requests = requests.tolist()
+        scheduler = OnlineScheduler(
+            self.disk_size, self.initial_head, algorithm_name, direction or "Right",
+            step_size=self.step_size, model=self.model)
+        if steps:
+            steps.mark("prepare")
+        result = scheduler.run(((0.0, req) for req in requests), record_sequence=True)
+        if steps:
+            steps.mark("simulate")
+        return result
+    
+    def _sweep(self, requests, direction, circular, to_edge):
+        """
+        Shared engine for the SCAN, C-SCAN, LOOK and C-LOOK algorithms.
+        
+        The requests are sorted once and split at the head with a single
+        bisect. The head then services one side of the split (the first leg),
+        optionally travels to the disk edge or jumps across, and services the
+        other side (the second leg). Each leg is monotonic, so its movement is
+        computed from its endpoints instead of step by step.
+        
+        Args:
+            requests (list): List of disk requests (sorted in place)
+            direction (str): "Right" or "Left"
+            circular (bool): Jump across and keep sweeping in the same
+                direction instead of reversing (C-SCAN, C-LOOK)
+            to_edge (bool): Travel to the end of the disk before turning
+                (SCAN, C-SCAN)
         
+        Returns:
+            tuple: (sequence of head movements, total head movement)
+        """
+        steps = self.profiler and self.profiler.steps()
+        if steps and steps.count_comparisons:
+            from .profiling import counted_sort
+            steps.mark("sort", comparisons=counted_sort(requests))
+        else:
+            requests.sort()
+            if steps:
+                steps.mark("sort")
         if direction == "Right":
-            right_requests = [r for r in requests if r >= current]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            left_requests = [r for r in requests if r < self.initial_head]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        else:  # Left
-            left_requests = [r for r in requests if r <= current]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            right_requests = [r for r in requests if r > self.initial_head]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
+            split = bisect_left(requests, self.initial_head)
+        else:
+            split = bisect_right(requests, self.initial_head)
+        if steps:
+            steps.mark("partition")
+        
+        first_leg, turn, second_leg, total_movement = _plan_sweep(
+            requests, split, self.initial_head, self.disk_size - 1,
+            direction, circular, to_edge)
+        if steps:
+            steps.mark("plan")
+        
+        sequence = [self.initial_head]
+        sequence.extend(_leg_iter(requests, first_leg))
+        if turn is not None:
+            sequence.append(turn)
+        sequence.extend(_leg_iter(requests, second_leg))
+        if steps:
+            steps.mark("sequence")
         
         return sequence, total_movement
     
-    def _c_look(self, requests, direction):
-        """C-LOOK algorithm."""
-        requests = sorted(requests)
-        current = self.initial_head
-        sequence = [current]
-        total_movement = 0
+    @register("FCFS", backend="numpy")
+    def _fcfs_numpy(self, requests, direction=None):
+        """First-Come, First-Served algorithm (NumPy backend)."""
+        steps = self.profiler and self.profiler.steps()
+        sequence = np.concatenate(([self.initial_head], requests)).astype(np.int64, copy=False)
+        if steps:
+            steps.mark("sequence")
+        total_movement = int(np.abs(np.diff(sequence)).sum())
+        if steps:
+            steps.mark("movement")
+        return sequence, total_movement
+    
+    @register("SCAN", backend="numpy")
+    def _scan_numpy(self, requests, direction):
+        """SCAN (Elevator) algorithm (NumPy backend)."""
+        return self._sweep_numpy(requests, direction, circular=False, to_edge=True)
+    
+    @register("C-SCAN", backend="numpy")
+    def _c_scan_numpy(self, requests, direction):
+        """C-SCAN (Circular SCAN) algorithm (NumPy backend)."""
+        return self._sweep_numpy(requests, direction, circular=True, to_edge=True)
+    
+    @register("LOOK", backend="numpy")
+    def _look_numpy(self, requests, direction):
+        """LOOK algorithm (NumPy backend)."""
+        return self._sweep_numpy(requests, direction, circular=False, to_edge=False)
+    
+    @register("C-LOOK", backend="numpy")
+    def _c_look_numpy(self, requests, direction):
+        """C-LOOK algorithm (NumPy backend)."""
+        return self._sweep_numpy(requests, direction, circular=True, to_edge=False)
+    
+    def _sweep_numpy(self, requests, direction, circular, to_edge):
+        """Sweep engine using np.sort/np.searchsorted and array views for the legs."""
+        steps = self.profiler and self.profiler.steps()
+        values = np.sort(requests.astype(np.int64, copy=False))
+        if steps:
+            steps.mark("sort")
+        side = "left" if direction == "Right" else "right"
+        split = int(np.searchsorted(values, self.initial_head, side=side))
+        if steps:
+            steps.mark("partition")
         
-        if direction == "Right":
-            right_requests = [r for r in requests if r >= current]
-            right_requests.sort()
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if right_requests and [r for r in requests if r < self.initial_head]:
-                left_requests = [r for r in requests if r < self.initial_head]
-                first_left = min(left_requests)
-                total_movement += current - first_left
-                current = first_left
-                sequence.append(current)
-            
-            left_requests = [r for r in requests if r < self.initial_head]
-            left_requests.sort()
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        else:  # Left
-            left_requests = [r for r in requests if r <= current]
-            left_requests.sort(reverse=True)
-            for req in left_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-            
-            if left_requests and [r for r in requests if r > self.initial_head]:
-                right_requests = [r for r in requests if r > self.initial_head]
-                last_right = max(right_requests)
-                total_movement += last_right - current
-                current = last_right
-                sequence.append(current)
-            
-            right_requests = [r for r in requests if r > self.initial_head]
-            right_requests.sort(reverse=True)
-            for req in right_requests:
-                total_movement += abs(req - current)
-                current = req
-                sequence.append(current)
-        
-        return sequence, total_movement
\ No newline at end of file
+        first_leg, turn, second_leg, total_movement = _plan_sweep(
+            values, split, self.initial_head, self.disk_size - 1,
+            direction, circular, to_edge)
+        if steps:
+            steps.mark("plan")
+        
+        parts = [np.array([self.initial_head], dtype=np.int64), _leg_view(values, first_leg)]
+        if turn is not None:
+            parts.append(np.array([turn], dtype=np.int64))
+        parts.append(_leg_view(values, second_leg))
+        sequence = np.concatenate(parts)
+        if steps:
+            steps.mark("sequence")
+        
+        return sequence, int(total_movement)
+
+
+def _require_numpy():
+    """Bind the module-level np, or raise ImportError if NumPy is missing."""
+    global np
+    np = _load_numpy()
+    if np is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+
+
+def _service_order(requests, served):
+    """
+    Map each served cylinder back to an index into the original requests.
+    
+    The k-th visit to a cylinder is matched with the k-th request for it in
+    the original order, which is exact for FCFS and SSTF.
+    """
+    order = np.empty(len(served), dtype=np.intp)
+    order[np.argsort(served, kind="stable")] = np.argsort(requests, kind="stable")
+    return order
+
+
+def _sstf_index(requests, sort=True):
+    """
+    Build the SSTF lookup structure for a request list.
+    
+    Args:
+        requests (iterable): Disk requests
+        sort (bool): Sort the distinct cylinders; without it, the caller
+            sorts them in place, e.g. to count the comparisons
+    
+    Returns:
+        tuple: (sorted distinct cylinders, {cylinder: original indices}, request count)
+    """
+    occurrences = {}
+    num_requests = 0
+    for index, req in enumerate(requests):
+        occurrences.setdefault(req, []).append(index)
+        num_requests += 1
+    distinct = list(occurrences)
+    if sort:
+        distinct.sort()
+    return distinct, occurrences, num_requests
+
+
+def _sstf_walk(index, head, record_sequence=True):
+    """
+    Run SSTF from head over a prebuilt _sstf_index without modifying it.
+    
+    Returns:
+        tuple: (sequence of head movements or None, total head movement)
+    """
+    current = head
+    sequence = [current] if record_sequence else None
+    total_movement = 0
+    
+    for value in _sstf_order(index, head):
+        total_movement += abs(value - current)
+        current = value
+        if record_sequence:
+            sequence.append(current)
+    
+    return sequence, total_movement
+
+
+def _sstf_order(index, head):
+    """Yield the cylinders of a prebuilt _sstf_index in SSTF service order."""
+    values, occurrences, num_requests = index
+    count = len(values)
+    served = [0] * count
+    prev_node = list(range(-1, count - 1))
+    next_node = list(range(1, count + 1))
+    
+    current = head
+    right = bisect_left(values, current)
+    left = right - 1
+    
+    for _ in range(num_requests):
+        if left < 0:
+            chosen = right
+        elif right >= count:
+            chosen = left
+        else:
+            left_distance = current - values[left]
+            right_distance = values[right] - current
+            if left_distance < right_distance:
+                chosen = left
+            elif right_distance < left_distance:
+                chosen = right
+            elif (occurrences[values[left]][served[left]]
+                  < occurrences[values[right]][served[right]]):
+                chosen = left
+            else:
+                chosen = right
+        
+        current = values[chosen]
+        yield current
+        
+        served[chosen] += 1
+        before, after = prev_node[chosen], next_node[chosen]
+        if served[chosen] == len(occurrences[current]):
+            # All requests for this cylinder are done; unlink it
+            if before >= 0:
+                next_node[before] = after
+            if after < count:
+                prev_node[after] = before
+            right = after
+        else:
+            right = chosen
+        left = before
+
+
+def _plan_sweep(values, split, head, last_cylinder, direction, circular, to_edge):
+    """
+    Lay out the legs of a sweep over sorted requests and compute its movement.
+    
+    Legs are (start, stop, descending) index ranges into values, so either
+    backend can materialize them in its own way.
+    
+    Returns:
+        tuple: (first leg, turn-around cylinder or None, second leg, total movement)
+    """
+    if direction == "Right":
+        first_leg = (split, len(values), False)
+        second_leg = (0, split, not circular)
+    else:  # Left
+        first_leg = (0, split, True)
+        second_leg = (split, len(values), circular)
+    
+    turn, total_movement = _sweep_movement(
+        _leg_endpoints(values, first_leg), _leg_endpoints(values, second_leg),
+        head, last_cylinder, direction, circular, to_edge)
+    
+    return first_leg, turn, second_leg, total_movement
+
+
+def _sweep_movement(first_ends, second_ends, head, last_cylinder, direction, circular, to_edge):
+    """
+    Closed-form movement of a sweep given only the endpoints of its legs.
+    
+    Args:
+        first_ends (tuple): (first, last) request of the first leg, or None if empty
+        second_ends (tuple): (first, last) request of the second leg, or None if empty
+    
+    Returns:
+        tuple: (turn-around cylinder or None, total movement)
+    """
+    total_movement = _leg_movement(head, first_ends)
+    current = first_ends[1] if first_ends else head
+    turn = None
+    
+    if circular and to_edge:
+        if first_ends or second_ends:
+            if direction == "Right":
+                total_movement += (last_cylinder - current) + last_cylinder
+                turn = 0
+            else:
+                total_movement += current + last_cylinder
+                turn = last_cylinder
+    elif circular:
+        if first_ends and second_ends:
+            turn = second_ends[0]
+            total_movement += abs(turn - current)
+    elif to_edge:
+        if direction == "Right" and current < last_cylinder:
+            total_movement += last_cylinder - current
+            turn = last_cylinder
+        elif direction != "Right" and current > 0:
+            total_movement += current
+            turn = 0
+    
+    if turn is not None:
+        current = turn
+    total_movement += _leg_movement(current, second_ends)
+    
+    return turn, total_movement
+
+
+def _leg_endpoints(values, leg):
+    """Return the (first, last) request serviced by a leg, or None if it is empty."""
+    start, stop, descending = leg
+    if start >= stop:
+        return None
+    if descending:
+        return values[stop - 1], values[start]
+    return values[start], values[stop - 1]
+
+
+def _reverse_ends(ends):
+    """Swap the (first, last) endpoints of a leg, keeping None for empty legs."""
+    return None if ends is None else (ends[1], ends[0])
+
+
+def _orient_legs(upper_ends, lower_ends, direction, circular):
+    """
+    Order the (min, max) requests above and below the head as sweep legs.
+    
+    Returns:
+        tuple: ((first, last) of the first leg, (first, last) of the second
+            leg), with None for empty legs
+    """
+    # Ascending legs run min -> max, descending legs max -> min
+    if direction == "Right":
+        return upper_ends, lower_ends if circular else _reverse_ends(lower_ends)
+    return _reverse_ends(lower_ends), _reverse_ends(upper_ends) if circular else upper_ends
+
+
+def _leg_iter(values, leg):
+    """Iterate over a leg of the sorted requests without copying it."""
+    start, stop, descending = leg
+    if descending:
+        return islice(reversed(values), len(values) - stop, len(values) - start)
+    return islice(values, start, stop)
+
+
+def _skip_turns(moves, turn_step):
+    """
+    Turn iter_moves() output into (position, cylinder, seek) per request.
+    
+    The move at turn_step services no request; its seek distance is added
+    to the request that follows it, or returned if no request follows.
+    """
+    next(moves)  # the initial head position
+    carried = 0
+    position = 0
+    for step, cylinder, seek in moves:
+        if step == turn_step:
+            carried = seek
+            continue
+        position += 1
+        yield position, cylinder, seek + carried
+        carried = 0
+    return carried
+
+
+def _iter_leg(values, leg):
+    """Iterate over a leg of a sorted list or NumPy array as Python ints."""
+    if _is_ndarray(values):
+        return _iter_array(_leg_view(values, leg))
+    return _leg_iter(values, leg)
+
+
+def _python_ints(requests):
+    """Iterate NumPy arrays as Python ints so list arithmetic cannot overflow."""
+    if _is_ndarray(requests):
+        return _iter_array(requests)
+    return requests
+
+
+def _iter_array(array):
+    """Iterate over a NumPy array as Python ints, converting it in chunks."""
+    for start in range(0, len(array), STREAM_CHUNK_SIZE):
+        yield from array[start:start + STREAM_CHUNK_SIZE].tolist()
+
+
+def _leg_view(values, leg):
+    """Return a leg of a sorted NumPy array as a view."""
+    start, stop, descending = leg
+    view = values[start:stop]
+    return view[::-1] if descending else view
+
+
+def _leg_movement(start_position, ends):
+    """Head movement for servicing a monotonic leg given its endpoints."""
+    if ends is None:
+        return 0
+    first, last = ends
+    return abs(first - start_position) + abs(last - first)
@@ -0,0 +1,220 @@
+"""
+Batch execution of many scheduling scenarios over one request set.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from .algorithms import (
+    SWEEP_CONFIGS, DiskScheduler, _leg_iter, _plan_sweep, _python_ints, _sstf_index, _sstf_walk)
+from .registry import algorithm_names, get_algorithm
+from .sequence import HeadSequence
+
+# Algorithms BatchScheduler runs from the prepared requests; the others run
+# through DiskScheduler
+ALGORITHMS = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+ScenarioResult = namedtuple(
+    "ScenarioResult", ["algorithm", "initial_head", "direction", "total_movement", "sequence"])
+
+
+class BatchScheduler:
+    """
+    Run scenarios that share one request list, preparing it only once.
+
+    The requests are copied and sorted on construction, and the SSTF index is
+    built on first use. Each scenario then only pays for a bisect (sweep
+    algorithms, totals only), a single walk (SSTF) or building its sequence.
+    Other registered algorithms run through DiskScheduler as usual.
+    With a cache, the requests are fingerprinted once and repeated
+    scenarios are answered from it.
+    """
+
+    def __init__(self, requests, disk_size=200, cache=None, compact=False):
+        """
+        Prepare a request set for batch runs.
+
+        Args:
+            requests (list): List of disk requests (cylinder numbers)
+            disk_size (int): Total number of cylinders (default: 200)
+            cache (ResultCache): Reuse results of scenarios run before,
+                here or by a DiskScheduler sharing the cache (default: None)
+            compact (bool): Return sequences as HeadSequence objects, which
+                take a fraction of the memory of lists (default: False)
+        """
+        self.disk_size = disk_size
+        self.cache = cache
+        self.compact = compact
+        self._fingerprint = None
+        self.requests = list(_python_ints(requests))
+        self.sorted_requests = sorted(self.requests)
+        self._fcfs_internal = sum(
+            abs(b - a) for a, b in zip(self.requests, self.requests[1:]))
+        self._sstf_index = None
+
+    def run(self, algorithm_name, initial_head, direction="Right", totals_only=False):
+        """
+        Run one scenario.
+
+        Args:
+            algorithm_name (str): Name of the algorithm to run
+            initial_head (int): Initial position of disk head
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+            totals_only (bool): Skip building the sequence (default: False)
+
+        Returns:
+            ScenarioResult: Result row; sequence is None when totals_only is set
+        """
+        key = None
+        if self.cache is not None and algorithm_name in ALGORITHMS:
+            key = self._cache_key(algorithm_name, initial_head, direction)
+            cached = self.cache.get(key, "compact" if self.compact else "python",
+                                    need_sequence=not totals_only)
+            if cached is not None:
+                sequence = None if totals_only else cached.sequence
+                return ScenarioResult(
+                    algorithm_name, initial_head, direction, cached.total_movement, sequence)
+
+        if algorithm_name == "FCFS":
+            sequence, total_movement = self._fcfs(initial_head, totals_only)
+        elif algorithm_name == "SSTF":
+            if self._sstf_index is None:
+                self._sstf_index = _sstf_index(self.requests)
+            sequence, total_movement = _sstf_walk(
+                self._sstf_index, initial_head, record_sequence=not totals_only)
+        elif algorithm_name in SWEEP_CONFIGS:
+            sequence, total_movement = self._sweep(
+                algorithm_name, initial_head, direction, totals_only)
+        else:
+            info = get_algorithm(algorithm_name)
+            scheduler = DiskScheduler(self.disk_size, initial_head, cache=self.cache)
+            if totals_only and info.totals_only:
+                sequence = None
+                total_movement = scheduler.total_movement(algorithm_name, self.requests, direction)
+            else:
+                sequence, total_movement = scheduler.run_algorithm(
+                    algorithm_name, self.requests, direction)
+                if totals_only:
+                    sequence = None
+
+        if key is not None:
+            self.cache.put(key, sequence, total_movement)
+        if self.compact and sequence is not None:
+            sequence = HeadSequence(sequence)
+        return ScenarioResult(algorithm_name, initial_head, direction, total_movement, sequence)
+
+    def _cache_key(self, algorithm_name, initial_head, direction):
+        from .cache import cache_key, fingerprint
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.requests)
+        if not get_algorithm(algorithm_name).directional:
+            direction = None
+        return cache_key(self._fingerprint, algorithm_name, self.disk_size, initial_head,
+                         direction)
+
+    def _fcfs(self, initial_head, totals_only):
+        if not self.requests:
+            return (None if totals_only else [initial_head]), 0
+        total_movement = abs(self.requests[0] - initial_head) + self._fcfs_internal
+        if totals_only:
+            return None, total_movement
+        return [initial_head] + self.requests, total_movement
+
+    def _sweep(self, algorithm_name, initial_head, direction, totals_only):
+        circular, to_edge = SWEEP_CONFIGS[algorithm_name]
+        values = self.sorted_requests
+        if direction == "Right":
+            split = bisect_left(values, initial_head)
+        else:
+            split = bisect_right(values, initial_head)
+
+        first_leg, turn, second_leg, total_movement = _plan_sweep(
+            values, split, initial_head, self.disk_size - 1, direction, circular, to_edge)
+        if totals_only:
+            return None, total_movement
+
+        sequence = [initial_head]
+        sequence.extend(_leg_iter(values, first_leg))
+        if turn is not None:
+            sequence.append(turn)
+        sequence.extend(_leg_iter(values, second_leg))
+        return sequence, total_movement
+
+
+def run_batch(requests, scenarios, disk_size=200, totals_only=False, cache=None, compact=False):
+    """
+    Run many (algorithm, initial_head, direction) scenarios over one request set.
+
+    Args:
+        requests (list): List of disk requests (cylinder numbers)
+        scenarios (iterable): Tuples of (algorithm_name, initial_head, direction)
+        disk_size (int): Total number of cylinders (default: 200)
+        totals_only (bool): Skip building sequences (default: False)
+        cache (ResultCache): Cache to answer repeated scenarios from
+            (default: None)
+        compact (bool): Return sequences as HeadSequence objects (default: False)
+
+    Returns:
+        list: One ScenarioResult per scenario, in order
+    """
+    batch = BatchScheduler(requests, disk_size, cache, compact)
+    return [batch.run(algorithm_name, initial_head, direction, totals_only)
+            for algorithm_name, initial_head, direction in scenarios]
+
+
+def compare(requests, initial_head, direction="Right", disk_size=200,
+            algorithms=None, totals_only=False, cache=None, compact=False):
+    """
+    Run several algorithms on the same workload.
+
+    Args:
+        requests (list): List of disk requests (cylinder numbers)
+        initial_head (int): Initial position of disk head
+        direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        disk_size (int): Total number of cylinders (default: 200)
+        algorithms (iterable): Algorithm names to run (default: every
+            registered algorithm)
+        totals_only (bool): Skip building sequences (default: False)
+        cache (ResultCache): Cache to answer repeated runs from (default: None)
+        compact (bool): Return sequences as HeadSequence objects (default: False)
+
+    Returns:
+        list: One ScenarioResult per algorithm, in order
+    """
+    if algorithms is None:
+        algorithms = algorithm_names()
+    return run_batch(requests, ((name, initial_head, direction) for name in algorithms),
+                     disk_size, totals_only, cache, compact)
+
+
+def rank_by_throughput(requests, initial_head, direction="Right", disk_size=200, model=None,
+                       sizes=None, algorithms=None):
+    """
+    Rank algorithms by estimated service time on a physical disk model.
+    
+    Args:
+        requests (list): List of disk requests (cylinder numbers)
+        initial_head (int): Initial position of disk head
+        direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        disk_size (int): Total number of cylinders (default: 200)
+        model (DiskModel): Disk model (default: DiskModel())
+        sizes (sequence): Bytes of each request (default: the model's request_size)
+        algorithms (iterable): Algorithm names to run (default: every
+            registered algorithm whose service time can be estimated, e.g.
+            not the online policies when sizes are given)
+    
+    Returns:
+        list: (algorithm_name, ServiceSummary) pairs, highest IOPS first
+    """
+    scheduler = DiskScheduler(disk_size, initial_head, model=model)
+    if algorithms is not None:
+        results = [(name, scheduler.service_time(name, requests, direction, sizes))
+                   for name in algorithms]
+    else:
+        results = []
+        for name in algorithm_names():
+            try:
+                results.append((name, scheduler.service_time(name, requests, direction, sizes)))
+            except ValueError:
+                continue
+    return sorted(results, key=lambda item: item[1].total_time)
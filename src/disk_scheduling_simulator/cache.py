@@ -0,0 +1,239 @@
+"""
+Memoized scheduling results.
+
+A run is fully determined by the requests and the scenario parameters, so
+its result can be reused: ResultCache keys results on a fingerprint of the
+request array plus (algorithm, disk_size, initial_head, direction) and
+keeps them in an in-memory LRU bounded by size, optionally backed by a
+directory of result files that survives restarts and is shared between
+processes. DiskScheduler and BatchScheduler take a cache argument.
+
+Sequences are stored as int64 arrays (8 bytes per cylinder) and handed
+back as fresh lists or NumPy arrays, so callers may modify them freely,
+or as immutable HeadSequence objects.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from array import array
+from collections import OrderedDict, namedtuple
+
+from .utils import _is_ndarray, _little_endian, _load_numpy
+
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+CACHE_EXTENSION = ".dcache"
+
+# Result file layout (little-endian): header, then int64 cylinders
+CACHE_MAGIC = b"DSRC"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sHHqQ")
+CACHE_HAS_SEQUENCE = 0x1
+
+# Bookkeeping charged to every entry on top of its sequence
+_ENTRY_OVERHEAD = 128
+
+CachedResult = namedtuple("CachedResult", ["sequence", "total_movement"])
+
+
+def fingerprint(requests):
+    """
+    Hash a request list or array.
+
+    Lists and arrays with the same cylinders hash alike, whatever the
+    array's integer type.
+
+    Args:
+        requests (sequence): Disk requests (cylinder numbers)
+
+    Returns:
+        str: 32-character hex digest
+    """
+    packed = _little_endian(_int64_array(requests))
+    return hashlib.blake2b(packed.tobytes(), digest_size=16).hexdigest()
+
+
+def cache_key(requests_fingerprint, algorithm_name, disk_size, initial_head, direction,
+              options=()):
+    """
+    Build the cache key of a scenario.
+
+    Args:
+        requests_fingerprint (str): fingerprint() of the requests
+        algorithm_name (str): Name of the algorithm
+        disk_size (int): Total number of cylinders
+        initial_head (int): Initial position of disk head
+        direction (str): Sweep direction, or None for algorithms that
+            ignore it (so toggling it still hits the cache)
+        options (tuple): Any other settings the result depends on
+
+    Returns:
+        tuple: Hashable key
+    """
+    return (requests_fingerprint, algorithm_name, disk_size, initial_head, direction,
+            tuple(options))
+
+
+class ResultCache:
+    """In-memory LRU of scheduling results with an optional on-disk store."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Memory budget; least recently used results are
+                evicted beyond it (default: 64 MiB)
+            directory (str): Also store results as files in this directory,
+                created if needed (default: None for memory only)
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, backend="python", need_sequence=True):
+        """
+        Look up a result.
+
+        Args:
+            key (tuple): Key from cache_key()
+            backend (str): "python" to get the sequence as a list, "numpy"
+                for an int64 array, "compact" for a HeadSequence
+            need_sequence (bool): Only count results that include the
+                sequence; with False, the sequence is never returned
+                (default: True)
+
+        Returns:
+            CachedResult: (sequence or None, total movement), or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.directory is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None or (need_sequence and entry.sequence is None):
+            self.misses += 1
+            return None
+        self.hits += 1
+        if not need_sequence:
+            # Totals-only callers skip converting the stored sequence
+            return CachedResult(None, entry.total_movement)
+        sequence = entry.sequence
+        if sequence is not None:
+            if backend == "numpy":
+                sequence = _load_numpy().array(sequence, dtype="int64")
+            elif backend == "compact":
+                from .sequence import HeadSequence
+                sequence = HeadSequence(sequence)
+            else:
+                sequence = sequence.tolist()
+        return CachedResult(sequence, entry.total_movement)
+
+    def put(self, key, sequence, total_movement):
+        """
+        Store a result.
+
+        A result without a sequence never replaces one that has it.
+
+        Args:
+            key (tuple): Key from cache_key()
+            sequence (sequence): Head movement sequence, or None for totals only
+            total_movement (int): Total head movement
+        """
+        current = self._entries.get(key)
+        if sequence is None and current is not None and current.sequence is not None:
+            return
+        if sequence is not None:
+            sequence = _int64_array(sequence)
+        entry = CachedResult(sequence, int(total_movement))
+        if current is not None:
+            self._forget(key)
+        self._remember(key, entry)
+        if self.directory is not None and (sequence is not None
+                                           or not os.path.exists(self._path(key))):
+            self._store(key, entry)
+
+    def clear(self):
+        """Drop every result held in memory (files on disk are kept)."""
+        self._entries.clear()
+        self.size = 0
+
+    def _remember(self, key, entry):
+        entry_size = _entry_size(entry)
+        if entry_size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.size += entry_size
+        while self.size > self.max_bytes:
+            self._forget(next(iter(self._entries)))
+
+    def _forget(self, key):
+        self.size -= _entry_size(self._entries.pop(key))
+
+    def _path(self, key):
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + CACHE_EXTENSION)
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), "rb") as file:
+                header = file.read(CACHE_HEADER.size)
+                if len(header) != CACHE_HEADER.size:
+                    return None
+                magic, version, flags, total_movement, count = CACHE_HEADER.unpack(header)
+                if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                    return None
+                sequence = None
+                if flags & CACHE_HAS_SEQUENCE:
+                    sequence = array("q")
+                    sequence.frombytes(file.read(8 * count))
+                    if len(sequence) != count:
+                        return None
+                    _little_endian(sequence)
+        except OSError:
+            return None
+        return CachedResult(sequence, total_movement)
+
+    def _store(self, key, entry):
+        """Write a result file atomically, so concurrent readers never see half of it."""
+        path = self._path(key)
+        sequence = entry.sequence
+        flags = CACHE_HAS_SEQUENCE if sequence is not None else 0
+        count = len(sequence) if sequence is not None else 0
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(CACHE_HEADER.pack(
+                    CACHE_MAGIC, CACHE_VERSION, flags, entry.total_movement, count))
+                if sequence is not None:
+                    file.write(_little_endian(array("q", sequence)).tobytes())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def _entry_size(entry):
+    sequence = entry.sequence
+    return _ENTRY_OVERHEAD + (8 * len(sequence) if sequence is not None else 0)
+
+
+def _int64_array(values):
+    """Copy a list or NumPy array of cylinders into a native int64 array."""
+    packed = array("q")
+    if _is_ndarray(values):
+        packed.frombytes(_load_numpy().ascontiguousarray(values, dtype="int64").tobytes())
+    else:
+        packed.extend(values)
+    return packed
@@ -0,0 +1,202 @@
+"""
+Headless command-line runner for the disk scheduling simulator.
+
+Runs algorithms over trace files or generated workloads and writes the
+results as CSV, JSON or JSON Lines (or Parquet when pyarrow is installed).
+This module never imports tkinter or matplotlib, so it starts quickly on
+servers and in containers.
+
+Example:
+    disk-scheduler-cli examples/sample_requests.txt --head 50 --direction both
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from .batch import BatchScheduler
+from .parsing import RequestParseError, load_requests
+from .registry import algorithm_names
+from .utils import TRACE_EXTENSION, read_trace, validate_requests
+from .workloads import PATTERNS
+
+OUTPUT_FORMATS = ("csv", "json", "jsonl", "parquet")
+FIELDS = ["trace", "algorithm", "disk_size", "initial_head", "direction",
+          "num_requests", "total_movement", "average_seek"]
+
+
+def build_parser():
+    """Create the argument parser for the command-line runner."""
+    parser = argparse.ArgumentParser(
+        prog="disk-scheduler-cli",
+        description="Run disk scheduling algorithms without the GUI.")
+    parser.add_argument("traces", nargs="*",
+                        help=f"Request files (text, .csv, .jsonl or {TRACE_EXTENSION})")
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="Also run a generated workload of N requests per seed")
+    parser.add_argument("--pattern", choices=PATTERNS, default="uniform",
+                        help="Access pattern for --generate (default: uniform; "
+                             "others need NumPy)")
+    parser.add_argument("--seed", type=int, action="append", dest="seeds",
+                        help="Seed for --generate (repeatable, default: 0)")
+    parser.add_argument("-a", "--algorithm", action="append", dest="algorithms",
+                        choices=algorithm_names(),
+                        help="Algorithm to run (repeatable, default: all registered)")
+    parser.add_argument("--disk-size", type=int, default=200,
+                        help="Total number of cylinders (default: 200)")
+    parser.add_argument("--head", type=int, action="append", dest="heads",
+                        help="Initial head position (repeatable, default: 0)")
+    parser.add_argument("--direction", choices=("Right", "Left", "both"), default="Right",
+                        help="Direction for SCAN/LOOK algorithms (default: Right)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="csv",
+                        help="Output format (default: csv)")
+    parser.add_argument("-o", "--output", help="Output file (default: standard output)")
+    parser.add_argument("--sequences", action="store_true",
+                        help="Include the head movement sequence of every run")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Traces to process in parallel (default: 1)")
+    parser.add_argument("--cache", metavar="DIR",
+                        help="Keep results in DIR and reuse them when a scenario is run again")
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the disk-scheduler-cli command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.traces and args.generate is None:
+        parser.error("give at least one trace file or --generate N")
+
+    heads = args.heads or [0]
+    for head in heads:
+        if not 0 <= head < args.disk_size:
+            parser.error(f"--head {head} is outside the disk (0-{args.disk_size - 1})")
+    directions = ["Right", "Left"] if args.direction == "both" else [args.direction]
+    scenarios = [(algorithm, head, direction)
+                 for algorithm in args.algorithms or algorithm_names()
+                 for head in heads
+                 for direction in directions]
+
+    jobs = [(path, None, args.disk_size, scenarios, args.sequences, args.cache)
+            for path in args.traces]
+    if args.generate is not None:
+        jobs += [(None, (args.generate, seed, args.pattern), args.disk_size, scenarios,
+                  args.sequences, args.cache)
+                 for seed in args.seeds or [0]]
+
+    try:
+        if args.jobs > 1 and len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                results = list(executor.map(_run_job, jobs))
+        else:
+            results = [_run_job(job) for job in jobs]
+    except (ImportError, OSError, ValueError) as error:
+        print(f"disk-scheduler-cli: error: {error}", file=sys.stderr)
+        return 1
+
+    rows = [row for job_rows in results for row in job_rows]
+    fields = FIELDS + ["sequence"] if args.sequences else FIELDS
+    write_results(rows, fields, args.format, args.output)
+    return 0
+
+
+def _run_job(job):
+    """Load or generate one workload and run every scenario on it."""
+    path, generated, disk_size, scenarios, with_sequences, cache_dir = job
+    if generated is not None:
+        num_requests, seed, pattern = generated
+        if pattern == "uniform":
+            from .parallel import generate_workload
+            name = f"generated:seed={seed}"
+            requests = generate_workload(num_requests, disk_size, seed)
+        else:
+            from .workloads import generate
+            name = f"generated:{pattern}:seed={seed}"
+            requests = generate(pattern, num_requests, disk_size, seed).requests
+    elif path.endswith(TRACE_EXTENSION):
+        name = path
+        requests = read_trace(path).requests
+        if not validate_requests(requests, disk_size):
+            raise ValueError(f"{path}: requests must be between 0 and {disk_size - 1}")
+    else:
+        name = path
+        try:
+            requests = load_requests(path, disk_size=disk_size)
+        except RequestParseError as error:
+            raise ValueError(f"{path}: {error}") from None
+
+    cache = None
+    if cache_dir is not None:
+        from .cache import ResultCache
+        cache = ResultCache(directory=cache_dir)
+    batch = BatchScheduler(requests, disk_size, cache)
+    num_requests = len(batch.requests)
+    rows = []
+    for algorithm, head, direction in scenarios:
+        result = batch.run(algorithm, head, direction, totals_only=not with_sequences)
+        row = {
+            "trace": name,
+            "algorithm": algorithm,
+            "disk_size": disk_size,
+            "initial_head": head,
+            "direction": direction,
+            "num_requests": num_requests,
+            "total_movement": result.total_movement,
+            "average_seek": result.total_movement / num_requests if num_requests else 0.0,
+        }
+        if with_sequences:
+            row["sequence"] = result.sequence
+        rows.append(row)
+    return rows
+
+
+def write_results(rows, fields, fmt, output=None):
+    """
+    Write result rows in the requested format.
+
+    Args:
+        rows (list): Result dictionaries
+        fields (list): Column names, in order
+        fmt (str): One of OUTPUT_FORMATS
+        output (str): File path, or None for standard output
+    """
+    if fmt == "parquet":
+        _write_parquet(rows, fields, output)
+        return
+
+    stream = open(output, "w", newline="", encoding="utf-8") if output else sys.stdout
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(stream, fieldnames=fields)
+            writer.writeheader()
+            for row in rows:
+                if "sequence" in row:
+                    row = dict(row, sequence=" ".join(map(str, row["sequence"])))
+                writer.writerow(row)
+        elif fmt == "json":
+            json.dump(rows, stream, indent=2)
+            stream.write("\n")
+        else:
+            for row in rows:
+                stream.write(json.dumps(row) + "\n")
+    finally:
+        if output:
+            stream.close()
+
+
+def _write_parquet(rows, fields, output):
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise SystemExit("disk-scheduler-cli: error: Parquet output requires pyarrow") from None
+    if not output:
+        raise SystemExit("disk-scheduler-cli: error: Parquet output requires --output")
+    table = pyarrow.table({field: [row[field] for row in rows] for field in fields})
+    pyarrow.parquet.write_table(table, output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""
+Side-by-side comparison of every algorithm on one workload.
+
+ComparisonSession runs all registered algorithms over the same requests
+and collects, for each one, its sequence, total movement, the fairness
+metrics of the metrics module and (with NumPy) the service time estimate
+of the disk model. Large workloads are spread over a process pool that
+lives as long as the session: the requests are placed in shared memory
+once and every worker unpacks them once, as parallel.run_grid() does.
+start() launches the workers up front, so a GUI can fork them from its
+main thread and collect results from another; closing never waits for them.
+
+Results are memoized per scenario, so when only the direction or the head
+position changes, algorithms whose result does not depend on the change
+(FCFS, SSTF, ... for the direction) are answered without running again.
+Sequences are kept as HeadSequence objects, which keeps the memo small and
+the results cheap to send back from worker processes.
+"""
+
+import os
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from .algorithms import DiskScheduler
+from .cache import cache_key, fingerprint
+from .metrics import collect_metrics
+from .registry import algorithm_names, get_algorithm
+from .utils import _load_numpy
+
+# Workloads with fewer requests are compared in-process: a pool costs more
+# to start than the runs themselves
+PARALLEL_THRESHOLD = 20_000
+# Scenarios whose results a session remembers
+MEMO_SIZE = 256
+
+ComparisonResult = namedtuple("ComparisonResult", [
+    "algorithm", "initial_head", "direction", "total_movement", "average_seek",
+    "sequence", "metrics", "service",
+])
+
+# Per-process cache of unpacked workloads, keyed by shared memory block name
+_worker_requests = {}
+_WORKER_CACHE_SIZE = 4
+
+
+class ComparisonSession:
+    """Compare algorithms on one workload, reusing work across scenarios."""
+
+    def __init__(self, requests, disk_size=200, max_workers=None,
+                 parallel_threshold=PARALLEL_THRESHOLD):
+        """
+        Prepare a workload for comparison.
+
+        Args:
+            requests (list): Disk requests (cylinder numbers)
+            disk_size (int): Total number of cylinders (default: 200)
+            max_workers (int): Worker processes (default: CPU count)
+            parallel_threshold (int): Use worker processes from this many
+                requests on (default: PARALLEL_THRESHOLD)
+        """
+        self.requests = list(requests)
+        self.disk_size = disk_size
+        self.fingerprint = fingerprint(self.requests)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel = len(self.requests) >= parallel_threshold and self.max_workers > 1
+        self._memo = OrderedDict()
+        self._executor = None
+        self._block = None
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """
+        Launch the worker processes and share the workload, if the session is parallel.
+
+        iter_results() does this on first use, from whichever thread calls
+        it; a GUI calls start() from its main thread instead.
+        """
+        if self.parallel:
+            with self._lock:
+                self._pool()
+
+    def matches(self, requests, disk_size):
+        """Check whether this session was prepared for the given workload."""
+        return disk_size == self.disk_size and fingerprint(requests) == self.fingerprint
+
+    def run(self, initial_head, direction="Right", algorithms=None):
+        """
+        Compare algorithms and rank them.
+
+        Returns:
+            list: ComparisonResult per algorithm, least head movement first
+        """
+        results = list(self.iter_results(initial_head, direction, algorithms))
+        return sorted(results, key=lambda result: result.total_movement)
+
+    def iter_results(self, initial_head, direction="Right", algorithms=None):
+        """
+        Yield each algorithm's ComparisonResult as soon as it is available.
+
+        Remembered results come first, then new ones in completion order.
+
+        Args:
+            initial_head (int): Initial position of disk head
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+            algorithms (list): Algorithm names (default: all registered)
+
+        Yields:
+            ComparisonResult: One per algorithm
+        """
+        pending = []
+        for algorithm in algorithms or algorithm_names():
+            key = self._key(algorithm, initial_head, direction)
+            result = self._memo.get(key)
+            if result is None:
+                pending.append((key, algorithm))
+            else:
+                self._memo.move_to_end(key)
+                yield result._replace(direction=direction)
+
+        if not self.parallel:
+            for key, algorithm in pending:
+                result = compare_algorithm(
+                    self.requests, self.disk_size, initial_head, direction, algorithm)
+                self._remember(key, result)
+                yield result
+            return
+
+        with self._lock:
+            executor = self._pool()
+            futures = {executor.submit(_compare_shared, self._block.name, len(self.requests),
+                                       self.disk_size, initial_head, direction, algorithm): key
+                       for key, algorithm in pending}
+            self._futures.update(futures)
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                self._remember(futures[future], result)
+                yield result
+        finally:
+            # Stop queued runs when the caller gives up early
+            with self._lock:
+                for future in futures:
+                    future.cancel()
+                self._futures.difference_update(futures)
+
+    def close(self):
+        """
+        Shut the worker processes down and release the shared workload.
+
+        Queued runs are cancelled and running ones are left to finish in the
+        background, so closing does not block (e.g. a GUI's main thread).
+        Results still being collected are lost.
+        """
+        with self._lock:
+            for future in self._futures:
+                future.cancel()
+            self._futures.clear()
+            executor, block = self._executor, self._block
+            self._executor = self._block = None
+        if executor is not None or block is not None:
+            # Not a daemon thread, so the interpreter waits for it and the
+            # shared workload is always unlinked
+            threading.Thread(target=_release, args=(executor, block),
+                             name="comparison-close").start()
+
+    def _key(self, algorithm, initial_head, direction):
+        if not get_algorithm(algorithm).directional:
+            direction = None
+        return cache_key(self.fingerprint, algorithm, self.disk_size, initial_head, direction)
+
+    def _remember(self, key, result):
+        self._memo[key] = result
+        while len(self._memo) > MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    def _pool(self):
+        if self._executor is None:
+            packed = array("l", self.requests)
+            self._block = shared_memory.SharedMemory(create=True, size=max(len(packed.tobytes()), 1))
+            self._block.buf[:len(packed) * packed.itemsize] = packed.tobytes()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            # The first submission launches the worker processes, here and now
+            self._executor.submit(_preload_shared, self._block.name, len(self.requests))
+        return self._executor
+
+
+def compare_algorithm(requests, disk_size, initial_head, direction, algorithm):
+    """
+    Run one algorithm and measure it.
+
+    metrics is None for plug-in algorithms whose moves cannot be matched to
+    requests, and service is None without NumPy or for such plug-ins.
+    The service summary carries no per-request latencies.
+
+    Returns:
+        ComparisonResult: Result of the algorithm
+    """
+    scheduler = DiskScheduler(disk_size, initial_head, compact=True)
+    sequence, total_movement = scheduler.run_algorithm(algorithm, requests, direction)
+    try:
+        metrics = collect_metrics(scheduler, algorithm, requests, direction)
+    except ValueError:
+        metrics = None
+    service = None
+    if _load_numpy() is not None:
+        try:
+            service = scheduler.service_time(algorithm, requests, direction)._replace(latencies=None)
+        except ValueError:
+            pass
+    average_seek = total_movement / len(requests) if requests else 0.0
+    return ComparisonResult(algorithm, initial_head, direction, total_movement, average_seek,
+                            sequence, metrics, service)
+
+
+def _release(executor, block):
+    """
+    Join a closed session's workers, then release its shared workload.
+
+    Shutting down without waiting and dropping the executor makes Python
+    3.8 hang at exit, and running workers may still attach to the block,
+    so both are kept until the workers are done.
+    """
+    if executor is not None:
+        executor.shutdown()
+    if block is not None:
+        block.close()
+        block.unlink()
+
+
+def _compare_shared(name, length, disk_size, initial_head, direction, algorithm):
+    """Worker entry point: compare one algorithm on a workload in shared memory."""
+    requests = _load_shared(name, length)
+    return compare_algorithm(requests, disk_size, initial_head, direction, algorithm)
+
+
+def _preload_shared(name, length):
+    """Worker warm-up: unpack the workload before the first comparison needs it."""
+    _load_shared(name, length)
+
+
+def _load_shared(name, length):
+    """Unpack a workload from shared memory, once per worker process."""
+    requests = _worker_requests.get(name)
+    if requests is None:
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            requests = block.buf[:length * array("l").itemsize].cast("l").tolist()
+        finally:
+            block.close()
+        if len(_worker_requests) >= _WORKER_CACHE_SIZE:
+            _worker_requests.pop(next(iter(_worker_requests)))
+        _worker_requests[name] = requests
+    return requests
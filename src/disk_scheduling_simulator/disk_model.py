@@ -0,0 +1,164 @@
+"""
+Physical disk model for estimating service times.
+
+Cylinder distance says little about real throughput: a seek costs a fixed
+settle time plus a curve that grows like sqrt(distance) for short seeks
+(the arm accelerates and decelerates) and linearly for long ones (it
+coasts). Every request also waits for the platter to rotate under the head
+and then transfers its data. DiskModel combines these per request, in
+vectorized form, so schedules can be ranked by time and IOPS.
+
+Times are in milliseconds, sizes in bytes and transfer rates in MB/s
+(10^6 bytes per second).
+"""
+
+import math
+from collections import namedtuple
+
+from .utils import _is_ndarray, _load_numpy
+
+ServiceSummary = namedtuple("ServiceSummary", [
+    "total_time", "num_requests", "iops", "mean_latency", "max_latency", "latencies"])
+
+
+class DiskModel:
+    """Seek curve, rotational latency and transfer time of a disk."""
+
+    def __init__(self, settle_time=1.0, seek_sqrt=0.3, seek_linear=0.01, rpm=7200,
+                 transfer_rate=150.0, request_size=4096):
+        """
+        Initialize the disk model.
+
+        A seek over d > 0 cylinders takes
+        settle_time + seek_sqrt * sqrt(d) + seek_linear * d; staying on the
+        same cylinder costs no seek.
+
+        Args:
+            settle_time (float): Fixed cost of any seek in ms (default: 1.0)
+            seek_sqrt (float): ms per sqrt(cylinder) (default: 0.3)
+            seek_linear (float): ms per cylinder (default: 0.01)
+            rpm (float): Spindle speed; a request waits half a revolution on
+                average (default: 7200)
+            transfer_rate (float): Sustained transfer rate in MB/s (default: 150.0)
+            request_size (int): Bytes per request when no sizes are given
+                (default: 4096)
+        """
+        if rpm <= 0 or transfer_rate <= 0:
+            raise ValueError("rpm and transfer_rate must be positive")
+        self.settle_time = settle_time
+        self.seek_sqrt = seek_sqrt
+        self.seek_linear = seek_linear
+        self.rpm = rpm
+        self.transfer_rate = transfer_rate
+        self.request_size = request_size
+
+    @classmethod
+    def from_specs(cls, cylinders, track_to_track, average_seek, full_stroke, **kwargs):
+        """
+        Fit the seek curve to the three seek times found on a datasheet.
+
+        Args:
+            cylinders (int): Number of cylinders of the disk
+            track_to_track (float): Seek time over one cylinder in ms
+            average_seek (float): Average seek time in ms (taken at a third
+                of the stroke, the mean distance between random cylinders)
+            full_stroke (float): Seek time across the whole disk in ms
+            **kwargs: Other DiskModel arguments (rpm, transfer_rate, ...)
+
+        Returns:
+            DiskModel: Model whose seek curve passes through the three points
+        """
+        np = _require_numpy()
+        distances = np.array([1.0, (cylinders - 1) / 3.0, cylinders - 1.0])
+        if not distances[0] < distances[1] < distances[2]:
+            raise ValueError("cylinders must be at least 5 to fit a seek curve")
+        terms = np.column_stack((np.ones(3), np.sqrt(distances), distances))
+        settle_time, seek_sqrt, seek_linear = np.linalg.solve(
+            terms, [track_to_track, average_seek, full_stroke])
+        return cls(float(settle_time), float(seek_sqrt), float(seek_linear), **kwargs)
+
+    @property
+    def rotational_latency(self):
+        """Average wait for the target sector: half a revolution, in ms."""
+        return 30000.0 / self.rpm
+
+    def seek_time(self, distance):
+        """
+        Time to move the head over distance cylinders.
+
+        Args:
+            distance (int or ndarray): Cylinders travelled
+
+        Returns:
+            float or ndarray: Seek time in ms (0 for a distance of 0)
+        """
+        if _is_ndarray(distance):
+            np = _load_numpy()
+            distance = np.abs(distance).astype(np.float64)
+            times = self.settle_time + self.seek_sqrt * np.sqrt(distance) + self.seek_linear * distance
+            return np.where(distance > 0, times, 0.0)
+        distance = abs(distance)
+        if distance == 0:
+            return 0.0
+        return self.settle_time + self.seek_sqrt * math.sqrt(distance) + self.seek_linear * distance
+
+    def transfer_time(self, size):
+        """
+        Time to transfer size bytes once the head is over the data.
+
+        Args:
+            size (int or ndarray): Bytes per request
+
+        Returns:
+            float or ndarray: Transfer time in ms
+        """
+        return size / (self.transfer_rate * 1000.0)
+
+    def evaluate(self, seeks, sizes=None, overhead=None):
+        """
+        Compute per-request latency, total service time and IOPS.
+
+        Args:
+            seeks (ndarray): Seek distance of each request, in service order
+            sizes (ndarray): Bytes of each request in service order (default:
+                request_size for every request)
+            overhead (ndarray): num_requests + 1 extra times (ms), e.g. for
+                sweeping to a disk edge; entry i is spent before request i and
+                the last entry after the final request, which only counts
+                towards the total time
+
+        Returns:
+            ServiceSummary: (total_time, num_requests, iops, mean_latency,
+                max_latency, latencies), times in ms
+        """
+        np = _require_numpy()
+        seeks = np.asarray(seeks)
+        num_requests = len(seeks)
+        if sizes is None:
+            sizes = self.request_size
+        elif len(sizes) != num_requests:
+            raise ValueError("sizes must have one entry per request")
+
+        latencies = (self.seek_time(seeks) + self.rotational_latency
+                     + self.transfer_time(np.asarray(sizes, dtype=np.float64)))
+        trailing = 0.0
+        if overhead is not None:
+            latencies = latencies + overhead[:num_requests]
+            trailing = float(overhead[num_requests:].sum())
+
+        total_time = float(latencies.sum()) + trailing
+        return ServiceSummary(
+            total_time=total_time,
+            num_requests=num_requests,
+            iops=num_requests / (total_time / 1000.0) if total_time else 0.0,
+            mean_latency=float(latencies.mean()) if num_requests else 0.0,
+            max_latency=float(latencies.max()) if num_requests else 0.0,
+            latencies=latencies,
+        )
+
+
+def _require_numpy():
+    np = _load_numpy()
+    if np is None:
+        raise ImportError("Service time estimates require NumPy to be installed")
+    return np
@@ -5,11 +5,35 @@ GUI implementation for the Disk Scheduling Simulator.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+import queue
 import random
 import sys
 import os
+import threading
+import time
 from .algorithms import DiskScheduler
+from .cache import ResultCache
+from .comparison import ComparisonSession
+from .registry import algorithm_names, get_algorithm
+from .parsing import load_requests
+from .plotting import SequencePlot, plot_comparison
+from .worker import SimulationWorker
+from .utils import TRACE_EXTENSION, read_trace
+
+# Milliseconds between checks on a running simulation
+POLL_INTERVAL = 50
+# Milliseconds between redraws of a partial result
+PARTIAL_PLOT_INTERVAL = 250
+# Cylinders listed in the results text; longer lists are cut short
+MAX_LISTED_STEPS = 1000
+
+def format_listing(values):
+    """Format cylinders as a list, cut short after MAX_LISTED_STEPS entries."""
+    if len(values) <= MAX_LISTED_STEPS:
+        return str(list(values))
+    listed = ", ".join(map(str, values[:MAX_LISTED_STEPS]))
+    return f"[{listed}, ... ({len(values) - MAX_LISTED_STEPS:,} more)]"
 
 def run_simulator():
     """Launch the disk scheduling simulator GUI."""
@@ -31,10 +55,19 @@ class DiskSchedulingGUI:
         self.disk_size = 200
         self.initial_head = 50
         self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+        # Re-running an unchanged scenario (or toggling back to one) is instant
+        self.cache = ResultCache()
+        self.worker = None
+        # Kept while the workload is unchanged, so comparisons reuse results
+        self.comparison = None
+        self.comparison_window = None
+        # Entry text the requests were last parsed from
+        self.requests_text = None
         
         # Create GUI
         self.create_widgets()
         self.update_request_list()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
     def set_window_icon(self):
         """Set the window icon if icon file is available."""
@@ -92,7 +125,7 @@ class DiskSchedulingGUI:
         ttk.Label(control_frame, text="Select Algorithm:").grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
         self.algorithm_var = tk.StringVar(value="FCFS")
         algorithm_combo = ttk.Combobox(control_frame, textvariable=self.algorithm_var, 
-                                      values=["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"], state="readonly")
+                                      values=algorithm_names(), state="readonly")
         algorithm_combo.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
         
         # Direction for SCAN and LOOK algorithms
@@ -103,8 +136,24 @@ class DiskSchedulingGUI:
         ttk.Radiobutton(direction_frame, text="Right", variable=self.direction_var, value="Right").pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(direction_frame, text="Left", variable=self.direction_var, value="Left").pack(side=tk.LEFT, padx=5)
         
-        # Run simulation button
-        ttk.Button(control_frame, text="Run Simulation", command=self.run_simulation).grid(row=8, column=0, columnspan=2, pady=15)
+        # Run simulation and cancel buttons
+        run_frame = ttk.Frame(control_frame)
+        run_frame.grid(row=8, column=0, columnspan=2, pady=(15, 5))
+        self.run_button = ttk.Button(run_frame, text="Run Simulation", command=self.run_simulation)
+        self.run_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(run_frame, text="Cancel", command=self.cancel_simulation,
+                                        state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        self.compare_button = ttk.Button(run_frame, text="Compare All", command=self.compare_algorithms)
+        self.compare_button.pack(side=tk.LEFT, padx=5)
+        
+        # Progress of a running simulation
+        self.progress_var = tk.DoubleVar(value=0.0)
+        ttk.Progressbar(control_frame, variable=self.progress_var, maximum=1.0).grid(
+            row=9, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(control_frame, textvariable=self.status_var).grid(
+            row=10, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         # Results frame
         results_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
@@ -128,6 +177,10 @@ class DiskSchedulingGUI:
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
         self.canvas = FigureCanvasTkAgg(self.fig, viz_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Zooming in refines long sequences, so offer the pan/zoom toolbar
+        toolbar = NavigationToolbar2Tk(self.canvas, viz_frame, pack_toolbar=False)
+        toolbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.plot = SequencePlot(self.ax)
         
         # Configure grid weights
         main_frame.columnconfigure(1, weight=1)
@@ -141,6 +194,9 @@ class DiskSchedulingGUI:
         """Update the request list from the entry field"""
         try:
             requests_str = self.requests_var.get().strip()
+            if requests_str == self.requests_text:
+                return
+            self.requests_text = requests_str
             if requests_str:
                 self.requests = [int(x.strip()) for x in requests_str.split(",") if x.strip()]
             else:
@@ -149,6 +205,7 @@ class DiskSchedulingGUI:
             messagebox.showerror("Input Error", "Please enter valid integers for disk requests.")
             self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
             self.requests_var.set(", ".join(map(str, self.requests)))
+            self.requests_text = None
     
     def generate_random_requests(self):
         """Generate random disk requests"""
@@ -161,23 +218,21 @@ class DiskSchedulingGUI:
         """Load disk requests from a file"""
         file_path = filedialog.askopenfilename(
             title="Select Request File",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Binary traces", f"*{TRACE_EXTENSION}"), ("All files", "*.*")]
         )
         if file_path:
             try:
-                with open(file_path, 'r') as file:
-                    content = file.read().strip()
-                    # Handle both space and comma separated values
-                    if ',' in content:
-                        self.requests = [int(x) for x in content.split(',') if x.strip().isdigit()]
-                    else:
-                        self.requests = [int(x) for x in content.split() if x.strip().isdigit()]
-                    self.requests_var.set(", ".join(map(str, self.requests)))
+                if file_path.endswith(TRACE_EXTENSION):
+                    self.requests = read_trace(file_path).requests.tolist()
+                else:
+                    self.requests = load_requests(file_path, disk_size=self.disk_size_var.get()).tolist()
+                self.requests_var.set(", ".join(map(str, self.requests)))
             except Exception as e:
                 messagebox.showerror("File Error", f"Error reading file: {str(e)}")
     
-    def run_simulation(self):
-        """Run the selected disk scheduling algorithm"""
+    def read_inputs(self):
+        """Read and validate the simulation parameters, returning False if they are invalid"""
         # Update parameters
         self.disk_size = self.disk_size_var.get()
         self.initial_head = self.head_pos_var.get()
@@ -186,74 +241,308 @@ class DiskSchedulingGUI:
         # Validate inputs
         if not self.requests:
             messagebox.showerror("Input Error", "Please provide at least one disk request.")
-            return
+            return False
         
         if self.initial_head < 0 or self.initial_head >= self.disk_size:
             messagebox.showerror("Input Error", f"Initial head position must be between 0 and {self.disk_size - 1}.")
-            return
+            return False
         
         for req in self.requests:
             if req < 0 or req >= self.disk_size:
                 messagebox.showerror("Input Error", f"All requests must be between 0 and {self.disk_size - 1}.")
-                return
+                return False
+        return True
+    
+    def run_simulation(self):
+        """Run the selected disk scheduling algorithm"""
+        if not self.read_inputs():
+            return
         
         # Get selected algorithm
         algorithm = self.algorithm_var.get()
         direction = self.direction_var.get()
         
-        # Run the algorithm
-        scheduler = DiskScheduler(self.disk_size, self.initial_head)
-        sequence, total_movement = scheduler.run_algorithm(algorithm, self.requests, direction)
+        # Answer from the cache, or run the algorithm on a background thread
+        scheduler = DiskScheduler(self.disk_size, self.initial_head, cache=self.cache)
+        key = scheduler.cache_key(algorithm, self.requests, direction)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.progress_var.set(1.0)
+            self.status_var.set("Done (cached)")
+            self.display_results(algorithm, cached.sequence, cached.total_movement)
+            self.visualize_sequence(cached.sequence)
+            return
+        
+        def on_done(sequence, total_movement):
+            self.cache.put(key, sequence, total_movement)
+            self.finish_simulation("Done")
+            self.display_results(algorithm, sequence, total_movement)
+            self.visualize_sequence(sequence)
+        
+        def on_error(error):
+            self.finish_simulation("Failed")
+            messagebox.showerror("Simulation Error", str(error))
         
-        # Display results
-        self.display_results(algorithm, sequence, total_movement)
-        self.visualize_sequence(sequence)
+        self.worker = SimulationWorker(
+            scheduler, algorithm, list(self.requests), direction,
+            on_progress=self.show_progress, on_done=on_done, on_error=on_error,
+            on_cancel=lambda: self.finish_simulation("Cancelled"))
+        self.run_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.progress_var.set(0.0)
+        self.status_var.set(f"Running {algorithm}...")
+        self.results_text.delete(1.0, tk.END)
+        self.last_partial_plot = 0
+        self.partial_plotted = 0
+        self.worker.start()
+        self.root.after(POLL_INTERVAL, self.poll_simulation)
+    
+    def poll_simulation(self):
+        """Deliver the running simulation's events and check on it again later."""
+        if self.worker is not None and self.worker.dispatch():
+            self.root.after(POLL_INTERVAL, self.poll_simulation)
+    
+    def show_progress(self, length, num_requests):
+        """Show how far a running simulation is, plotting the partial result now and then."""
+        served = length - 1
+        self.progress_var.set(min(served / num_requests, 1.0) if num_requests else 1.0)
+        self.status_var.set(f"Running: {served:,} of {num_requests:,} requests served")
+        now = time.monotonic() * 1000
+        if now - self.last_partial_plot >= PARTIAL_PLOT_INTERVAL:
+            self.last_partial_plot = now
+            # Scale the axis to the full run so each partial result is only blitted,
+            # and copy only the steps added since the last partial plot
+            start = self.partial_plotted
+            self.plot.extend(self.worker.sequence[start:length], start, self.disk_size,
+                             steps=num_requests + 1)
+            self.partial_plotted = length
+    
+    def cancel_simulation(self):
+        """Stop the running simulation."""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_button.configure(state=tk.DISABLED)
+            self.status_var.set("Cancelling...")
+    
+    def finish_simulation(self, status):
+        """Re-enable the controls after a simulation ends."""
+        self.worker = None
+        self.run_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+        if status == "Done":
+            self.progress_var.set(1.0)
+        self.status_var.set(status)
     
     def display_results(self, algorithm, sequence, total_movement):
         """Display simulation results in the text widget"""
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, f"Algorithm: {algorithm}\n")
         self.results_text.insert(tk.END, f"Initial Head Position: {self.initial_head}\n")
-        self.results_text.insert(tk.END, f"Request Sequence: {self.requests}\n")
-        self.results_text.insert(tk.END, f"Head Movement Sequence: {sequence}\n")
+        self.results_text.insert(tk.END, f"Request Sequence: {format_listing(self.requests)}\n")
+        self.results_text.insert(tk.END, f"Head Movement Sequence: {format_listing(sequence)}\n")
         self.results_text.insert(tk.END, f"Total Head Movement: {total_movement} cylinders\n")
         
         # Add algorithm description
-        descriptions = {
-            "FCFS": "First-Come, First-Served: Processes requests in the order they arrive.",
-            "SSTF": "Shortest Seek Time First: Always chooses the request closest to the current head position.",
-            "SCAN": "Elevator Algorithm: Moves head in one direction servicing requests until the end, then reverses.",
-            "C-SCAN": "Circular SCAN: Moves head in one direction servicing requests, then jumps to the beginning and continues.",
-            "LOOK": "Similar to SCAN but doesn't go all the way to the end; reverses when no more requests in current direction.",
-            "C-LOOK": "Circular LOOK: Similar to C-SCAN but doesn't go all the way to the end; jumps to the first request in the other direction."
-        }
-        self.results_text.insert(tk.END, f"\nDescription: {descriptions[algorithm]}")
+        description = get_algorithm(algorithm).description
+        if description:
+            self.results_text.insert(tk.END, f"\nDescription: {description}")
     
     def visualize_sequence(self, sequence):
         """Visualize the head movement sequence"""
-        self.ax.clear()
-        
-        # Create x-axis (time steps) and y-axis (cylinder positions)
-        x = list(range(len(sequence)))
-        y = sequence
-        
-        # Plot the movement
-        self.ax.plot(x, y, 'bo-', linewidth=2, markersize=8)
-        self.ax.set_xlabel('Time Step')
-        self.ax.set_ylabel('Cylinder Position')
-        self.ax.set_title('Disk Head Movement Sequence')
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        self.ax.set_ylim(-5, self.disk_size + 5)
-        
-        # Add disk boundaries
-        self.ax.axhline(y=0, color='r', linestyle='--', alpha=0.5)
-        self.ax.axhline(y=self.disk_size-1, color='r', linestyle='--', alpha=0.5)
-        self.ax.text(-0.5, -3, '0', fontsize=9, ha='center')
-        self.ax.text(-0.5, self.disk_size+2, f'{self.disk_size-1}', fontsize=9, ha='center')
-        
-        # Annotate points
-        for i, (xi, yi) in enumerate(zip(x, y)):
-            self.ax.annotate(str(yi), (xi, yi), textcoords="offset points", 
-                            xytext=(0,10), ha='center', fontsize=9)
-        
-        self.canvas.draw()
\ No newline at end of file
+        self.plot.show(sequence, self.disk_size)
+    
+    def compare_algorithms(self):
+        """Run every algorithm on the current workload and show them side by side"""
+        if not self.read_inputs():
+            return
+        
+        # Only a new workload needs a new session; head and direction changes reuse it
+        if self.comparison is None or not self.comparison.matches(self.requests, self.disk_size):
+            if self.comparison is not None:
+                self.comparison.close()
+            self.comparison = ComparisonSession(self.requests, self.disk_size)
+            # Started here rather than from the comparison thread
+            self.comparison.start()
+        
+        if self.comparison_window is None or not self.comparison_window.exists():
+            self.comparison_window = ComparisonWindow(self.root)
+        self.compare_button.configure(state=tk.DISABLED)
+        self.comparison_window.run(
+            self.comparison, self.initial_head, self.direction_var.get(),
+            on_finish=lambda: self.compare_button.configure(state=tk.NORMAL))
+    
+    def close(self):
+        """Stop background work and close the application"""
+        if self.worker is not None:
+            self.worker.cancel()
+        if self.comparison_window is not None and self.comparison_window.exists():
+            self.comparison_window.close()
+        if self.comparison is not None:
+            self.comparison.close()
+        self.root.destroy()
+
+class ComparisonWindow:
+    """Window ranking every algorithm on one workload, with their sequences plotted."""
+    
+    # (column, heading, width, value of a ComparisonResult or None)
+    COLUMNS = (
+        ("rank", "#", 40, None),
+        ("algorithm", "Algorithm", 110, lambda r: r.algorithm),
+        ("movement", "Total Movement", 110, lambda r: r.total_movement),
+        ("seek", "Avg Seek", 80, lambda r: r.average_seek),
+        ("mean_wait", "Mean Wait", 90, lambda r: r.metrics and r.metrics.wait.mean),
+        ("p99_wait", "p99 Wait", 90, lambda r: r.metrics and r.metrics.wait.p99),
+        ("max_wait", "Max Wait", 90, lambda r: r.metrics and r.metrics.wait.max),
+        ("starved", "Starved", 70, lambda r: r.metrics and r.metrics.starved),
+        ("time", "Time (ms)", 90, lambda r: r.service and r.service.total_time),
+        ("iops", "IOPS", 70, lambda r: r.service and r.service.iops),
+    )
+    
+    def __init__(self, master):
+        self.master = master
+        self.window = tk.Toplevel(master)
+        self.window.title("Algorithm Comparison")
+        self.window.geometry("1100x800")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.results = []
+        self.disk_size = None
+        self.sort_column = "movement"
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.on_finish = None
+        
+        frame = ttk.Frame(self.window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Ranked table; clicking a heading ranks by that column
+        columns = [column for column, _, _, _ in self.COLUMNS]
+        self.table = ttk.Treeview(frame, columns=columns, show="headings", height=len(algorithm_names()))
+        for column, heading, width, _ in self.COLUMNS:
+            self.table.heading(column, text=heading, command=lambda c=column: self.sort_by(c))
+            self.table.column(column, width=width, anchor=tk.E if column != "algorithm" else tk.W)
+        self.table.pack(fill=tk.X)
+        
+        options = ttk.Frame(frame)
+        options.pack(fill=tk.X, pady=5)
+        self.overlay_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options, text="Overlay sequences", variable=self.overlay_var,
+                        command=self.draw).pack(side=tk.LEFT)
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(options, textvariable=self.status_var).pack(side=tk.RIGHT)
+        
+        self.fig = plt.Figure(figsize=(10, 6))
+        self.canvas = FigureCanvasTkAgg(self.fig, frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    
+    def exists(self):
+        """Check whether the window is still open."""
+        return self.window is not None
+    
+    def run(self, session, initial_head, direction, on_finish=None):
+        """Compare the algorithms of a session on a background thread, filling the table as they finish."""
+        self.results = []
+        self.disk_size = session.disk_size
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.on_finish = on_finish
+        self.status_var.set(f"Comparing from head {initial_head} ({direction})...")
+        self.refresh_table()
+        self.draw()
+        
+        events, cancelled = self.events, self.cancelled
+        def compare():
+            results = session.iter_results(initial_head, direction)
+            try:
+                for result in results:
+                    if cancelled.is_set():
+                        break
+                    events.put(("result", result))
+            except Exception as error:  # reported in the window instead of killing the thread silently
+                events.put(("error", error))
+            finally:
+                results.close()
+                events.put(("done",))
+        
+        threading.Thread(target=compare, daemon=True, name="comparison").start()
+        self.master.after(POLL_INTERVAL, self.poll)
+    
+    def poll(self):
+        """Show the results that arrived since the last poll."""
+        arrived = False
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "done":
+                self.finish()
+                return
+            if self.window is None:
+                # Closed: only wait for the thread to let go of the session
+                continue
+            if event[0] == "result":
+                self.results.append(event[1])
+                arrived = True
+            else:
+                messagebox.showerror("Comparison Error", str(event[1]), parent=self.window)
+        if arrived:
+            self.refresh_table()
+            self.draw()
+            self.status_var.set(f"{len(self.results)} of {len(algorithm_names())} algorithms compared...")
+        self.master.after(POLL_INTERVAL, self.poll)
+    
+    def sort_by(self, column):
+        """Rank the table by a column (the algorithm name ranks alphabetically)."""
+        if column != "rank":
+            self.sort_column = column
+            self.refresh_table()
+    
+    def ranked(self):
+        """Return the results ordered by the sort column, smallest first except IOPS."""
+        value = dict((column, value) for column, _, _, value in self.COLUMNS)[self.sort_column]
+        descending = self.sort_column == "iops"
+        known = [result for result in self.results if value(result) is not None]
+        unknown = [result for result in self.results if value(result) is None]
+        return sorted(known, key=value, reverse=descending) + unknown
+    
+    def refresh_table(self):
+        """Fill the table with the ranked results"""
+        self.table.delete(*self.table.get_children())
+        for rank, result in enumerate(self.ranked(), 1):
+            row = [rank]
+            for column, _, _, value in self.COLUMNS[1:]:
+                row.append(_format_cell(value(result)))
+            self.table.insert("", tk.END, values=row)
+    
+    def draw(self):
+        """Plot the sequences, ranked by total head movement"""
+        ordered = sorted(self.results, key=lambda result: result.total_movement)
+        plot_comparison(self.fig, ordered, self.disk_size, overlay=self.overlay_var.get())
+        if ordered:
+            self.fig.tight_layout()
+        self.canvas.draw_idle()
+    
+    def finish(self):
+        """Report the end of a comparison."""
+        if self.window is not None:
+            self.refresh_table()
+            self.draw()
+            self.status_var.set(f"{len(self.results)} algorithms compared")
+        if self.on_finish is not None:
+            self.on_finish()
+            self.on_finish = None
+    
+    def close(self):
+        """Stop the comparison and close the window."""
+        self.cancelled.set()
+        self.window.destroy()
+        self.window = None
+
+def _format_cell(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:,.1f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return value
@@ -0,0 +1,133 @@
+"""
+Incremental sweep schedules for interactive editing.
+
+A SCAN, C-SCAN, LOOK or C-LOOK schedule depends only on the sorted
+requests, and its total movement only on the first and last request of
+each leg (see _sweep_movement() in the algorithms module). IncrementalSweep
+keeps the requests in the online engine's PendingCylinders, so the leg
+endpoints, hence the total movement, are found in O(log n) after any edit
+or head move. Next to it, the requests are kept as a sorted list, which
+each edit updates with a bisection and a shift of the list's tail (a
+memory move, about 1 ms at 10^6 requests), so the full sequence, while
+still O(n) to produce, needs no sort. Memory grows with the requests, not
+with the disk size.
+
+Results are the same as DiskScheduler.run_algorithm() on the same requests.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from .algorithms import SWEEP_CONFIGS, _leg_iter, _orient_legs, _plan_sweep, _sweep_movement
+from .online import PendingCylinders
+
+
+class IncrementalSweep:
+    """Sweep schedules of a request multiset that changes one request at a time."""
+
+    def __init__(self, requests=(), disk_size=200, initial_head=0):
+        """
+        Index the requests.
+
+        Args:
+            requests (iterable): Disk requests (cylinder numbers)
+            disk_size (int): Total number of cylinders (default: 200)
+            initial_head (int): Initial position of disk head (default: 0)
+        """
+        self.disk_size = disk_size
+        self._values = sorted(self._check(cylinder) for cylinder in requests)
+        self._pending = PendingCylinders(self._values)
+        self.initial_head = self._check(initial_head)
+
+    def __len__(self):
+        return len(self._pending)
+
+    def count(self, cylinder):
+        """Number of requests for a cylinder."""
+        return self._pending.count(self._check(cylinder))
+
+    def add(self, cylinder, count=1):
+        """Add count requests for a cylinder."""
+        self._pending.add(self._check(cylinder), count)
+        if count == 1:
+            insort(self._values, cylinder)
+        else:
+            index = bisect_left(self._values, cylinder)
+            self._values[index:index] = [cylinder] * count
+
+    def remove(self, cylinder, count=1):
+        """
+        Remove count requests for a cylinder.
+
+        Raises:
+            ValueError: If the cylinder has fewer than count requests
+        """
+        self._pending.remove(self._check(cylinder), count)
+        index = bisect_left(self._values, cylinder)
+        del self._values[index:index + count]
+
+    def move_head(self, position):
+        """Move the initial head position."""
+        self.initial_head = self._check(position)
+
+    def requests(self):
+        """Return the requests in ascending order, in O(n)."""
+        return list(self._values)
+
+    def total_movement(self, algorithm_name, direction="Right"):
+        """
+        Compute the total head movement of a sweep in O(log n).
+
+        Args:
+            algorithm_name (str): "SCAN", "C-SCAN", "LOOK" or "C-LOOK"
+            direction (str): "Right" or "Left"
+
+        Returns:
+            int: Total head movement
+        """
+        circular, to_edge = self._config(algorithm_name)
+        pending = self._pending
+        head = self.initial_head
+        # Requests at the head belong to the leg swept first
+        upper = pending.successor(head if direction == "Right" else head + 1)
+        lower = pending.predecessor(head - 1 if direction == "Right" else head)
+        upper_ends = None if upper is None else (upper, pending.last())
+        lower_ends = None if lower is None else (pending.first(), lower)
+        first_ends, second_ends = _orient_legs(upper_ends, lower_ends, direction, circular)
+        return _sweep_movement(first_ends, second_ends, head, self.disk_size - 1,
+                               direction, circular, to_edge)[1]
+
+    def run(self, algorithm_name, direction="Right"):
+        """
+        Build the full schedule in O(n).
+
+        Returns:
+            tuple: (sequence of head movements, total head movement)
+        """
+        circular, to_edge = self._config(algorithm_name)
+        values = self._values
+        head = self.initial_head
+        if direction == "Right":
+            split = bisect_left(values, head)
+        else:
+            split = bisect_right(values, head)
+        first_leg, turn, second_leg, total_movement = _plan_sweep(
+            values, split, head, self.disk_size - 1, direction, circular, to_edge)
+
+        sequence = [head]
+        sequence.extend(_leg_iter(values, first_leg))
+        if turn is not None:
+            sequence.append(turn)
+        sequence.extend(_leg_iter(values, second_leg))
+        return sequence, total_movement
+
+    def _config(self, algorithm_name):
+        try:
+            return SWEEP_CONFIGS[algorithm_name]
+        except KeyError:
+            raise ValueError(f"{algorithm_name} cannot be updated incrementally, "
+                             f"expected one of {tuple(SWEEP_CONFIGS)}") from None
+
+    def _check(self, cylinder):
+        if not 0 <= cylinder < self.disk_size:
+            raise ValueError(f"Cylinder {cylinder} is outside the disk (0 to {self.disk_size - 1})")
+        return cylinder
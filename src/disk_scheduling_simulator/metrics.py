@@ -0,0 +1,267 @@
+"""
+Per-request latency and fairness metrics.
+
+A total head movement hides how the work is shared out: SSTF can keep the
+head busy near the middle of the disk while requests at the edges wait. The
+metrics here follow every request of a run: its seek distance, its
+position in service order and its wait, taken as the head travel (in
+cylinders) from the start of the run until the request is reached, with
+every request queued at the start as in DiskScheduler. Waits are also
+broken down by disk band, and requests that wait longer than a starvation
+limit are counted.
+
+Distributions are kept in QuantileSketch objects, whose memory depends on
+the range of the values rather than their number, so a report over a
+trace of any length needs no per-request arrays.
+"""
+
+import math
+from collections import namedtuple
+
+from .algorithms import DiskScheduler
+from .registry import algorithm_names, get_algorithm
+
+# Bands the disk is divided into for the per-band waits
+BANDS = 10
+
+Percentiles = namedtuple("Percentiles", ["count", "mean", "p50", "p95", "p99", "max"])
+
+MetricsReport = namedtuple("MetricsReport", [
+    "algorithm", "direction", "num_requests", "total_movement",
+    "seek", "wait", "starved", "starvation_limit", "band_waits",
+])
+
+
+class QuantileSketch:
+    """
+    Streaming quantiles of non-negative values with bounded relative error.
+
+    Values are counted in logarithmically spaced buckets (the DDSketch
+    scheme): any quantile is returned within relative_accuracy of a value
+    of the right rank, and sketches with the same accuracy can be merged.
+    Memory grows with log(max / min) instead of the number of values.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy (float): Maximum relative error of a quantile,
+                between 0 and 1 (default: 0.01)
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets = {}
+        self._zeros = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Add one value, which must not be negative."""
+        if value < 0:
+            raise ValueError("QuantileSketch only holds non-negative values")
+        if value == 0:
+            self._zeros += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+        if self.count == 0:
+            self.min = self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other):
+        """Add every value counted by another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative_accuracy can be merged")
+        if other.count == 0:
+            return
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zeros += other._zeros
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = other.max if self.count == 0 else max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self):
+        """Exact mean of the values (0.0 for an empty sketch)."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        """
+        Estimate a quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1 (0.5 for the median)
+
+        Returns:
+            float: The estimate (exact for q=0 and q=1), or None if the
+                sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if seen > rank:
+            return 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentiles(self):
+        """Summarize the sketch as Percentiles (count, mean, p50, p95, p99, max)."""
+        return Percentiles(self.count, self.mean, self.quantile(0.5), self.quantile(0.95),
+                           self.quantile(0.99), self.max)
+
+
+class MetricsCollector:
+    """Accumulate per-request metrics of one run into sketches."""
+
+    def __init__(self, disk_size, bands=BANDS, starvation_limit=None, relative_accuracy=0.01):
+        """
+        Initialize the collector.
+
+        Args:
+            disk_size (int): Total number of cylinders
+            bands (int): Equal-width disk bands to break waits down by
+                (default: BANDS)
+            starvation_limit (int): A request that waits for more head
+                travel than this is counted as starved (default: two full
+                strokes, the longest any SCAN-family sweep keeps a request
+                waiting)
+            relative_accuracy (float): Accuracy of the quantile sketches
+                (default: 0.01)
+        """
+        if bands < 1:
+            raise ValueError("bands must be at least 1")
+        self.disk_size = disk_size
+        self.bands = bands
+        self.starvation_limit = (starvation_limit if starvation_limit is not None
+                                 else 2 * (disk_size - 1))
+        self.seeks = QuantileSketch(relative_accuracy)
+        self.waits = QuantileSketch(relative_accuracy)
+        self.band_waits = [QuantileSketch(relative_accuracy) for _ in range(bands)]
+        self.starved = 0
+        self.total_movement = 0
+
+    def add(self, cylinder, seek, wait):
+        """
+        Record one served request.
+
+        Args:
+            cylinder (int): Cylinder of the request
+            seek (int): Head travel from the previous request to this one
+            wait (int): Head travel from the start of the run to this request
+        """
+        self.seeks.add(seek)
+        self.waits.add(wait)
+        self.band_waits[min(cylinder * self.bands // self.disk_size, self.bands - 1)].add(wait)
+        if wait > self.starvation_limit:
+            self.starved += 1
+        self.total_movement += seek
+
+    def report(self, algorithm=None, direction=None):
+        """
+        Summarize the requests recorded so far.
+
+        Args:
+            algorithm (str): Algorithm name to label the report with
+            direction (str): Direction to label the report with
+
+        Returns:
+            MetricsReport: Seek and wait Percentiles, the starved count and
+                one wait Percentiles per band (None for empty bands)
+        """
+        return MetricsReport(
+            algorithm=algorithm,
+            direction=direction,
+            num_requests=self.seeks.count,
+            total_movement=self.total_movement,
+            seek=self.seeks.percentiles(),
+            wait=self.waits.percentiles(),
+            starved=self.starved,
+            starvation_limit=self.starvation_limit,
+            band_waits=[band.percentiles() if band.count else None for band in self.band_waits],
+        )
+
+
+def collect_metrics(scheduler, algorithm_name, requests, direction="Right", **options):
+    """
+    Run one algorithm and measure every request it serves.
+
+    The run is streamed through DiskScheduler.iter_service(), so FCFS,
+    SSTF and the sweep algorithms are measured without keeping
+    per-request results.
+
+    Args:
+        scheduler (DiskScheduler): Scheduler to run the algorithm on
+        algorithm_name (str): Name of the algorithm to run
+        requests (iterable): Disk requests (cylinder numbers)
+        direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+        **options: MetricsCollector options (bands, starvation_limit,
+            relative_accuracy)
+
+    Returns:
+        MetricsReport: Metrics of the run
+    """
+    collector = MetricsCollector(scheduler.disk_size, **options)
+    add = collector.add
+    served = scheduler.iter_service(algorithm_name, requests, direction)
+    wait = 0
+    while True:
+        try:
+            _, cylinder, seek = next(served)
+        except StopIteration as stop:
+            # Travel after the last request, e.g. SCAN running on to the edge
+            collector.total_movement += stop.value or 0
+            break
+        wait += seek
+        add(cylinder, seek, wait)
+    directional = get_algorithm(algorithm_name).directional
+    return collector.report(algorithm_name, direction if directional else None)
+
+
+def metrics_report(requests, initial_head=0, direction="Right", disk_size=200,
+                   algorithms=None, backend="python", model=None, **options):
+    """
+    Measure the same requests under every algorithm.
+
+    Args:
+        requests (sequence): Disk requests (cylinder numbers)
+        initial_head (int): Initial head position (default: 0)
+        direction (str): Direction for SCAN/LOOK algorithms (default: "Right")
+        disk_size (int): Total number of cylinders (default: 200)
+        algorithms (list): Algorithms to measure (default: all registered)
+        backend (str): DiskScheduler backend (default: "python")
+        model (DiskModel): Disk model timing Deadline and SATF (default:
+            DiskModel())
+        **options: MetricsCollector options (bands, starvation_limit,
+            relative_accuracy)
+
+    Returns:
+        list: One MetricsReport per algorithm, in the order given
+    """
+    scheduler = DiskScheduler(disk_size, initial_head, backend, model=model)
+    return [collect_metrics(scheduler, algorithm, requests, direction, **options)
+            for algorithm in (algorithms or algorithm_names())]
@@ -0,0 +1,520 @@
+"""
+Online (event-driven) disk scheduling with requests arriving over time.
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque, namedtuple
+from itertools import chain, repeat
+
+from .algorithms import SWEEP_CONFIGS, _leg_iter, _plan_sweep
+
+ONLINE_ALGORITHMS = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK",
+                     "N-Step-SCAN", "FSCAN", "Deadline", "SATF")
+
+# Policies that serve frozen batches of requests with SCAN sweeps
+BATCH_ALGORITHMS = ("N-Step-SCAN", "FSCAN")
+
+# Cylinders per block of PendingCylinders, which holds up to twice as many
+_LOAD = 512
+
+OnlineResult = namedtuple("OnlineResult", [
+    "num_requests", "total_movement", "makespan", "throughput",
+    "mean_wait", "max_wait", "mean_response", "max_response",
+    "wait_times", "response_times", "seek_distances", "sequence",
+])
+
+
+class PendingCylinders:
+    """
+    Multiset of pending cylinders with O(log n) lookups, sized to the requests.
+
+    The distinct cylinders are kept sorted in blocks of at most 2 * _LOAD,
+    indexed by the last cylinder of each block, next to a count for each
+    cylinder requested more than once. Inserting or removing a cylinder
+    shifts one short block, and finding the nearest pending cylinder on
+    either side of the head takes two bisections, so the queue is never
+    re-sorted and memory grows with the distinct pending cylinders rather
+    than with the disk size. Iterating copies whole blocks and only looks
+    up the repeated cylinders.
+    """
+
+    def __init__(self, cylinders=()):
+        """
+        Index the initial pending cylinders.
+
+        Args:
+            cylinders (iterable): Pending cylinders, repeated once per request
+        """
+        counts = Counter(cylinders)
+        values = sorted(counts)
+        self.size = sum(counts.values())
+        self._repeats = {cylinder: count for cylinder, count in counts.items() if count > 1}
+        self._blocks = [values[i:i + _LOAD] for i in range(0, len(values), _LOAD)]
+        self._maxes = [block[-1] for block in self._blocks]
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Iterate over the pending cylinders in ascending order, with repeats."""
+        return chain.from_iterable(self._runs())
+
+    def count(self, cylinder):
+        """Number of pending requests at cylinder."""
+        repeats = self._repeats.get(cylinder)
+        if repeats:
+            return repeats
+        return 1 if self.successor(cylinder) == cylinder else 0
+
+    def add(self, cylinder, count=1):
+        """Add count pending requests at cylinder."""
+        current = self.count(cylinder)
+        self.size += count
+        if current + count > 1:
+            self._repeats[cylinder] = current + count
+        if current:
+            return
+        blocks, maxes = self._blocks, self._maxes
+        if not maxes:
+            blocks.append([cylinder])
+            maxes.append(cylinder)
+            return
+        i = bisect_left(maxes, cylinder)
+        if i == len(maxes):
+            i -= 1
+            block = blocks[i]
+            block.append(cylinder)
+            maxes[i] = cylinder
+        else:
+            block = blocks[i]
+            insort(block, cylinder)
+        if len(block) > 2 * _LOAD:
+            blocks[i:i + 1] = [block[:_LOAD], block[_LOAD:]]
+            maxes.insert(i, block[_LOAD - 1])
+
+    def remove(self, cylinder, count=1):
+        """
+        Remove count pending requests at cylinder.
+
+        Raises:
+            ValueError: If fewer than count requests are pending there
+        """
+        current = self.count(cylinder)
+        if current < count:
+            raise ValueError(f"Fewer than {count} requests pending at cylinder {cylinder}")
+        self.size -= count
+        if current - count > 1:
+            self._repeats[cylinder] = current - count
+            return
+        self._repeats.pop(cylinder, None)
+        if current > count:
+            return
+        i = bisect_left(self._maxes, cylinder)
+        block = self._blocks[i]
+        del block[bisect_left(block, cylinder)]
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def first(self):
+        """Lowest pending cylinder, or None."""
+        return self._blocks[0][0] if self._blocks else None
+
+    def last(self):
+        """Highest pending cylinder, or None."""
+        return self._maxes[-1] if self._maxes else None
+
+    def successor(self, cylinder):
+        """Lowest pending cylinder >= cylinder, or None."""
+        i = bisect_left(self._maxes, cylinder)
+        if i == len(self._maxes):
+            return None
+        block = self._blocks[i]
+        return block[bisect_left(block, cylinder)]
+
+    def predecessor(self, cylinder):
+        """Highest pending cylinder <= cylinder, or None."""
+        i = bisect_left(self._maxes, cylinder)
+        if i < len(self._maxes) and self._blocks[i][0] <= cylinder:
+            block = self._blocks[i]
+            return block[bisect_right(block, cylinder) - 1]
+        return self._maxes[i - 1] if i else None
+
+    def _runs(self):
+        """Yield runs of ascending cylinders that together make up the multiset."""
+        repeats = self._repeats
+        if not repeats:
+            yield from self._blocks
+            return
+        repeated = sorted(repeats)
+        k = 0
+        for block in self._blocks:
+            start = 0
+            while k < len(repeated) and repeated[k] <= block[-1]:
+                cylinder = repeated[k]
+                i = bisect_left(block, cylinder, start)
+                yield block[start:i + 1]
+                yield repeat(cylinder, repeats[cylinder] - 1)
+                start = i + 1
+                k += 1
+            yield block[start:] if start else block
+
+
+class OnlineScheduler:
+    """
+    Simulate a scheduling policy on requests that arrive over time.
+
+    Whenever the head becomes free, every request that has arrived by then
+    joins the pending queue and the policy picks the next one. Moving the
+    head costs time_per_cylinder per cylinder travelled and each request
+    then takes service_time to transfer; with a DiskModel, the model's seek
+    curve, rotational latency and transfer time are used instead. If
+    nothing is pending, the head idles until the next arrival.
+
+    Besides the six classic policies:
+        N-Step-SCAN: pending requests are cut into batches of step_size in
+            arrival order; each batch is frozen and served with a SCAN sweep
+        FSCAN: all pending requests form a frozen batch served with SCAN,
+            while new arrivals wait for the next batch
+        Deadline: a one-way elevator (like C-LOOK), except that once a
+            request's deadline (arrival + read_expiry or write_expiry) has
+            passed, the request with the earliest deadline is served first
+        SATF: the request with the shortest access time (seek plus
+            rotational wait) is served first; rotation is only known with a
+            DiskModel and per-request angles, otherwise SATF orders by seek
+            time like SSTF
+    """
+
+    def __init__(self, disk_size=200, initial_head=0, algorithm="SSTF", direction="Right",
+                 time_per_cylinder=0.1, service_time=1.0, step_size=16, read_expiry=500.0,
+                 write_expiry=5000.0, model=None):
+        """
+        Initialize the online scheduler.
+
+        Args:
+            disk_size (int): Total number of cylinders (default: 200)
+            initial_head (int): Initial position of disk head (default: 0)
+            algorithm (str): One of ONLINE_ALGORITHMS (default: "SSTF")
+            direction (str): Initial sweep direction ("Right" or "Left")
+            time_per_cylinder (float): Seek time per cylinder travelled
+            service_time (float): Time to service a request once reached
+            step_size (int): Batch size for N-Step-SCAN (default: 16)
+            read_expiry (float): Deadline of reads after arrival (default: 500.0)
+            write_expiry (float): Deadline of writes after arrival (default: 5000.0)
+            model (DiskModel): Physical disk model for timing, in ms
+                (default: None, use time_per_cylinder and service_time)
+        """
+        if algorithm not in ONLINE_ALGORITHMS:
+            raise ValueError(f"Algorithm {algorithm} not implemented")
+        if step_size < 1:
+            raise ValueError("step_size must be at least 1")
+        self.disk_size = disk_size
+        self.initial_head = initial_head
+        self.algorithm = algorithm
+        self.direction = direction
+        self.time_per_cylinder = time_per_cylinder
+        self.service_time = service_time
+        self.step_size = step_size
+        self.read_expiry = read_expiry
+        self.write_expiry = write_expiry
+        self.model = model
+
+    def run(self, arrivals, record_sequence=False):
+        """
+        Run the simulation.
+
+        Args:
+            arrivals (iterable): (timestamp, cylinder) pairs in non-decreasing
+                timestamp order; a third item marks writes (for Deadline)
+                and a fourth gives the request's angular position as a
+                fraction of a revolution (for timing with a DiskModel)
+            record_sequence (bool): Also return the initial head followed by
+                the serviced cylinders in order; batch policies also record
+                the disk edge where a sweep turns (default: False)
+
+        Returns:
+            OnlineResult: Summary statistics plus per-request wait and
+                response times (array('d')) and seek distances (array('l')),
+                all in arrival order; a seek distance includes the travel to
+                a sweep's turn that preceded the request
+        """
+        arrival_times = array("d")
+        cylinders = array("l")
+        writes = bytearray()
+        angles = array("d")
+        for arrival in arrivals:
+            timestamp, cylinder = arrival[0], arrival[1]
+            if arrival_times and timestamp < arrival_times[-1]:
+                raise ValueError("Arrivals must be sorted by timestamp")
+            if not 0 <= cylinder < self.disk_size:
+                raise ValueError(f"Request {cylinder} is outside the disk (0-{self.disk_size - 1})")
+            arrival_times.append(timestamp)
+            cylinders.append(cylinder)
+            writes.append(len(arrival) > 2 and bool(arrival[2]))
+            if len(arrival) > 3:
+                angles.append(arrival[3] % 1.0)
+            elif angles:
+                raise ValueError("Give an angle for every request or for none")
+        if angles and len(angles) != len(cylinders):
+            raise ValueError("Give an angle for every request or for none")
+
+        num_requests = len(cylinders)
+        wait_times = array("d", bytes(8 * num_requests))
+        response_times = array("d", bytes(8 * num_requests))
+        seek_distances = array("l", [0]) * num_requests
+        sequence = [self.initial_head] if record_sequence else None
+
+        self._pending = PendingCylinders()
+        self._fifo = deque()
+        self._by_cylinder = {}
+        self._heading_right = self.direction == "Right"
+        self._batch = deque()
+        self._deadlines = []
+        self._served = bytearray(num_requests)
+        self._writes = writes
+        self._angles = angles if angles else None
+
+        head = self.initial_head
+        clock = arrival_times[0] if num_requests else 0.0
+        total_movement = 0
+        next_arrival = 0
+        completed = 0
+
+        while completed < num_requests:
+            if self._is_empty():
+                clock = max(clock, arrival_times[next_arrival])
+            while next_arrival < num_requests and arrival_times[next_arrival] <= clock:
+                self._enqueue(next_arrival, cylinders[next_arrival], arrival_times[next_arrival])
+                next_arrival += 1
+
+            request_id, target, travel, via = self._pick(head, clock)
+            self._served[request_id] = 1
+            wait_times[request_id] = clock - arrival_times[request_id]
+            clock += self._duration(request_id, travel, clock)
+            response_times[request_id] = clock - arrival_times[request_id]
+            seek_distances[request_id] = travel
+            total_movement += travel
+            head = target
+            completed += 1
+            if record_sequence:
+                if via is not None:
+                    sequence.append(via)
+                sequence.append(head)
+
+        makespan = clock - arrival_times[0] if num_requests else 0.0
+        return OnlineResult(
+            num_requests=num_requests,
+            total_movement=total_movement,
+            makespan=makespan,
+            throughput=num_requests / makespan if makespan else 0.0,
+            mean_wait=sum(wait_times) / num_requests if num_requests else 0.0,
+            max_wait=max(wait_times, default=0.0),
+            mean_response=sum(response_times) / num_requests if num_requests else 0.0,
+            max_response=max(response_times, default=0.0),
+            wait_times=wait_times,
+            response_times=response_times,
+            seek_distances=seek_distances,
+            sequence=sequence,
+        )
+
+    def _duration(self, request_id, travel, clock):
+        """Time to move over travel cylinders and service a request starting at clock."""
+        model = self.model
+        if model is None:
+            return travel * self.time_per_cylinder + self.service_time
+        seek = model.seek_time(travel)
+        if self._angles is None:
+            rotation = model.rotational_latency
+        else:
+            rotation = self._rotational_wait(self._angles[request_id], clock + seek)
+        return seek + rotation + model.transfer_time(model.request_size)
+
+    def _rotational_wait(self, angle, clock):
+        """Wait until the sector at angle passes under the head, starting at clock (ms)."""
+        revolution = 60000.0 / self.model.rpm
+        return ((angle - clock / revolution) % 1.0) * revolution
+
+    def _is_empty(self):
+        if self.algorithm == "FCFS":
+            return not self._fifo
+        if self.algorithm in BATCH_ALGORITHMS:
+            return not self._fifo and not self._batch
+        return self._pending.size == 0
+
+    def _enqueue(self, request_id, cylinder, timestamp):
+        if self.algorithm == "FCFS" or self.algorithm in BATCH_ALGORITHMS:
+            self._fifo.append((request_id, cylinder))
+            return
+        queue = self._by_cylinder.get(cylinder)
+        if queue is None:
+            queue = self._by_cylinder[cylinder] = deque()
+        queue.append(request_id)
+        self._pending.add(cylinder)
+        if self.algorithm == "Deadline":
+            expiry = self.write_expiry if self._writes[request_id] else self.read_expiry
+            heapq.heappush(self._deadlines, (timestamp + expiry, request_id, cylinder))
+
+    def _take(self, cylinder):
+        """Remove and return the earliest pending request at cylinder."""
+        queue = self._by_cylinder[cylinder]
+        request_id = queue.popleft()
+        if not queue:
+            del self._by_cylinder[cylinder]
+        self._pending.remove(cylinder)
+        return request_id
+
+    def _take_request(self, request_id, cylinder):
+        """Remove a specific pending request, which need not be the earliest at its cylinder."""
+        queue = self._by_cylinder[cylinder]
+        if queue[0] == request_id:
+            return self._take(cylinder)
+        queue.remove(request_id)
+        self._pending.remove(cylinder)
+        return request_id
+
+    def _pick(self, head, clock):
+        """
+        Choose the next request.
+
+        Returns:
+            tuple: (request id, cylinder, cylinders travelled to reach it,
+                cylinder the head turned at on the way or None)
+        """
+        if self.algorithm == "FCFS":
+            request_id, cylinder = self._fifo.popleft()
+            return request_id, cylinder, abs(cylinder - head), None
+        if self.algorithm == "SSTF":
+            return self._pick_sstf(head) + (None,)
+        if self.algorithm in BATCH_ALGORITHMS:
+            return self._pick_batch(head)
+        if self.algorithm == "Deadline":
+            return self._pick_deadline(head, clock) + (None,)
+        if self.algorithm == "SATF":
+            return self._pick_satf(head, clock) + (None,)
+        return self._pick_sweep(head) + (None,)
+
+    def _pick_sstf(self, head):
+        pending = self._pending
+        left, right = pending.predecessor(head), pending.successor(head)
+        if left is None:
+            cylinder = right
+        elif right is None:
+            cylinder = left
+        elif head - left != right - head:
+            cylinder = left if head - left < right - head else right
+        else:
+            # Equal distance: serve whichever request arrived first
+            earlier_left = self._by_cylinder[left][0] < self._by_cylinder[right][0]
+            cylinder = left if earlier_left else right
+        return self._take(cylinder), cylinder, abs(cylinder - head)
+
+    def _pick_sweep(self, head):
+        circular, to_edge = SWEEP_CONFIGS[self.algorithm]
+        pending = self._pending
+        last_cylinder = self.disk_size - 1
+        travel = 0
+
+        cylinder = pending.successor(head) if self._heading_right else pending.predecessor(head)
+        if cylinder is None:
+            if circular and to_edge:
+                # C-SCAN: run to the end of the disk and return to the other end
+                if self._heading_right:
+                    travel = (last_cylinder - head) + last_cylinder
+                    head = 0
+                else:
+                    travel = head + last_cylinder
+                    head = last_cylinder
+            elif circular:
+                # C-LOOK: jump straight to the farthest pending request on the other side
+                cylinder = pending.successor(0) if self._heading_right else pending.predecessor(last_cylinder)
+                return self._take(cylinder), cylinder, abs(cylinder - head)
+            else:
+                if to_edge:
+                    edge = last_cylinder if self._heading_right else 0
+                    travel = abs(edge - head)
+                    head = edge
+                self._heading_right = not self._heading_right
+            cylinder = pending.successor(head) if self._heading_right else pending.predecessor(head)
+
+        travel += abs(cylinder - head)
+        return self._take(cylinder), cylinder, travel
+
+    def _pick_batch(self, head):
+        if not self._batch:
+            if self.algorithm == "FSCAN":
+                entries = list(self._fifo)
+                self._fifo.clear()
+            else:
+                entries = [self._fifo.popleft()
+                           for _ in range(min(self.step_size, len(self._fifo)))]
+            self._plan_batch(head, entries)
+        request_id, cylinder, via = self._batch.popleft()
+        if via is None:
+            return request_id, cylinder, abs(cylinder - head), None
+        return request_id, cylinder, abs(via - head) + abs(cylinder - via), via
+
+    def _plan_batch(self, head, entries):
+        """Lay out a frozen batch as a SCAN sweep with the offline sweep engine."""
+        entries.sort(key=lambda entry: (entry[1], entry[0]))
+        values = [cylinder for _, cylinder in entries]
+        if self._heading_right:
+            direction, split = "Right", bisect_left(values, head)
+        else:
+            direction, split = "Left", bisect_right(values, head)
+        first_leg, turn, second_leg, _ = _plan_sweep(
+            values, split, head, self.disk_size - 1, direction, circular=False, to_edge=True)
+
+        self._batch.extend((request_id, cylinder, None)
+                           for request_id, cylinder in _leg_iter(entries, first_leg))
+        second = list(_leg_iter(entries, second_leg))
+        if second:
+            # Only travel to the edge when the batch continues on the other side
+            request_id, cylinder = second[0]
+            self._batch.append((request_id, cylinder, turn))
+            self._batch.extend((request_id, cylinder, None) for request_id, cylinder in second[1:])
+            self._heading_right = not self._heading_right
+
+    def _pick_deadline(self, head, clock):
+        deadlines = self._deadlines
+        while self._served[deadlines[0][1]]:
+            heapq.heappop(deadlines)
+        deadline, request_id, cylinder = deadlines[0]
+        if deadline <= clock:
+            heapq.heappop(deadlines)
+            return self._take_request(request_id, cylinder), cylinder, abs(cylinder - head)
+
+        cylinder = self._pending.successor(head)
+        if cylinder is None:
+            cylinder = self._pending.successor(0)
+        return self._take(cylinder), cylinder, abs(cylinder - head)
+
+    def _pick_satf(self, head, clock):
+        if self.model is None or self._angles is None:
+            # Without rotational positions the access time grows with distance
+            return self._pick_sstf(head)
+
+        model = self.model
+        angles = self._angles
+        pending = self._pending
+        left, right = pending.predecessor(head), pending.successor(head)
+        best = (math.inf, -1, -1)
+        while left is not None or right is not None:
+            if right is None or (left is not None and head - left <= right - head):
+                cylinder, left = left, pending.predecessor(left - 1)
+            else:
+                cylinder, right = right, pending.successor(right + 1)
+            seek = model.seek_time(cylinder - head)
+            if seek >= best[0]:
+                # Every remaining cylinder is farther, so no access can be shorter
+                break
+            for request_id in self._by_cylinder[cylinder]:
+                access = seek + self._rotational_wait(angles[request_id], clock + seek)
+                if (access, request_id) < best[:2]:
+                    best = (access, request_id, cylinder)
+        _, request_id, cylinder = best
+        return self._take_request(request_id, cylinder), cylinder, abs(cylinder - head)
@@ -0,0 +1,132 @@
+"""
+Parallel execution of large scenario grids across processes.
+"""
+
+import os
+import random
+from array import array
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice, product
+from multiprocessing import shared_memory
+
+from .batch import BatchScheduler
+from .registry import algorithm_names
+
+GridResult = namedtuple(
+    "GridResult",
+    ["seed", "disk_size", "algorithm", "initial_head", "direction", "total_movement", "sequence"])
+
+# Per-process cache of prepared workloads, keyed by shared memory block name
+_worker_batches = {}
+_WORKER_CACHE_SIZE = 4
+
+
+def generate_workload(num_requests, disk_size, seed):
+    """
+    Generate a reproducible uniform random workload.
+
+    Args:
+        num_requests (int): Number of requests to generate
+        disk_size (int): Total number of cylinders
+        seed (int): Random seed
+
+    Returns:
+        array: Cylinder numbers as array('I')
+    """
+    rng = random.Random(seed)
+    return array("I", (rng.randrange(disk_size) for _ in range(num_requests)))
+
+
+def run_grid(num_requests, seeds, disk_sizes, initial_heads, directions=("Right", "Left"),
+             algorithms=None, max_workers=None, chunk_size=64, totals_only=True,
+             compact=False):
+    """
+    Run every combination of workload and scenario parameters in a process pool.
+
+    One workload is generated per (seed, disk size) and placed in shared
+    memory, so workers read the requests instead of receiving a pickled copy
+    with each task. Scenarios are sent in chunks that share a workload, and
+    results are yielded as soon as their chunk finishes; only a bounded
+    number of chunks are in flight at any time.
+
+    Args:
+        num_requests (int): Requests per generated workload
+        seeds (iterable): Workload seeds
+        disk_sizes (iterable): Disk sizes (cylinders)
+        initial_heads (iterable): Initial head positions; heads outside a
+            disk are skipped for that disk size
+        directions (iterable): Directions to run (default: both)
+        algorithms (iterable): Algorithm names (default: every registered
+            algorithm)
+        max_workers (int): Worker processes (default: CPU count)
+        chunk_size (int): Scenarios per task (default: 64)
+        totals_only (bool): Skip building sequences (default: True)
+        compact (bool): Return sequences as HeadSequence objects, which are
+            smaller to send back from the workers and to keep (default: False)
+
+    Yields:
+        GridResult: One row per scenario, in completion order
+    """
+    seeds, disk_sizes = list(seeds), list(disk_sizes)
+    initial_heads, directions = list(initial_heads), list(directions)
+    algorithms = algorithm_names() if algorithms is None else list(algorithms)
+
+    blocks = []
+    try:
+        workloads = []
+        for seed, disk_size in product(seeds, disk_sizes):
+            requests = generate_workload(num_requests, disk_size, seed)
+            size = len(requests) * requests.itemsize
+            block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            blocks.append(block)
+            block.buf[:size] = requests.tobytes()
+            workloads.append((block.name, len(requests), seed, disk_size))
+
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            tasks = _iter_tasks(workloads, initial_heads, directions, algorithms,
+                                chunk_size, totals_only, compact)
+            max_in_flight = 2 * max_workers
+            pending = {executor.submit(_run_chunk, *task) for task in islice(tasks, max_in_flight)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+                for task in islice(tasks, len(done)):
+                    pending.add(executor.submit(_run_chunk, *task))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _iter_tasks(workloads, initial_heads, directions, algorithms, chunk_size, totals_only,
+                compact):
+    """Yield task arguments, chunking the scenarios of each workload."""
+    for name, length, seed, disk_size in workloads:
+        scenarios = ((algorithm, head, direction)
+                     for head, direction, algorithm in product(initial_heads, directions, algorithms)
+                     if 0 <= head < disk_size)
+        while True:
+            chunk = list(islice(scenarios, chunk_size))
+            if not chunk:
+                break
+            yield name, length, seed, disk_size, chunk, totals_only, compact
+
+
+def _run_chunk(name, length, seed, disk_size, scenarios, totals_only, compact):
+    """Worker entry point: run a chunk of scenarios over a shared workload."""
+    batch = _worker_batches.get(name)
+    if batch is None:
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            requests = block.buf[:length * array("I").itemsize].cast("I").tolist()
+        finally:
+            block.close()
+        if len(_worker_batches) >= _WORKER_CACHE_SIZE:
+            _worker_batches.pop(next(iter(_worker_batches)))
+        batch = _worker_batches[name] = BatchScheduler(requests, disk_size, compact=compact)
+
+    return [GridResult(seed, disk_size, *batch.run(algorithm, head, direction, totals_only))
+            for algorithm, head, direction in scenarios]
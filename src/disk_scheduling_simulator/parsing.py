@@ -0,0 +1,195 @@
+"""
+Streaming parsers for request trace files.
+
+Text, CSV and JSONL traces are read in fixed-size chunks, so memory stays
+bounded no matter how large the file is. Integers are emitted in batches
+as array('q') and every malformed or out-of-range value is reported with
+its line number.
+"""
+
+import json
+import os
+import re
+from array import array
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+FORMATS = ("text", "csv", "jsonl")
+
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+_TEXT_DELIMITERS = re.compile(r"[\s,]+")
+_LAST_TEXT_DELIMITER = re.compile(r"[\s,][^\s,]*\Z")
+
+
+class RequestParseError(ValueError):
+    """Raised when a trace contains a malformed or out-of-range request."""
+
+    def __init__(self, line_number, message):
+        super().__init__(f"Line {line_number}: {message}")
+        self.line_number = line_number
+
+
+def detect_format(path):
+    """
+    Guess the trace format from a file name.
+
+    Args:
+        path (str): File path
+
+    Returns:
+        str: "csv", "jsonl" or "text"
+    """
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+def iter_request_batches(source, fmt=None, disk_size=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Parse a request trace incrementally.
+
+    Formats:
+        text: integers separated by whitespace and/or commas
+        csv: comma-separated records; without a header every field is a
+            request, while a non-numeric first line is a header and selects
+            the "cylinder" column (or the first column)
+        jsonl: one JSON value per line: an integer, a list of integers, or
+            an object with a "cylinder" key
+
+    Args:
+        source (str or file): Path, or an open text file
+        fmt (str): One of FORMATS (default: detected from the file name,
+            "text" for file objects)
+        disk_size (int): If given, requests must be in 0..disk_size-1
+        chunk_size (int): Characters read per chunk
+
+    Yields:
+        array: Batches of requests as array('q'), one per chunk read
+
+    Raises:
+        RequestParseError: On the first malformed or out-of-range value
+    """
+    if fmt is None:
+        fmt = detect_format(source) if isinstance(source, str) else "text"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown trace format {fmt!r}, expected one of {FORMATS}")
+
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as file:
+            yield from _parse(file, fmt, disk_size, chunk_size)
+    else:
+        yield from _parse(source, fmt, disk_size, chunk_size)
+
+
+def load_requests(source, fmt=None, disk_size=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Parse a whole request trace into one array.
+
+    Takes the same arguments as iter_request_batches().
+
+    Returns:
+        array: All requests as array('q')
+    """
+    requests = array("q")
+    for batch in iter_request_batches(source, fmt, disk_size, chunk_size):
+        requests.extend(batch)
+    return requests
+
+
+def _parse(file, fmt, disk_size, chunk_size):
+    parse_line = {"text": _parse_text_line, "csv": _CsvLineParser(), "jsonl": _parse_json_line}[fmt]
+    line_number = 1
+    leftover = ""
+
+    while True:
+        chunk = file.read(chunk_size)
+        data = leftover + chunk
+        if not chunk:
+            complete, leftover = data, ""
+        elif fmt == "text":
+            # Text traces may be one huge line, so cut at the last delimiter
+            match = _LAST_TEXT_DELIMITER.search(data)
+            cut = match.start() + 1 if match else 0
+            complete, leftover = data[:cut], data[cut:]
+        else:
+            cut = data.rfind("\n") + 1
+            complete, leftover = data[:cut], data[cut:]
+
+        batch = array("q")
+        lines = complete.split("\n")
+        for index, line in enumerate(lines):
+            for value in parse_line(line, line_number):
+                if disk_size is not None and not 0 <= value < disk_size:
+                    raise RequestParseError(
+                        line_number, f"request {value} is outside the disk (0-{disk_size - 1})")
+                try:
+                    batch.append(value)
+                except OverflowError:
+                    raise RequestParseError(
+                        line_number, f"request {value} does not fit in 64 bits") from None
+            if index < len(lines) - 1:
+                line_number += 1
+        if batch:
+            yield batch
+        if not chunk:
+            return
+
+
+def _parse_int(token, line_number):
+    try:
+        return int(token)
+    except ValueError:
+        raise RequestParseError(line_number, f"invalid request {token!r}") from None
+
+
+def _parse_text_line(line, line_number):
+    return [_parse_int(token, line_number) for token in _TEXT_DELIMITERS.split(line) if token]
+
+
+def _parse_json_line(line, line_number):
+    line = line.strip()
+    if not line:
+        return []
+    try:
+        value = json.loads(line)
+    except ValueError:
+        raise RequestParseError(line_number, "invalid JSON") from None
+    if isinstance(value, dict):
+        if "cylinder" not in value:
+            raise RequestParseError(line_number, "object has no 'cylinder' key")
+        value = value["cylinder"]
+    values = value if isinstance(value, list) else [value]
+    for item in values:
+        if not isinstance(item, int) or isinstance(item, bool):
+            raise RequestParseError(line_number, f"invalid request {item!r}")
+    return values
+
+
+class _CsvLineParser:
+    """Parse CSV lines, using the header row to pick a column if there is one."""
+
+    def __init__(self):
+        self.column = None
+        self.checked_header = False
+
+    def __call__(self, line, line_number):
+        line = line.strip()
+        if not line:
+            return []
+        fields = [field.strip() for field in line.split(",")]
+        if not self.checked_header:
+            self.checked_header = True
+            names = [field.strip('"').lower() for field in fields]
+            if not any(_is_int(name) for name in names):
+                self.column = names.index("cylinder") if "cylinder" in names else 0
+                return []
+        if self.column is None:
+            return [_parse_int(field, line_number) for field in fields if field]
+        if self.column >= len(fields):
+            raise RequestParseError(line_number, f"missing column {self.column + 1}")
+        return [_parse_int(fields[self.column], line_number)]
+
+
+def _is_int(token):
+    try:
+        int(token)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,289 @@
+"""
+Fast plotting of head movement sequences for the GUI.
+
+Plotting every step with markers and a label each freezes Tk after a few
+thousand requests. SequencePlot instead draws at most a few thousand
+points: long sequences are decimated bucket by bucket keeping each bucket's
+minimum and maximum, so every excursion of the head stays visible, and the
+line is a single path in a LineCollection. Only a bounded number of points
+are labelled. Zooming or panning re-decimates the visible steps, so detail
+returns as you zoom in, and results are redrawn by blitting the data over
+a cached background instead of redrawing the whole figure.
+
+plot_comparison() draws several algorithms' sequences the same way, either
+overlaid on one axes or as small multiples sharing their axes.
+
+Needs Matplotlib (and so NumPy); this module is only imported by the GUI.
+"""
+
+import math
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# Points drawn at most; by default two per pixel column of the axes, one
+# decimation bucket each, as more points look the same but draw slower
+MAX_POINTS = 4000
+# Points labelled with their cylinder at most
+MAX_LABELS = 30
+# Markers are drawn when no more than this many steps are visible
+MAX_MARKERS = 200
+# Points drawn at most per sequence of a comparison
+COMPARISON_POINTS = 1000
+
+
+def decimate(values, start, stop, max_points=MAX_POINTS):
+    """
+    Pick the steps to draw for values[start:stop].
+
+    When there are more than max_points steps, they are split into
+    max_points // 2 buckets and the minimum and maximum of each bucket are
+    kept, in step order. The first and last steps are always kept.
+
+    Args:
+        values (ndarray): Cylinder of every step
+        start (int): First step of the range
+        stop (int): End of the range (exclusive)
+        max_points (int): Upper bound on the steps returned
+
+    Returns:
+        ndarray: Increasing step indices into values
+    """
+    start = max(start, 0)
+    stop = min(stop, len(values))
+    count = stop - start
+    if count <= max_points:
+        return np.arange(start, stop)
+
+    buckets = max(max_points // 2 - 1, 1)
+    width = -(-count // buckets)
+    whole = count // width
+    window = values[start:start + whole * width].reshape(whole, width)
+    offsets = start + np.arange(whole) * width
+    low = offsets + window.argmin(axis=1)
+    high = offsets + window.argmax(axis=1)
+    picked = [np.minimum(low, high), np.maximum(low, high)]
+    if whole * width < count:
+        rest = values[start + whole * width:stop]
+        rest_offset = start + whole * width
+        picked.append(np.array([rest_offset + rest.argmin(), rest_offset + rest.argmax()]))
+    picked.append(np.array([start, stop - 1]))
+    return np.unique(np.concatenate(picked))
+
+
+def plot_comparison(fig, results, disk_size, overlay=False, max_points=COMPARISON_POINTS):
+    """
+    Draw the sequences of several algorithms on a figure, replacing its axes.
+
+    Args:
+        fig (Figure): Figure to draw on
+        results (list): Objects with algorithm, total_movement and sequence
+            attributes (e.g. ComparisonResult), in the order to draw them
+        disk_size (int): Total number of cylinders
+        overlay (bool): Draw every sequence on one axes instead of one
+            small plot each (default: False)
+        max_points (int): Points drawn at most per sequence
+            (default: COMPARISON_POINTS)
+
+    Returns:
+        list: The axes drawn on
+    """
+    fig.clear()
+    if not results:
+        return []
+    if overlay:
+        ax = fig.add_subplot(1, 1, 1)
+        axes = [ax] * len(results)
+    else:
+        columns = math.ceil(math.sqrt(len(results)))
+        rows = math.ceil(len(results) / columns)
+        grid = fig.subplots(rows, columns, sharex=True, sharey=True, squeeze=False)
+        axes = grid.ravel().tolist()
+        for ax in axes[len(results):]:
+            ax.set_visible(False)
+
+    for ax, result in zip(axes, results):
+        values = np.asarray(result.sequence, dtype=np.int64)
+        steps = decimate(values, 0, len(values), max_points)
+        label = f"{result.algorithm} ({result.total_movement:,})"
+        ax.plot(steps, values[steps], linewidth=1, label=label)
+        if not overlay:
+            ax.set_title(label, fontsize=9)
+    drawn = axes[:1] if overlay else axes[:len(results)]
+    for ax in drawn:
+        ax.set_ylim(-5, disk_size + 5)
+        ax.grid(True, linestyle='--', alpha=0.5)
+    if overlay:
+        drawn[0].set_xlabel('Time Step')
+        drawn[0].set_ylabel('Cylinder Position')
+        drawn[0].legend(fontsize=8)
+    return drawn
+
+
+class SequencePlot:
+    """Head movement plot on a Matplotlib Axes, drawn with blitting."""
+
+    def __init__(self, ax, max_points=None, max_labels=MAX_LABELS, max_markers=MAX_MARKERS):
+        """
+        Set up the plot's artists on ax.
+
+        Args:
+            ax (Axes): Axes to draw on
+            max_points (int): Points drawn at most (default: two per pixel
+                column of the axes, at most MAX_POINTS)
+            max_labels (int): Points labelled at most (default: MAX_LABELS)
+            max_markers (int): Draw markers up to this many visible steps
+                (default: MAX_MARKERS)
+        """
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.max_points = max_points
+        self.max_labels = max_labels
+        self.max_markers = max_markers
+        self.values = np.empty(0, dtype=np.int64)
+        self.disk_size = None
+        self._buffer = None
+        self._background = None
+        self._boundaries = []
+
+        ax.set_xlabel('Time Step')
+        ax.set_ylabel('Cylinder Position')
+        ax.set_title('Disk Head Movement Sequence')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+        # Data artists are animated: full redraws skip them and they are blitted on top
+        self.lines = LineCollection([], colors='b', linewidths=2, animated=True)
+        ax.add_collection(self.lines)
+        (self.markers,) = ax.plot([], [], 'bo', markersize=8, animated=True)
+        self.labels = [ax.annotate('', (0, 0), textcoords="offset points", xytext=(0, 10),
+                                   ha='center', fontsize=9, animated=True, visible=False)
+                       for _ in range(max_labels)]
+
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+
+    def show(self, sequence, disk_size, steps=None):
+        """
+        Plot a new sequence.
+
+        When the axes limits stay the same (same length and disk size), only
+        the data is blitted; otherwise the figure is redrawn once.
+
+        Args:
+            sequence (sequence): Head positions, starting with the initial head
+            disk_size (int): Total number of cylinders
+            steps (int): Steps to scale the x axis to, e.g. the final length
+                of a run still in progress (default: len(sequence))
+        """
+        self.values = np.asarray(sequence, dtype=np.int64)
+        steps = len(self.values) if steps is None else max(steps, len(self.values))
+        limits = (-0.5, max(steps - 0.5, 0.5))
+        if (self._background is not None and disk_size == self.disk_size
+                and self.ax.get_xlim() == limits):
+            self._refresh(*limits)
+            self.blit()
+            return
+        if disk_size != self.disk_size:
+            self.disk_size = disk_size
+            self._draw_boundaries()
+        self.ax.set_xlim(*limits)
+        self.ax.set_ylim(-5, disk_size + 5)
+        self._refresh(*limits)
+        self.canvas.draw_idle()
+
+    def extend(self, cylinders, start, disk_size, steps=None):
+        """
+        Replace the plotted steps from start on with cylinders, like show().
+
+        Meant for plotting a run in progress: only the new steps are
+        copied, into a buffer that grows geometrically, so each update
+        costs time proportional to the steps added rather than to the run.
+
+        Args:
+            cylinders (sequence): Head positions of steps start onwards
+            start (int): First step to replace; 0 starts a new sequence
+            disk_size (int): Total number of cylinders
+            steps (int): Steps to scale the x axis to (default: the new length)
+        """
+        start = min(start, len(self.values))
+        stop = start + len(cylinders)
+        buffer = self._buffer
+        if buffer is None or self.values.base is not buffer or stop > len(buffer):
+            size = 1024 if buffer is None else 2 * len(buffer)
+            grown = np.empty(max(stop, size), dtype=np.int64)
+            grown[:start] = self.values[:start]
+            self._buffer = buffer = grown
+        buffer[start:stop] = cylinders
+        self.show(buffer[:stop], disk_size, steps)
+
+    def visible_points(self):
+        """Return the (steps, cylinders) currently drawn."""
+        segments = self.lines.get_segments()
+        if not segments:
+            return np.asarray(self.markers.get_xdata()), np.asarray(self.markers.get_ydata())
+        return segments[0][:, 0], segments[0][:, 1]
+
+    def blit(self):
+        """Draw the data over the cached background."""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+
+    def _draw_boundaries(self):
+        for artist in self._boundaries:
+            artist.remove()
+        ax = self.ax
+        last = self.disk_size - 1
+        self._boundaries = [
+            ax.axhline(y=0, color='r', linestyle='--', alpha=0.5),
+            ax.axhline(y=last, color='r', linestyle='--', alpha=0.5),
+            ax.text(0, -3, '0', fontsize=9, ha='center',
+                    transform=ax.get_yaxis_transform()),
+            ax.text(0, self.disk_size + 2, f'{last}', fontsize=9, ha='center',
+                    transform=ax.get_yaxis_transform()),
+        ]
+
+    def _refresh(self, low, high):
+        """Re-decimate the steps between the x limits low and high."""
+        start = max(int(np.floor(low)), 0)
+        stop = min(int(np.ceil(high)) + 1, len(self.values))
+        max_points = self.max_points or min(2 * max(int(self.ax.bbox.width), 1), MAX_POINTS)
+        steps = decimate(self.values, start, stop, max_points)
+        cylinders = self.values[steps]
+        # One polyline renders much faster than a segment per step
+        self.lines.set_segments([np.column_stack((steps, cylinders)).astype(np.float64)]
+                                if len(steps) > 1 else [])
+
+        if stop - start <= self.max_markers:
+            self.markers.set_data(steps, cylinders)
+        else:
+            self.markers.set_data([], [])
+
+        # Label evenly spaced visible steps, all of them when few are visible
+        if len(steps) > self.max_labels:
+            steps = steps[np.linspace(0, len(steps) - 1, self.max_labels).round().astype(int)]
+        for label, step in zip(self.labels, steps.tolist()):
+            cylinder = int(self.values[step])
+            label.set_text(str(cylinder))
+            label.xy = (step, cylinder)
+            label.set_visible(True)
+        for label in self.labels[len(steps):]:
+            label.set_visible(False)
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.lines)
+        self.ax.draw_artist(self.markers)
+        for label in self.labels:
+            if label.get_visible():
+                self.ax.draw_artist(label)
+
+    def _on_xlim_changed(self, ax):
+        self._refresh(*ax.get_xlim())
+
+    def _on_draw(self, event):
+        """After a full redraw, cache the background and put the data back on top."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
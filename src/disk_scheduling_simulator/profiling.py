@@ -0,0 +1,310 @@
+"""
+Opt-in instrumentation of scheduler runs.
+
+Give DiskScheduler a Profiler to see where a run spends its time. Every
+run_algorithm() call becomes a phase named after the algorithm, with
+nested phases for its steps: converting the input, the cache lookup and,
+inside the built-in algorithms, sorting, partitioning at the head,
+planning the movement and building the sequence. For each phase the
+profiler records:
+
+- wall time, from time.perf_counter_ns()
+- net memory blocks allocated (sys.getallocatedblocks())
+- peak traced memory above the phase's starting point, when created with
+  trace_memory=True (tracemalloc is started for the profiler's with block)
+- comparisons made by sorts on the python backend, when created with
+  count_comparisons=True. Counting sorts with a key object, so time and
+  count comparisons in separate runs.
+
+Without a profiler the scheduler skips all of this: the steps of the
+algorithms are marked with Steps.mark() behind a check for None, so a
+disabled profiler costs a few comparisons per run.
+
+Results are available as aggregated PhaseStats, as a Chrome trace (load it
+in chrome://tracing or https://ui.perfetto.dev) and as folded stacks for
+flamegraph.pl or speedscope. A Profiler is not thread-safe; use one per
+thread.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+PhaseStats = namedtuple("PhaseStats", [
+    "path", "calls", "total_time", "max_time", "peak_memory", "blocks", "counters"])
+
+
+class Phase:
+    """One timed span of a profiled run; use through Profiler.phase()."""
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.path = None
+        self.start = None
+        self.duration = None
+        self.blocks = None
+        self.peak_memory = None
+        self.counters = {}
+        self.thread_id = threading.get_ident()
+        self._blocks = None
+        self._base_memory = None
+        self._peak = None
+
+    def count(self, name, value=1):
+        """Add value to a counter of this phase."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        self.path = _child_path(stack, self.name)
+        self._base_memory = self._peak = _open_memory(self.profiler, stack)
+        stack.append(self)
+        self._blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.duration = time.perf_counter_ns() - self.start
+        self.blocks = sys.getallocatedblocks() - self._blocks
+        stack = self.profiler._stack
+        stack.pop()
+        if self._base_memory is not None:
+            self.peak_memory = _close_memory(self.profiler, stack, self._base_memory, self._peak)
+        self.profiler.phases.append(self)
+        return False
+
+
+class Steps:
+    """
+    Consecutive phases of one function, each ended by a mark() call.
+
+    Cheaper than nesting Phase blocks in hot code, which only needs
+    `if steps: steps.mark(name)` when profiling may be disabled.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.count_comparisons = profiler.count_comparisons
+        self._begin()
+
+    def mark(self, name, **counters):
+        """End the current phase, naming it, and start the next one."""
+        end = time.perf_counter_ns()
+        stack = self.profiler._stack
+        phase = Phase(self.profiler, name, {})
+        phase.path = _child_path(stack, name)
+        phase.start = self._start
+        phase.duration = end - self._start
+        phase.blocks = sys.getallocatedblocks() - self._blocks
+        phase.counters = counters
+        if self._base_memory is not None:
+            phase.peak_memory = _close_memory(
+                self.profiler, stack, self._base_memory, self._base_memory)
+        self.profiler.phases.append(phase)
+        self._begin()
+
+    def _begin(self):
+        self._base_memory = _open_memory(self.profiler, self.profiler._stack)
+        self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter_ns()
+
+
+class Profiler:
+    """Collect phase timings, memory and counters of scheduler runs."""
+
+    def __init__(self, trace_memory=False, count_comparisons=False):
+        """
+        Initialize the profiler.
+
+        Args:
+            trace_memory (bool): Measure peak memory per phase with
+                tracemalloc while the profiler's with block runs; this
+                slows allocations down considerably (default: False)
+            count_comparisons (bool): Count the comparisons of sorts on the
+                python backend, which slows them down (default: False)
+        """
+        self.trace_memory = trace_memory
+        self.count_comparisons = count_comparisons
+        self.phases = []
+        self._stack = []
+        self._started_tracing = False
+        # Imported only when needed: it is a large part of the package's import time
+        self._tracemalloc = None
+        if trace_memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+
+    def __enter__(self):
+        tracemalloc = self._tracemalloc
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def phase(self, name, **args):
+        """
+        Open a phase, to be used as a context manager.
+
+        Args:
+            name (str): Phase name; nested phases are reported by path
+            **args: Values shown with the phase in the Chrome trace
+
+        Returns:
+            Phase: The phase, whose count() adds to its counters
+        """
+        return Phase(self, name, args)
+
+    def steps(self):
+        """
+        Start marking consecutive phases inside the current one.
+
+        Returns:
+            Steps: Call its mark(name, **counters) at the end of each phase
+        """
+        return Steps(self)
+
+    def clear(self):
+        """Forget every recorded phase."""
+        self.phases = []
+
+    def stats(self):
+        """
+        Aggregate the recorded phases by path.
+
+        Returns:
+            list: PhaseStats (path, calls, total_time, max_time, peak_memory,
+                blocks, counters) in order of first appearance, with times
+                in seconds, path as a "/"-joined string, peak_memory in
+                bytes (None without trace_memory), blocks as the net blocks
+                allocated and counters summed over calls
+        """
+        aggregated = OrderedDict()
+        for phase in sorted(self.phases, key=lambda phase: phase.start):
+            path = "/".join(phase.path)
+            entry = aggregated.get(path)
+            if entry is None:
+                entry = aggregated[path] = [0, 0, 0, None, 0, {}]
+            entry[0] += 1
+            entry[1] += phase.duration
+            entry[2] = max(entry[2], phase.duration)
+            if phase.peak_memory is not None:
+                entry[3] = max(entry[3] or 0, phase.peak_memory)
+            entry[4] += phase.blocks
+            for name, value in phase.counters.items():
+                entry[5][name] = entry[5].get(name, 0) + value
+        return [PhaseStats(path, calls, total / 1e9, longest / 1e9, peak, blocks, counters)
+                for path, (calls, total, longest, peak, blocks, counters) in aggregated.items()]
+
+    def chrome_trace(self):
+        """
+        Export the phases in the Chrome trace event format.
+
+        Returns:
+            dict: {"traceEvents": [...]} with one complete ("X") event per
+                phase, timestamps in microseconds
+        """
+        pid = os.getpid()
+        events = []
+        for phase in sorted(self.phases, key=lambda phase: phase.start):
+            args = dict(phase.args)
+            args.update(phase.counters)
+            args["blocks"] = phase.blocks
+            if phase.peak_memory is not None:
+                args["peak_memory"] = phase.peak_memory
+            events.append({
+                "name": phase.name, "cat": "disk_scheduling", "ph": "X",
+                "ts": phase.start / 1000, "dur": phase.duration / 1000,
+                "pid": pid, "tid": phase.thread_id, "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Write chrome_trace() as JSON to a file."""
+        import json
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file, default=str)
+
+    def folded(self):
+        """
+        Export the phases as folded stacks ("a;b;c microseconds" lines).
+
+        Each line holds the self time of a path, i.e. its time minus that
+        of its nested phases, as expected by flamegraph.pl and speedscope.
+
+        Returns:
+            list: Lines in order of first appearance
+        """
+        self_time = OrderedDict()
+        for phase in sorted(self.phases, key=lambda phase: phase.start):
+            self_time[phase.path] = self_time.get(phase.path, 0) + phase.duration
+            parent = phase.path[:-1]
+            if parent:
+                self_time[parent] = self_time.get(parent, 0) - phase.duration
+        return [f"{';'.join(path)} {max(duration // 1000, 0)}"
+                for path, duration in self_time.items()]
+
+
+def _child_path(stack, name):
+    return (stack[-1].path if stack else ()) + (name,)
+
+
+def _open_memory(profiler, stack):
+    """Start measuring a phase's peak; return the traced memory, or None if not tracing."""
+    tracemalloc = profiler._tracemalloc
+    if tracemalloc is None or not tracemalloc.is_tracing():
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    # Keep the enclosing phase's peak so far before the peak is reset
+    if stack and stack[-1]._peak is not None:
+        stack[-1]._peak = max(stack[-1]._peak, peak)
+    # tracemalloc.reset_peak() is new in Python 3.9; before that, peaks are
+    # measured since tracing started and can overstate a phase's own peak
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+    return current
+
+
+def _close_memory(profiler, stack, base_memory, peak):
+    """Return a phase's peak above base_memory and pass the peak on to the enclosing phase."""
+    tracemalloc = profiler._tracemalloc
+    if tracemalloc is None or not tracemalloc.is_tracing():
+        return None
+    peak = max(peak, tracemalloc.get_traced_memory()[1])
+    if stack and stack[-1]._peak is not None:
+        stack[-1]._peak = max(stack[-1]._peak, peak)
+    return peak - base_memory
+
+
+def counted_sort(values):
+    """
+    Sort a list in place like list.sort(), counting its comparisons.
+
+    Returns:
+        int: Number of comparisons made
+    """
+    comparisons = 0
+
+    class Key:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            nonlocal comparisons
+            comparisons += 1
+            return self.value < other.value
+
+    values.sort(key=Key)
+    return comparisons
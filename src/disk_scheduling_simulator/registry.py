@@ -0,0 +1,184 @@
+"""
+Registry of scheduling algorithms.
+
+Algorithms register themselves with the @register decorator, declaring
+what they support, and third-party packages can add their own through the
+"disk_scheduling_simulator.algorithms" entry point group. DiskScheduler,
+the GUI, the command-line runner and the benchmarks all list algorithms
+from here.
+
+A registered function is called as function(scheduler, requests, direction)
+and returns (sequence of head movements, total head movement), like the
+DiskScheduler methods it is usually defined as. Example plugin:
+
+    from disk_scheduling_simulator.registry import register
+
+    @register("REVERSE", description="Serves requests in reverse order.")
+    def reverse(scheduler, requests, direction):
+        sequence = [scheduler.initial_head] + requests[::-1]
+        return sequence, sum(abs(b - a) for a, b in zip(sequence, sequence[1:]))
+
+An algorithm can add cheaper paths for DiskScheduler.iter_moves(),
+iter_service() and service_time() (kind="moves") and for summarize()
+(kind="totals"), which it then advertises as streaming and totals_only:
+
+    @register("REVERSE", kind="moves")
+    def reverse_moves(scheduler, requests, direction):
+        return reversed(list(requests))
+
+    @register("REVERSE", kind="totals")
+    def reverse_totals(scheduler, requests, direction):
+        requests = list(requests)
+        if not requests:
+            return 0, 0, 0
+        total = abs(requests[-1] - scheduler.initial_head)
+        total += sum(abs(b - a) for a, b in zip(requests, requests[1:]))
+        return total, len(requests), len(requests)
+
+and in the plugin's setup.py:
+
+    entry_points={"disk_scheduling_simulator.algorithms": ["REVERSE = my_plugin:reverse"]}
+"""
+
+import warnings
+from collections import namedtuple
+
+ENTRY_POINT_GROUP = "disk_scheduling_simulator.algorithms"
+CAPABILITIES = ("directional", "streaming", "vectorized", "totals_only")
+KINDS = ("sequence", "moves", "totals")
+
+AlgorithmInfo = namedtuple("AlgorithmInfo", [
+    "name", "description", "directional", "streaming", "vectorized", "totals_only",
+    "function", "numpy_function", "moves_function", "totals_function",
+])
+
+_registry = {}
+_plugins_loaded = False
+
+
+def register(name, description="", directional=False, backend="python", kind="sequence"):
+    """
+    Decorator that registers a scheduling algorithm.
+
+    Registering a function for backend="numpy" adds a vectorized
+    implementation to an algorithm already registered under name. Without
+    one, the numpy backend runs the python implementation on a list.
+
+    Functions of kind "moves" and "totals" are likewise added to a
+    registered algorithm. Both are called with the requests as an iterable
+    of ints, or an ndarray with the numpy backend:
+        moves: returns an iterable of the cylinders visited after the
+            initial head, the same as the sequence function's sequence[1:],
+            without building the sequence first (sets streaming)
+        totals: returns (total movement, request count, head moves)
+            without building the sequence (sets totals_only)
+
+    Args:
+        name (str): Algorithm name shown to users
+        description (str): One-line description for the GUI and docs
+        directional (bool): The result depends on the direction argument
+        backend (str): "python" (default) or "numpy"
+        kind (str): One of KINDS (default: "sequence")
+
+    Returns:
+        callable: Decorator returning the function unchanged
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {KINDS}")
+
+    def decorator(function):
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Unknown backend {backend!r}")
+        if kind == "sequence" and backend == "python":
+            if name in _registry:
+                raise ValueError(f"Algorithm {name} is already registered")
+            _registry[name] = AlgorithmInfo(
+                name, description, directional, False, False, False, function, None, None, None)
+            return function
+
+        if name not in _registry:
+            raise ValueError(f"Register the python implementation of {name} first")
+        info = _registry[name]
+        if backend == "numpy":
+            if kind != "sequence":
+                raise ValueError(f"{kind} functions have no separate numpy implementation")
+            _registry[name] = info._replace(vectorized=True, numpy_function=function)
+        elif kind == "moves":
+            _registry[name] = info._replace(streaming=True, moves_function=function)
+        else:
+            _registry[name] = info._replace(totals_only=True, totals_function=function)
+        return function
+    return decorator
+
+
+def unregister(name):
+    """Remove an algorithm from the registry."""
+    del _registry[name]
+
+
+def get_algorithm(name):
+    """
+    Look up a registered algorithm.
+
+    Args:
+        name (str): Algorithm name
+
+    Returns:
+        AlgorithmInfo: Capabilities and implementations of the algorithm
+
+    Raises:
+        ValueError: If no algorithm of that name is registered
+    """
+    if name not in _registry:
+        load_plugins()
+    if name not in _registry:
+        raise ValueError(f"Algorithm {name} not implemented")
+    return _registry[name]
+
+
+def algorithm_names(**capabilities):
+    """
+    List registered algorithms in registration order.
+
+    Args:
+        **capabilities: Filters such as directional=True or vectorized=False
+
+    Returns:
+        list: Names of the matching algorithms
+    """
+    for capability in capabilities:
+        if capability not in CAPABILITIES:
+            raise ValueError(f"Unknown capability {capability!r}, expected one of {CAPABILITIES}")
+    load_plugins()
+    return [name for name, info in _registry.items()
+            if all(getattr(info, key) == value for key, value in capabilities.items())]
+
+
+def load_plugins():
+    """
+    Import algorithms advertised through the entry point group, once.
+
+    Importing a plugin runs its @register decorators. An entry point that
+    loads a plain function is registered under the entry point's name with
+    no capabilities. Plugins that fail to load are skipped with a warning.
+    """
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    for entry_point in _entry_points():
+        try:
+            function = entry_point.load()
+        except Exception as error:  # a broken plugin must not break the simulator
+            warnings.warn(f"Could not load algorithm plugin {entry_point.name!r}: {error}")
+            continue
+        if entry_point.name not in _registry and callable(function):
+            register(entry_point.name)(function)
+
+
+def _entry_points():
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=ENTRY_POINT_GROUP)
+    return entry_points.get(ENTRY_POINT_GROUP, [])
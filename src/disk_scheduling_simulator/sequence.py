@@ -0,0 +1,142 @@
+"""
+Compact head movement sequences.
+
+A list of Python ints costs 8 bytes per element for the reference plus,
+for every cylinder above 256, a 28-byte int object. HeadSequence stores
+the cylinders packed in an array('I') (4 bytes each, array('q') for values
+that do not fit) behind a read-only memoryview, so keeping thousands of
+results in memory costs a fraction as much. Slices are views of the same
+buffer, and NumPy reads it without copying through np.asarray().
+
+HeadSequence is an immutable collections.abc.Sequence that compares equal
+to lists and tuples with the same cylinders; tolist() gives a list when
+one is really needed.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .utils import _is_ndarray, _little_endian, _load_numpy
+
+# Longest sequence shown in full by repr()
+_REPR_ITEMS = 20
+
+
+class HeadSequence(Sequence):
+    """Immutable sequence of cylinders in a packed buffer."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values=()):
+        """
+        Pack cylinders.
+
+        Args:
+            values (iterable): Cylinders; another HeadSequence is shared
+                rather than copied
+        """
+        if isinstance(values, HeadSequence):
+            self._values = values._values
+            return
+        if _is_ndarray(values):
+            packed = _pack_ndarray(values)
+        else:
+            try:
+                packed = array("I", values)
+            except OverflowError:
+                # Negative or beyond 32 bits
+                packed = array("q", values)
+        self._values = memoryview(packed).toreadonly()
+
+    @classmethod
+    def _view(cls, values):
+        sequence = cls.__new__(cls)
+        sequence._values = values
+        return sequence
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self._values[index])
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __reversed__(self):
+        return iter(self._values[::-1])
+
+    def __contains__(self, value):
+        return value in self._values
+
+    def __eq__(self, other):
+        if isinstance(other, HeadSequence):
+            return self._values == other._values
+        if isinstance(other, (list, tuple, array)):
+            return len(self) == len(other) and self._values.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self.tolist() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.tolist()
+
+    def __repr__(self):
+        if len(self) <= _REPR_ITEMS:
+            return f"HeadSequence({self.tolist()!r})"
+        shown = ", ".join(map(str, self._values[:_REPR_ITEMS].tolist()))
+        return f"HeadSequence([{shown}, ...], len={len(self)})"
+
+    def __reduce__(self):
+        # Little-endian bytes pickle far smaller than a list of ints
+        packed = array(self._values.format, self._values.tobytes())
+        return _unpickle, (self._values.format, _little_endian(packed).tobytes())
+
+    def __array__(self, dtype=None, copy=None):
+        # A read-only view of the buffer, unless a copy or another dtype is
+        # asked for; copy=False with another dtype cannot be honoured
+        np = _load_numpy()
+        values = np.asarray(self._values)
+        if dtype is not None and values.dtype != np.dtype(dtype):
+            if copy is False:
+                raise ValueError(f"Cannot convert a HeadSequence of {values.dtype} "
+                                 f"to {np.dtype(dtype)} without copying")
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    @property
+    def buffer(self):
+        """Read-only memoryview of the cylinders, without copying."""
+        return self._values
+
+    @property
+    def nbytes(self):
+        """Bytes taken by the cylinders."""
+        return self._values.nbytes
+
+    def tolist(self):
+        """Return the cylinders as a new list of ints."""
+        return self._values.tolist()
+
+
+def _pack_ndarray(values):
+    np = _load_numpy()
+    values = np.asarray(values).ravel()
+    if values.size == 0 or (values.min() >= 0 and values.max() <= 0xFFFFFFFF):
+        packed = array("I")
+        packed.frombytes(values.astype(np.uint32).tobytes())
+    else:
+        packed = array("q")
+        packed.frombytes(values.astype(np.int64).tobytes())
+    return packed
+
+
+def _unpickle(typecode, data):
+    packed = array(typecode)
+    packed.frombytes(data)
+    return HeadSequence._view(memoryview(_little_endian(packed)).toreadonly())
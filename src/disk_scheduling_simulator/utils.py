@@ -2,6 +2,47 @@
 Utility functions for the disk scheduling simulator.
 """
 
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+# NumPy is optional and slow to import, so it is only loaded on first use
+np = None
+_numpy_missing = False
+
+# Binary trace layout (little-endian):
+#   header: magic, version, flags, request count, disk size, padding
+#   uint32 cylinder per request
+#   optional float64 timestamp per request, starting on an 8-byte boundary
+TRACE_MAGIC = b"DSTR"
+TRACE_VERSION = 1
+TRACE_EXTENSION = ".dtrace"
+TRACE_HEADER = struct.Struct("<4sHHQI4x")
+TRACE_HAS_TIMESTAMPS = 0x1
+TRACE_MAX_CYLINDER = 2 ** 32 - 1
+_TRACE_RANGE_ERROR = "Trace cylinders must be integers in 0..2**32-1"
+
+Trace = namedtuple("Trace", ["requests", "timestamps", "disk_size"])
+
+def _load_numpy():
+    """Import NumPy on first use, returning None if it is not installed."""
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+def _is_ndarray(value):
+    """Check for a NumPy array without importing NumPy if nothing else has."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
 def validate_requests(requests, disk_size):
     """
     Validate that all requests are within disk boundaries.
@@ -20,9 +61,115 @@ def calculate_total_movement(sequence):
     Calculate total head movement from a sequence of positions.
     
     Args:
-        sequence (list): Sequence of head positions
+        sequence (list): Sequence of head positions (a NumPy array is
+            handled with np.abs(np.diff()))
         
     Returns:
         int: Total head movement
     """
-    return sum(abs(sequence[i] - sequence[i-1]) for i in range(1, len(sequence)))
\ No newline at end of file
+    if _is_ndarray(sequence):
+        np = _load_numpy()
+        return int(np.abs(np.diff(sequence.astype(np.int64, copy=False))).sum())
+    return sum(abs(sequence[i] - sequence[i-1]) for i in range(1, len(sequence)))
+
+def write_trace(path, requests, timestamps=None, disk_size=0):
+    """
+    Write requests (and optional timestamps) to a binary trace file.
+    
+    Args:
+        path (str): Destination file path
+        requests (iterable): Cylinder numbers, each in 0..2**32-1
+        timestamps (iterable): Optional arrival time per request
+        disk_size (int): Disk size to record in the header (0 if unknown)
+    
+    Raises:
+        ValueError: If a cylinder is not an integer in 0..2**32-1, or the
+            timestamps do not match the requests
+    """
+    if _is_ndarray(requests):
+        # Casting would silently wrap negative and oversized values around
+        if len(requests) and (requests.dtype.kind not in "iu" or requests.min() < 0
+                              or requests.max() > TRACE_MAX_CYLINDER):
+            raise ValueError(_TRACE_RANGE_ERROR)
+        cylinders = _load_numpy().ascontiguousarray(requests, dtype="<u4").tobytes()
+    else:
+        try:
+            cylinders = _little_endian(array("I", requests)).tobytes()
+        except (OverflowError, TypeError):
+            raise ValueError(_TRACE_RANGE_ERROR) from None
+    count = len(cylinders) // 4
+    
+    times = None
+    if timestamps is not None:
+        times = _little_endian(array("d", timestamps)).tobytes()
+        if len(times) // 8 != count:
+            raise ValueError("timestamps must have one entry per request")
+    
+    with open(path, "wb") as file:
+        file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION,
+                                     TRACE_HAS_TIMESTAMPS if times is not None else 0,
+                                     count, disk_size))
+        file.write(cylinders)
+        if times is not None:
+            file.write(bytes(_timestamp_offset(count) - TRACE_HEADER.size - len(cylinders)))
+            file.write(times)
+
+def read_trace(path):
+    """
+    Memory-map a binary trace file written by write_trace().
+    
+    The returned arrays are views over the mapped file, so opening a trace
+    costs no heap memory and no copying: they are NumPy arrays when NumPy
+    is installed (ready for the numpy backend) and memoryviews otherwise.
+    
+    Args:
+        path (str): Trace file path
+        
+    Returns:
+        Trace: (requests, timestamps or None, disk_size)
+    """
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    if len(mapped) < TRACE_HEADER.size:
+        raise ValueError(f"{path} is not a disk trace file")
+    magic, version, flags, count, disk_size = TRACE_HEADER.unpack_from(mapped)
+    if magic != TRACE_MAGIC:
+        raise ValueError(f"{path} is not a disk trace file")
+    if version != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version {version}")
+    
+    has_timestamps = bool(flags & TRACE_HAS_TIMESTAMPS)
+    expected_size = TRACE_HEADER.size + 4 * count
+    if has_timestamps:
+        expected_size = _timestamp_offset(count) + 8 * count
+    if len(mapped) < expected_size:
+        raise ValueError(f"{path} is truncated")
+    
+    requests = _mapped_array(mapped, TRACE_HEADER.size, count, "I", "<u4")
+    timestamps = None
+    if has_timestamps:
+        timestamps = _mapped_array(mapped, _timestamp_offset(count), count, "d", "<f8")
+    return Trace(requests, timestamps, disk_size)
+
+def _timestamp_offset(count):
+    """Byte offset of the timestamp block, aligned to 8 bytes."""
+    end = TRACE_HEADER.size + 4 * count
+    return (end + 7) // 8 * 8
+
+def _little_endian(values):
+    """Byte-swap an array in place on big-endian hosts."""
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+def _mapped_array(mapped, offset, count, typecode, dtype):
+    """View count items of a memory-mapped file as an array without copying."""
+    np = _load_numpy()
+    if np is not None:
+        return np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+    view = memoryview(mapped)[offset:offset + count * struct.calcsize(typecode)]
+    if sys.byteorder != "little":
+        # memoryview casts are native-endian, so big-endian hosts need a copy
+        return _little_endian(array(typecode, view.tobytes()))
+    return view.cast(typecode)
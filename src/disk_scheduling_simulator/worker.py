@@ -0,0 +1,137 @@
+"""
+Background execution of simulations for the GUI.
+
+SimulationWorker runs an algorithm on a daemon thread, streaming it through
+DiskScheduler.iter_moves() so that progress can be reported and the run
+cancelled between chunks of steps. The worker never calls back into the
+GUI toolkit from its own thread: events are queued, and dispatch(), called
+periodically from the GUI thread (e.g. with Tk's root.after), delivers them
+to the callbacks there.
+
+FCFS, SSTF and the sweep algorithms report progress as they go; other
+algorithms run to completion before their first step is yielded, so they
+can only be cancelled once they finish computing.
+"""
+
+import queue
+import threading
+
+# Steps between progress reports and cancellation checks
+CHUNK_SIZE = 4096
+
+
+class SimulationWorker:
+    """Run one simulation on a background thread."""
+
+    def __init__(self, scheduler, algorithm_name, requests, direction="Right",
+                 on_progress=None, on_done=None, on_error=None, on_cancel=None,
+                 chunk_size=CHUNK_SIZE):
+        """
+        Prepare a run; call start() to begin it.
+
+        Callbacks are only ever called from dispatch():
+            on_progress(length, num_requests): the worker's sequence
+                holds at least length head positions so far; read them
+                from it (without modifying it) rather than copying it all
+            on_done(sequence, total_movement): the finished run
+            on_error(exception): the run raised
+            on_cancel(): the run stopped after cancel()
+
+        Args:
+            scheduler (DiskScheduler): Scheduler to run the algorithm on
+            algorithm_name (str): Name of the algorithm to run
+            requests (list): Disk requests (cylinder numbers)
+            direction (str): Direction for SCAN/LOOK algorithms ("Right" or "Left")
+            chunk_size (int): Steps between progress reports (default: CHUNK_SIZE)
+        """
+        self.scheduler = scheduler
+        self.algorithm_name = algorithm_name
+        self.requests = requests
+        self.direction = direction
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.chunk_size = chunk_size
+        self.sequence = []
+        self._events = queue.Queue()
+        self._cancelled = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"simulation-{algorithm_name}")
+
+    @property
+    def running(self):
+        """True until the final event (done, error or cancel) has been dispatched."""
+        return not self._finished
+
+    def start(self):
+        """Start the run on its thread."""
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the run to stop at its next chunk boundary."""
+        self._cancelled.set()
+
+    def join(self, timeout=None):
+        """Wait for the thread to finish (events still need dispatch())."""
+        self._thread.join(timeout)
+
+    def dispatch(self):
+        """
+        Deliver queued events to the callbacks in the calling thread.
+
+        Progress events are coalesced: only the latest is delivered, and
+        only as a length, so a poll costs O(1) however long the run.
+
+        Returns:
+            bool: True while the run has not finished
+        """
+        progress = None
+        while not self._finished:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "progress":
+                progress = event[1]
+                continue
+            self._finished = True
+            if kind == "done":
+                _call(self.on_done, event[1], event[2])
+            elif kind == "error":
+                _call(self.on_error, event[1])
+            else:
+                _call(self.on_cancel)
+            return False
+        if progress is not None:
+            _call(self.on_progress, progress, len(self.requests))
+        return not self._finished
+
+    def _run(self):
+        sequence = self.sequence
+        total_movement = 0
+        chunk_size = self.chunk_size
+        try:
+            moves = self.scheduler.iter_moves(self.algorithm_name, self.requests, self.direction)
+            for step, cylinder, seek in moves:
+                sequence.append(cylinder)
+                total_movement += seek
+                if step % chunk_size == 0:
+                    if self._cancelled.is_set():
+                        self._events.put(("cancelled",))
+                        return
+                    self._events.put(("progress", len(sequence)))
+        except Exception as error:  # reported to the GUI instead of killing the thread silently
+            self._events.put(("error", error))
+            return
+        if self._cancelled.is_set():
+            self._events.put(("cancelled",))
+        else:
+            self._events.put(("done", sequence, total_movement))
+
+
+def _call(callback, *args):
+    if callback is not None:
+        callback(*args)
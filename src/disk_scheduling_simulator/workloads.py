@@ -0,0 +1,172 @@
+"""
+Synthetic workload generators with realistic access patterns.
+
+All generators are vectorized with NumPy and seeded, so large benchmark
+workloads are fast to build and exactly reproducible. Each workload has
+uint32 cylinder requests, float64 arrival timestamps and a boolean
+write flag per request.
+
+Patterns:
+    uniform: every cylinder equally likely
+    zipf: Zipf-distributed popularity over a set of hot cylinders
+    sequential: runs of consecutive cylinders starting at random places
+    bursty: clustered requests arriving in bursts separated by idle gaps
+    mixed: reads with a Zipf hot set, writes as sequential (log-style) runs
+"""
+
+from collections import namedtuple
+
+from .utils import _load_numpy, write_trace
+
+PATTERNS = ("uniform", "zipf", "sequential", "bursty", "mixed")
+
+Workload = namedtuple("Workload", ["requests", "timestamps", "is_write"])
+
+
+def generate(pattern, num_requests, disk_size, seed=None, rate=1.0, write_fraction=0.0,
+             out=None, **params):
+    """
+    Generate a synthetic workload.
+
+    Args:
+        pattern (str): One of PATTERNS
+        num_requests (int): Number of requests
+        disk_size (int): Total number of cylinders
+        seed (int): Random seed (default: None for a fresh random state)
+        rate (float): Mean arrivals per time unit, inside bursts for
+            "bursty" (default: 1.0)
+        write_fraction (float): Share of writes (default: 0.0; "mixed"
+            uses 0.3 if not given)
+        out (ndarray): Optional uint32 array of length num_requests to fill
+            with the requests instead of allocating a new one
+        **params: Pattern options:
+            zipf: exponent (1.1), hot_cylinders (min(disk_size, 1024))
+            sequential: mean_run (64)
+            bursty: burst_size (256), spread (disk_size // 50), idle_factor
+                (10.0, mean idle gap in units of a burst's duration)
+            mixed: any of the zipf and sequential options
+
+    Returns:
+        Workload: (requests, timestamps, is_write)
+    """
+    np = _require_numpy()
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown workload pattern {pattern!r}, expected one of {PATTERNS}")
+    if disk_size <= 0:
+        raise ValueError("disk_size must be positive")
+    rng = np.random.default_rng(seed)
+
+    if pattern == "mixed" and not write_fraction:
+        write_fraction = 0.3
+    if write_fraction:
+        is_write = rng.random(num_requests) < write_fraction
+    else:
+        is_write = np.zeros(num_requests, dtype=bool)
+
+    if pattern == "uniform":
+        requests = rng.integers(0, disk_size, num_requests, dtype=np.uint32)
+    elif pattern == "zipf":
+        requests = _zipf(np, rng, num_requests, disk_size, **params)
+    elif pattern == "sequential":
+        requests = _sequential(np, rng, num_requests, disk_size, **params)
+    elif pattern == "bursty":
+        requests, timestamps = _bursty(np, rng, num_requests, disk_size, rate, **params)
+    else:
+        zipf_params = {k: v for k, v in params.items() if k in ("exponent", "hot_cylinders")}
+        run_params = {k: v for k, v in params.items() if k == "mean_run"}
+        requests = _zipf(np, rng, num_requests, disk_size, **zipf_params)
+        writes = int(np.count_nonzero(is_write))
+        requests[is_write] = _sequential(np, rng, writes, disk_size, **run_params)
+
+    if pattern != "bursty":
+        timestamps = np.cumsum(rng.exponential(1.0 / rate, num_requests))
+
+    if out is not None:
+        out[...] = requests
+        requests = out
+    return Workload(requests, timestamps, is_write)
+
+
+def write_workload(path, workload, disk_size):
+    """
+    Save a workload as a binary trace (requests and timestamps).
+
+    Args:
+        path (str): Destination file path
+        workload (Workload): Workload from generate()
+        disk_size (int): Disk size to record in the trace header
+    """
+    write_trace(path, workload.requests, workload.timestamps, disk_size)
+
+
+def _require_numpy():
+    np = _load_numpy()
+    if np is None:
+        raise ImportError("Workload generation requires NumPy to be installed")
+    return np
+
+
+def _zipf(np, rng, num_requests, disk_size, exponent=1.1, hot_cylinders=None):
+    """Zipf popularity over a random set of hot cylinders, sampled with an alias table."""
+    if hot_cylinders is None:
+        hot_cylinders = 1024
+    elif hot_cylinders <= 0:
+        raise ValueError("hot_cylinders must be positive")
+    count = min(disk_size, hot_cylinders)
+    weights = 1.0 / np.arange(1, count + 1, dtype=np.float64) ** exponent
+    accept, alias = _alias_table(np, weights)
+    ranks = rng.integers(0, count, num_requests)
+    ranks = np.where(rng.random(num_requests) < accept[ranks], ranks, alias[ranks])
+    hot = rng.choice(disk_size, size=count, replace=False).astype(np.uint32)
+    return hot[ranks]
+
+
+def _alias_table(np, weights):
+    """Build a Vose alias table for O(1) sampling from a discrete distribution."""
+    count = len(weights)
+    scaled = (weights * (count / weights.sum())).tolist()
+    accept = [1.0] * count
+    alias = list(range(count))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        accept[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    return np.array(accept), np.array(alias)
+
+
+def _sequential(np, rng, num_requests, disk_size, mean_run=64):
+    """Runs of consecutive cylinders with geometric lengths and random starts."""
+    if num_requests == 0:
+        return np.empty(0, dtype=np.uint32)
+    lengths = rng.geometric(1.0 / max(mean_run, 1), num_requests // max(mean_run, 1) + 1)
+    while lengths.sum() < num_requests:
+        lengths = np.concatenate((lengths, rng.geometric(1.0 / max(mean_run, 1), len(lengths))))
+    ends = np.cumsum(lengths)
+    runs = int(np.searchsorted(ends, num_requests)) + 1
+    lengths = lengths[:runs]
+    starts = rng.integers(0, disk_size, runs)
+    run_index = np.repeat(np.arange(runs), lengths)[:num_requests]
+    offsets = np.arange(num_requests) - np.repeat(ends[:runs] - lengths, lengths)[:num_requests]
+    return ((starts[run_index] + offsets) % disk_size).astype(np.uint32)
+
+
+def _bursty(np, rng, num_requests, disk_size, rate, burst_size=256, spread=None,
+            idle_factor=10.0):
+    """Bursts of requests around a random centre, separated by idle gaps."""
+    spread = max(spread if spread is not None else disk_size // 50, 1)
+    bursts = -(-num_requests // burst_size) if num_requests else 0
+    burst_index = np.arange(num_requests) // burst_size
+
+    centres = rng.integers(0, disk_size, bursts)
+    positions = np.rint(centres[burst_index] + rng.normal(0.0, spread, num_requests))
+    requests = np.clip(positions, 0, disk_size - 1).astype(np.uint32)
+
+    # Requests in a burst arrive at the given rate; bursts are separated by long gaps
+    gaps = rng.exponential(1.0 / rate, num_requests)
+    first_in_burst = np.arange(0, num_requests, burst_size)
+    gaps[first_in_burst] = rng.exponential(idle_factor * burst_size / rate, bursts)
+    return requests, np.cumsum(gaps)
@@ -2,9 +2,15 @@
 Tests for disk scheduling algorithms.
 """
 
+import random
 import unittest
 from src.disk_scheduling_simulator.algorithms import DiskScheduler
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class TestDiskSchedulingAlgorithms(unittest.TestCase):
     
     def setUp(self):
@@ -67,5 +73,156 @@ class TestDiskSchedulingAlgorithms(unittest.TestCase):
         if left_requests:
             self.assertEqual(sequence[-1], max(left_requests))
 
+    def test_sstf_exact_sequence(self):
+        sequence, total = self.scheduler.run_algorithm("SSTF", self.requests)
+        self.assertEqual(sequence, [50, 37, 14, 65, 67, 98, 122, 124, 183])
+        self.assertEqual(total, 205)
+    
+    def test_sstf_tie_prefers_earlier_request(self):
+        self.assertEqual(self.scheduler.run_algorithm("SSTF", [40, 60])[0], [50, 40, 60])
+        self.assertEqual(self.scheduler.run_algorithm("SSTF", [60, 40])[0], [50, 60, 40])
+    
+    def test_sstf_matches_linear_scan(self):
+        rng = random.Random(42)
+        for _ in range(200):
+            requests = [rng.randrange(40) for _ in range(rng.randint(0, 25))]
+            head = rng.randrange(40)
+            scheduler = DiskScheduler(disk_size=40, initial_head=head)
+            self.assertEqual(scheduler.run_algorithm("SSTF", requests),
+                             naive_sstf(head, requests))
+
+    def test_sweep_exact_sequences(self):
+        expected = {
+            ("SCAN", "Right"): ([50, 65, 67, 98, 122, 124, 183, 199, 37, 14], 334),
+            ("SCAN", "Left"): ([50, 37, 14, 0, 65, 67, 98, 122, 124, 183], 233),
+            ("C-SCAN", "Right"): ([50, 65, 67, 98, 122, 124, 183, 0, 14, 37], 385),
+            ("C-SCAN", "Left"): ([50, 37, 14, 199, 183, 124, 122, 98, 67, 65], 383),
+            ("LOOK", "Right"): ([50, 65, 67, 98, 122, 124, 183, 37, 14], 302),
+            ("LOOK", "Left"): ([50, 37, 14, 65, 67, 98, 122, 124, 183], 205),
+            ("C-LOOK", "Right"): ([50, 65, 67, 98, 122, 124, 183, 14, 14, 37], 325),
+            ("C-LOOK", "Left"): ([50, 37, 14, 183, 183, 124, 122, 98, 67, 65], 323),
+        }
+        for (algorithm, direction), result in expected.items():
+            with self.subTest(algorithm=algorithm, direction=direction):
+                self.assertEqual(
+                    self.scheduler.run_algorithm(algorithm, self.requests, direction), result)
+    
+    def test_sweep_movement_matches_sequence(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            requests = [rng.randrange(100) for _ in range(rng.randint(0, 20))]
+            scheduler = DiskScheduler(disk_size=100, initial_head=rng.randrange(100))
+            for algorithm in ("SCAN", "C-SCAN", "LOOK", "C-LOOK"):
+                for direction in ("Right", "Left"):
+                    sequence, total = scheduler.run_algorithm(algorithm, requests, direction)
+                    # C-SCAN counts the return sweep, which is not in the sequence
+                    if algorithm != "C-SCAN":
+                        self.assertEqual(total, sum(abs(b - a) for a, b in zip(sequence, sequence[1:])))
+    
+    def test_sweep_does_not_modify_input(self):
+        requests = list(self.requests)
+        self.scheduler.run_algorithm("SCAN", requests)
+        self.assertEqual(requests, self.requests)
+
+    def test_summarize_matches_run_algorithm(self):
+        rng = random.Random(9)
+        for _ in range(50):
+            requests = [rng.randrange(200) for _ in range(rng.randint(0, 20))]
+            scheduler = DiskScheduler(disk_size=200, initial_head=rng.randrange(200))
+            for algorithm in scheduler.algorithms:
+                for direction in ("Right", "Left"):
+                    sequence, total = scheduler.run_algorithm(algorithm, requests, direction)
+                    summary = scheduler.summarize(algorithm, iter(requests), direction)
+                    self.assertEqual(summary.total_movement, total)
+                    self.assertEqual(summary.num_moves, len(sequence) - 1)
+                    self.assertEqual(summary.num_requests, len(requests))
+    
+    def test_total_movement(self):
+        self.assertEqual(self.scheduler.total_movement("SCAN", self.requests), 334)
+        self.assertEqual(self.scheduler.total_movement("C-LOOK", self.requests, "Left"), 323)
+        summary = self.scheduler.summarize("FCFS", self.requests)
+        self.assertEqual(summary.average_seek, 643 / 8)
+
+    def test_iter_moves_matches_run_algorithm(self):
+        for algorithm in self.scheduler.algorithms:
+            for direction in ("Right", "Left"):
+                sequence, total = self.scheduler.run_algorithm(algorithm, self.requests, direction)
+                moves = list(self.scheduler.iter_moves(algorithm, self.requests, direction))
+                self.assertEqual([step for step, _, _ in moves], list(range(len(sequence))))
+                self.assertEqual([cylinder for _, cylinder, _ in moves], sequence)
+                self.assertEqual(sum(seek for _, _, seek in moves), total)
+    
+    def test_iter_moves_is_lazy(self):
+        def requests():
+            yield 60
+            raise AssertionError("FCFS read past the first request")
+        moves = self.scheduler.iter_moves("FCFS", requests())
+        self.assertEqual(next(moves), (0, 50, 0))
+        self.assertEqual(next(moves), (1, 60, 10))
+    
+    def test_iter_moves_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.iter_moves("RANDOM", self.requests)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+    
+    def setUp(self):
+        self.python = DiskScheduler(disk_size=200, initial_head=50)
+        self.numpy = DiskScheduler(disk_size=200, initial_head=50, backend="numpy")
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def test_matches_python_backend(self):
+        rng = random.Random(3)
+        cases = [self.requests, []] + [
+            [rng.randrange(200) for _ in range(rng.randint(1, 30))] for _ in range(50)]
+        for requests in cases:
+            for algorithm in self.python.algorithms:
+                for direction in ("Right", "Left"):
+                    expected = self.python.run_algorithm(algorithm, requests, direction)
+                    sequence, total = self.numpy.run_algorithm(
+                        algorithm, np.array(requests, dtype=np.uint32), direction)
+                    self.assertIsInstance(sequence, np.ndarray)
+                    self.assertEqual((sequence.tolist(), total), expected)
+    
+    def test_summarize_matches_python_backend(self):
+        requests = np.array(self.requests, dtype=np.uint32)
+        for algorithm in self.python.algorithms:
+            for direction in ("Right", "Left"):
+                self.assertEqual(self.numpy.summarize(algorithm, requests, direction),
+                                 self.python.summarize(algorithm, self.requests, direction))
+    
+    def test_iter_moves_yields_python_ints(self):
+        requests = np.array(self.requests, dtype=np.uint32)
+        for algorithm in self.python.algorithms:
+            moves = list(self.numpy.iter_moves(algorithm, requests))
+            self.assertEqual(moves, list(self.python.iter_moves(algorithm, self.requests)))
+            self.assertTrue(all(type(cylinder) is int for _, cylinder, _ in moves))
+    
+    def test_input_array_not_modified(self):
+        requests = np.array(self.requests)
+        self.numpy.run_algorithm("SCAN", requests)
+        self.assertEqual(requests.tolist(), self.requests)
+    
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            DiskScheduler(backend="fortran")
+
+
+def naive_sstf(head, requests):
+    """Reference SSTF using a linear min() scan over the pending list."""
+    pending = list(requests)
+    current = head
+    sequence = [current]
+    total = 0
+    while pending:
+        closest = min(pending, key=lambda x: abs(x - current))
+        total += abs(closest - current)
+        current = closest
+        sequence.append(current)
+        pending.remove(current)
+    return sequence, total
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Tests for batch scenario execution.
+"""
+
+import random
+import unittest
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import ALGORITHMS, BatchScheduler, compare, run_batch
+from src.disk_scheduling_simulator.registry import algorithm_names
+
+class TestBatch(unittest.TestCase):
+    
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def test_matches_run_algorithm(self):
+        rng = random.Random(11)
+        for _ in range(30):
+            requests = [rng.randrange(200) for _ in range(rng.randint(0, 25))]
+            batch = BatchScheduler(requests, disk_size=200)
+            for head in (0, rng.randrange(200), 199):
+                scheduler = DiskScheduler(disk_size=200, initial_head=head)
+                for algorithm in ALGORITHMS:
+                    for direction in ("Right", "Left"):
+                        expected = scheduler.run_algorithm(algorithm, requests, direction)
+                        result = batch.run(algorithm, head, direction)
+                        self.assertEqual((result.sequence, result.total_movement), expected)
+                        totals = batch.run(algorithm, head, direction, totals_only=True)
+                        self.assertIsNone(totals.sequence)
+                        self.assertEqual(totals.total_movement, expected[1])
+    
+    def test_run_batch_preserves_scenario_order(self):
+        scenarios = [("SCAN", 50, "Left"), ("FCFS", 10, "Right"), ("C-LOOK", 150, "Right")]
+        results = run_batch(self.requests, scenarios, totals_only=True)
+        self.assertEqual([(r.algorithm, r.initial_head, r.direction) for r in results], scenarios)
+    
+    def test_compare(self):
+        results = compare(self.requests, 50)
+        self.assertEqual([r.algorithm for r in results], algorithm_names())
+        self.assertEqual(results[0].total_movement, 643)
+        self.assertEqual(results[1].total_movement, 205)
+    
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            BatchScheduler(self.requests).run("RANDOM", 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for the memoized result cache.
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import BatchScheduler
+from src.disk_scheduling_simulator.cache import ResultCache, cache_key, fingerprint
+
+class TestResultCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint(self.requests), fingerprint(list(self.requests)))
+        self.assertNotEqual(fingerprint(self.requests), fingerprint(self.requests[::-1]))
+        self.assertNotEqual(fingerprint([1, 2]), fingerprint([1, 2, 0]))
+        if np is not None:
+            self.assertEqual(fingerprint(np.array(self.requests, dtype=np.uint32)),
+                             fingerprint(self.requests))
+    
+    def test_scheduler_reuses_results(self):
+        cache = ResultCache()
+        scheduler = DiskScheduler(200, 53, cache=cache)
+        first = scheduler.run_algorithm("SSTF", self.requests)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        second = scheduler.run_algorithm("SSTF", self.requests, "Left")
+        self.assertEqual(second, first)
+        self.assertEqual(cache.hits, 1)
+        # Results are copies, so callers cannot corrupt the cache
+        second[0].append(0)
+        self.assertEqual(scheduler.run_algorithm("SSTF", self.requests), first)
+        # Direction matters for sweeps, the head position for everything
+        scheduler.run_algorithm("SCAN", self.requests, "Right")
+        scheduler.run_algorithm("SCAN", self.requests, "Left")
+        DiskScheduler(200, 54, cache=cache).run_algorithm("SSTF", self.requests)
+        self.assertEqual(cache.misses, 4)
+        self.assertEqual(scheduler.cache_key("FCFS", self.requests, "Left"),
+                         scheduler.cache_key("FCFS", self.requests, "Right"))
+        self.assertNotEqual(scheduler.cache_key("SCAN", self.requests, "Left"),
+                            scheduler.cache_key("SCAN", self.requests, "Right"))
+    
+    def test_online_policies_key_on_step_size(self):
+        cache = ResultCache()
+        for step_size in (2, 4):
+            scheduler = DiskScheduler(200, 53, step_size=step_size, cache=cache)
+            self.assertEqual(scheduler.run_algorithm("N-Step-SCAN", self.requests),
+                             DiskScheduler(200, 53, step_size=step_size).run_algorithm(
+                                 "N-Step-SCAN", self.requests))
+        self.assertEqual(cache.hits, 0)
+    
+    def test_lru_eviction_by_size(self):
+        cache = ResultCache(max_bytes=3 * (128 + 8 * 9))
+        for head in range(4):
+            cache.put(cache_key("f", "FCFS", 200, head, None), [head] + self.requests, 0)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get(cache_key("f", "FCFS", 200, 0, None)))
+        cache.get(cache_key("f", "FCFS", 200, 1, None))
+        cache.put(cache_key("f", "FCFS", 200, 4, None), [4] + self.requests, 0)
+        self.assertIsNotNone(cache.get(cache_key("f", "FCFS", 200, 1, None)))
+        self.assertIsNone(cache.get(cache_key("f", "FCFS", 200, 2, None)))
+        self.assertLessEqual(cache.size, cache.max_bytes)
+    
+    def test_totals_only_entries(self):
+        cache = ResultCache()
+        key = cache_key("f", "LOOK", 200, 53, "Right")
+        cache.put(key, None, 299)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.get(key, need_sequence=False).total_movement, 299)
+        cache.put(key, [53, 65], 299)
+        cache.put(key, None, 299)
+        self.assertEqual(cache.get(key).sequence, [53, 65])
+        self.assertEqual(cache.get(key, need_sequence=False), (None, 299))
+    
+    def test_disk_store_survives_restarts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            DiskScheduler(200, 53, cache=ResultCache(directory=directory)).run_algorithm(
+                "C-LOOK", self.requests)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            cache = ResultCache(directory=directory)
+            result = DiskScheduler(200, 53, cache=cache).run_algorithm("C-LOOK", self.requests)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(result, DiskScheduler(200, 53).run_algorithm("C-LOOK", self.requests))
+    
+    def test_batch_scheduler_shares_cache(self):
+        cache = ResultCache()
+        batch = BatchScheduler(self.requests, cache=cache)
+        totals = batch.run("SCAN", 53, "Left", totals_only=True)
+        full = batch.run("SCAN", 53, "Left")
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(full.total_movement, totals.total_movement)
+        again = BatchScheduler(list(self.requests), cache=cache).run("SCAN", 53, "Left")
+        self.assertEqual(again, full)
+        self.assertEqual(DiskScheduler(200, 53, cache=cache).run_algorithm(
+            "SCAN", self.requests, "Left"), (full.sequence, full.total_movement))
+        self.assertEqual(cache.hits, 2)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        cache = ResultCache()
+        scheduler = DiskScheduler(200, 53, backend="numpy", cache=cache)
+        first = scheduler.run_algorithm("LOOK", np.array(self.requests))
+        second = scheduler.run_algorithm("LOOK", self.requests)
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue(np.array_equal(first[0], second[0]))
+        self.assertEqual(second[1], first[1])
+
+if __name__ == "__main__":
+    unittest.main()
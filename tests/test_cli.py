@@ -0,0 +1,86 @@
+"""
+Tests for the headless command-line runner.
+"""
+
+import csv
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.disk_scheduling_simulator.cli import main
+from src.disk_scheduling_simulator.registry import algorithm_names
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "..", "examples", "sample_requests.txt")
+
+class TestCli(unittest.TestCase):
+    
+    def setUp(self):
+        handle, self.output = tempfile.mkstemp()
+        os.close(handle)
+    
+    def tearDown(self):
+        os.remove(self.output)
+    
+    def test_csv_output(self):
+        status = main([SAMPLE, "--head", "50", "--direction", "both", "-o", self.output])
+        self.assertEqual(status, 0)
+        with open(self.output, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2 * len(algorithm_names()))
+        totals = {(row["algorithm"], row["direction"]): int(row["total_movement"]) for row in rows}
+        self.assertEqual(totals[("SSTF", "Right")], 205)
+        self.assertEqual(totals[("SCAN", "Left")], 233)
+    
+    def test_json_output_with_sequences(self):
+        main([SAMPLE, "--head", "50", "-a", "LOOK", "--sequences", "-f", "json", "-o", self.output])
+        with open(self.output) as file:
+            rows = json.load(file)
+        self.assertEqual(rows[0]["sequence"], [50, 65, 67, 98, 122, 124, 183, 37, 14])
+    
+    def test_generated_workloads_in_parallel(self):
+        main(["--generate", "100", "--seed", "1", "--seed", "2", "-j", "2",
+              "-a", "FCFS", "-f", "jsonl", "-o", self.output])
+        with open(self.output) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual([row["trace"] for row in rows], ["generated:seed=1", "generated:seed=2"])
+        self.assertTrue(all(row["num_requests"] == 100 for row in rows))
+    
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "NumPy is not installed")
+    def test_generated_pattern(self):
+        main(["--generate", "200", "--pattern", "zipf", "--disk-size", "1000",
+              "-a", "SSTF", "-f", "jsonl", "-o", self.output])
+        with open(self.output) as file:
+            row = json.loads(file.readline())
+        self.assertEqual(row["trace"], "generated:zipf:seed=0")
+        self.assertEqual(row["num_requests"], 200)
+    
+    def test_cache_directory_reuses_results(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            args = [SAMPLE, "--head", "50", "-a", "SSTF", "--sequences", "-f", "json",
+                    "--cache", cache_dir, "-o", self.output]
+            main(args)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            with open(self.output) as file:
+                first = json.load(file)
+            main(args)
+            with open(self.output) as file:
+                self.assertEqual(json.load(file), first)
+    
+    def test_invalid_trace_reports_error(self):
+        with open(self.output, "w") as file:
+            file.write("10 20\n300\n")
+        self.assertEqual(main([self.output, "-o", os.devnull]), 1)
+    
+    def test_does_not_import_gui_libraries(self):
+        code = ("import sys; import disk_scheduling_simulator.cli; "
+                "print(any(m.split('.')[0] in ('tkinter', 'matplotlib') for m in sys.modules))")
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        output = subprocess.run([sys.executable, "-c", code], cwd=src,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for the multi-algorithm comparison session.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.comparison import ComparisonSession, compare_algorithm
+from src.disk_scheduling_simulator.registry import algorithm_names, get_algorithm
+from src.disk_scheduling_simulator.utils import _load_numpy
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+class TestComparison(unittest.TestCase):
+
+    def test_compare_algorithm_matches_scheduler(self):
+        result = compare_algorithm(REQUESTS, 200, 53, "Left", "SCAN")
+        sequence, total_movement = DiskScheduler(200, 53).run_algorithm("SCAN", REQUESTS, "Left")
+        self.assertEqual(result.sequence, sequence)
+        self.assertEqual(result.total_movement, total_movement)
+        self.assertEqual(result.average_seek, total_movement / len(REQUESTS))
+        self.assertEqual(result.metrics.num_requests, len(REQUESTS))
+        self.assertEqual(result.metrics.total_movement, total_movement)
+        if _load_numpy() is None:
+            self.assertIsNone(result.service)
+        else:
+            self.assertEqual(result.service.num_requests, len(REQUESTS))
+            self.assertIsNone(result.service.latencies)
+
+    def test_run_ranks_every_algorithm(self):
+        with ComparisonSession(REQUESTS) as session:
+            results = session.run(53)
+        self.assertEqual(sorted(result.algorithm for result in results), sorted(algorithm_names()))
+        movements = [result.total_movement for result in results]
+        self.assertEqual(movements, sorted(movements))
+        for result in results:
+            expected = DiskScheduler(200, 53).run_algorithm(result.algorithm, REQUESTS)
+            self.assertEqual((result.sequence, result.total_movement), expected)
+
+    def test_direction_toggle_reuses_undirected_results(self):
+        with ComparisonSession(REQUESTS) as session:
+            first = {result.algorithm: result for result in session.run(53, "Right")}
+            toggled = {result.algorithm: result for result in session.run(53, "Left")}
+            for algorithm in algorithm_names():
+                reused = toggled[algorithm].sequence is first[algorithm].sequence
+                self.assertEqual(reused, not get_algorithm(algorithm).directional, algorithm)
+                self.assertEqual(toggled[algorithm].direction, "Left")
+            # Toggling back answers everything from memory
+            again = {result.algorithm: result for result in session.run(53, "Right")}
+            for algorithm in algorithm_names():
+                self.assertIs(again[algorithm].sequence, first[algorithm].sequence)
+            # A new head position is a new scenario
+            moved = {result.algorithm: result for result in session.run(100, "Right")}
+            self.assertIsNot(moved["FCFS"].sequence, first["FCFS"].sequence)
+            self.assertEqual(moved["FCFS"].sequence[0], 100)
+
+    def test_matches(self):
+        session = ComparisonSession(REQUESTS, 200)
+        self.assertTrue(session.matches(list(REQUESTS), 200))
+        self.assertFalse(session.matches(REQUESTS, 300))
+        self.assertFalse(session.matches(REQUESTS[:-1], 200))
+        session.close()
+
+    def test_parallel_matches_serial(self):
+        algorithms = ["FCFS", "SSTF", "C-LOOK", "Deadline"]
+        with ComparisonSession(REQUESTS, parallel_threshold=10 ** 9) as session:
+            serial = session.run(53, "Left", algorithms)
+        with ComparisonSession(REQUESTS, max_workers=2, parallel_threshold=0) as session:
+            self.assertTrue(session.parallel)
+            parallel = session.run(53, "Left", algorithms)
+            # The pool and the shared workload are kept for the next scenario
+            self.assertEqual(session.run(150, "Left", algorithms)[0].initial_head, 150)
+            self.assertIsNotNone(session._executor)
+        self.assertIsNone(session._executor)
+        self.assertIsNone(session._block)
+        self.assertEqual(parallel, serial)
+
+    def test_close_does_not_wait_for_runs(self):
+        session = ComparisonSession(REQUESTS * 10, max_workers=2, parallel_threshold=0)
+        session.start()
+        # The workers are already running
+        self.assertEqual(len(session._executor._processes), 2)
+        results = session.iter_results(53, "Right")
+        next(results)
+        futures = set(session._futures)
+        session.close()
+        self.assertTrue(all(future.cancelled() or future.running() or future.done()
+                            for future in futures))
+        self.assertEqual(session._futures, set())
+        self.assertIsNone(session._executor)
+        self.assertIsNone(session._block)
+        results.close()
+
+    def test_interpreter_exits_after_close(self):
+        # Closing while runs are in flight used to hang the interpreter at exit
+        code = ("from src.disk_scheduling_simulator.comparison import ComparisonSession\n"
+                f"session = ComparisonSession({REQUESTS * 10}, max_workers=2, parallel_threshold=0)\n"
+                "session.start()\n"
+                "results = session.iter_results(53, 'Right')\n"
+                "next(results)\n"
+                "session.close()\n"
+                "results.close()\n")
+        root = os.path.join(os.path.dirname(__file__), "..")
+        process = subprocess.run([sys.executable, "-c", code], cwd=root, timeout=60,
+                                 capture_output=True, text=True)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        self.assertEqual(process.stderr, "")
+
+if __name__ == '__main__':
+    unittest.main()
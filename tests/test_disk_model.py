@@ -0,0 +1,82 @@
+"""
+Tests for the physical disk model and service time estimates.
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import ALGORITHMS, rank_by_throughput
+from src.disk_scheduling_simulator.disk_model import DiskModel
+from src.disk_scheduling_simulator.registry import algorithm_names
+
+# Seeks cost one ms per cylinder and nothing else takes measurable time
+DISTANCE_MODEL = DiskModel(settle_time=0.0, seek_sqrt=0.0, seek_linear=1.0, rpm=3e12,
+                           transfer_rate=1e12)
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestDiskModel(unittest.TestCase):
+    
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def test_seek_time(self):
+        model = DiskModel(settle_time=1.0, seek_sqrt=0.5, seek_linear=0.01)
+        self.assertEqual(model.seek_time(0), 0.0)
+        self.assertAlmostEqual(model.seek_time(100), 1.0 + 5.0 + 1.0)
+        distances = np.array([0, 100, -100])
+        self.assertTrue(np.allclose(model.seek_time(distances), [0.0, 7.0, 7.0]))
+        self.assertAlmostEqual(DiskModel(rpm=6000).rotational_latency, 5.0)
+    
+    def test_from_specs_fits_datasheet_points(self):
+        model = DiskModel.from_specs(30001, track_to_track=0.8, average_seek=8.5, full_stroke=17.0)
+        self.assertAlmostEqual(model.seek_time(1), 0.8)
+        self.assertAlmostEqual(model.seek_time(10000), 8.5)
+        self.assertAlmostEqual(model.seek_time(30000), 17.0)
+    
+    def test_distance_model_matches_total_movement(self):
+        rng = random.Random(3)
+        for backend in ("python", "numpy"):
+            for _ in range(20):
+                requests = [rng.randrange(200) for _ in range(rng.randint(0, 20))]
+                scheduler = DiskScheduler(200, rng.randrange(200), backend, model=DISTANCE_MODEL)
+                for algorithm in ALGORITHMS:
+                    for direction in ("Right", "Left"):
+                        summary = scheduler.service_time(algorithm, requests, direction)
+                        expected = scheduler.total_movement(algorithm, requests, direction)
+                        self.assertAlmostEqual(summary.total_time, expected, places=3)
+                        self.assertEqual(summary.num_requests, len(requests))
+    
+    def test_latencies_follow_service_order(self):
+        model = DiskModel(settle_time=0.0, seek_sqrt=0.0, seek_linear=0.0, rpm=6000,
+                          transfer_rate=1.0)
+        scheduler = DiskScheduler(200, 50, model=model)
+        sizes = [1000 * (i + 1) for i in range(len(self.requests))]
+        summary = scheduler.service_time("SSTF", self.requests, sizes=sizes)
+        # SSTF from 50 serves 37, 14, 65, 67, 98, 122, 124, 183
+        served = [37, 14, 65, 67, 98, 122, 124, 183]
+        expected = [5.0 + sizes[self.requests.index(c)] / 1000.0 for c in served]
+        self.assertTrue(np.allclose(summary.latencies, expected))
+        self.assertAlmostEqual(summary.iops, 8 / (sum(expected) / 1000.0))
+        with self.assertRaises(ValueError):
+            scheduler.service_time("FCFS", self.requests, sizes=[4096])
+    
+    def test_scan_charges_edge_travel_to_next_request(self):
+        scheduler = DiskScheduler(200, 50, model=DISTANCE_MODEL)
+        summary = scheduler.service_time("SCAN", [60, 40])
+        self.assertTrue(np.allclose(summary.latencies, [10.0, 139.0 + 159.0]))
+    
+    def test_rank_by_throughput(self):
+        ranking = rank_by_throughput(self.requests, 50)
+        self.assertEqual(sorted(name for name, _ in ranking), sorted(algorithm_names()))
+        times = [summary.total_time for _, summary in ranking]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(ranking[-1][0], "FCFS")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the incremental sweep schedules.
+"""
+
+import random
+import unittest
+from src.disk_scheduling_simulator.algorithms import SWEEP_CONFIGS, DiskScheduler
+from src.disk_scheduling_simulator.incremental import IncrementalSweep
+
+class TestIncrementalSweep(unittest.TestCase):
+    
+    def assert_matches_scheduler(self, sweep, requests):
+        for algorithm in SWEEP_CONFIGS:
+            for direction in ("Right", "Left"):
+                with self.subTest(algorithm=algorithm, direction=direction):
+                    scheduler = DiskScheduler(sweep.disk_size, sweep.initial_head)
+                    expected = scheduler.run_algorithm(algorithm, requests, direction)
+                    self.assertEqual(sweep.total_movement(algorithm, direction), expected[1])
+                    self.assertEqual(sweep.run(algorithm, direction), expected)
+    
+    def test_textbook_example(self):
+        requests = [98, 183, 37, 122, 14, 124, 65, 67]
+        sweep = IncrementalSweep(requests, 200, 53)
+        self.assertEqual(len(sweep), 8)
+        self.assertEqual(sweep.requests(), sorted(requests))
+        self.assertEqual(sweep.total_movement("SCAN", "Left"), 236)
+        self.assertEqual(sweep.total_movement("LOOK", "Right"), 299)
+        self.assert_matches_scheduler(sweep, requests)
+    
+    def test_edits_and_head_moves(self):
+        rng = random.Random(7)
+        requests = [rng.randrange(500) for _ in range(40)]
+        sweep = IncrementalSweep(requests, 500, 250)
+        for _ in range(30):
+            choice = rng.random()
+            if choice < 0.4:
+                cylinder = rng.randrange(500)
+                sweep.add(cylinder)
+                requests.append(cylinder)
+            elif choice < 0.8 and requests:
+                cylinder = rng.choice(requests)
+                sweep.remove(cylinder)
+                requests.remove(cylinder)
+            else:
+                sweep.move_head(rng.randrange(500))
+            self.assert_matches_scheduler(sweep, requests)
+    
+    def test_empty_and_duplicates(self):
+        sweep = IncrementalSweep([], 200, 100)
+        self.assert_matches_scheduler(sweep, [])
+        sweep.add(100, 3)
+        sweep.add(0)
+        sweep.add(199)
+        self.assertEqual(sweep.count(100), 3)
+        self.assert_matches_scheduler(sweep, [100, 100, 100, 0, 199])
+        sweep.remove(100, 3)
+        self.assertEqual(sweep.requests(), [0, 199])
+    
+    def test_huge_disk(self):
+        # Nothing is sized to the disk, so this is as cheap as a small disk
+        requests = [5, 10 ** 12 - 1, 3 * 10 ** 11]
+        sweep = IncrementalSweep(requests, 10 ** 12, 10 ** 11)
+        self.assert_matches_scheduler(sweep, requests)
+    
+    def test_invalid_edits(self):
+        sweep = IncrementalSweep([10], 200, 0)
+        with self.assertRaises(ValueError):
+            sweep.remove(11)
+        with self.assertRaises(ValueError):
+            sweep.remove(10, 2)
+        with self.assertRaises(ValueError):
+            sweep.add(200)
+        with self.assertRaises(ValueError):
+            sweep.move_head(-1)
+        with self.assertRaises(ValueError):
+            sweep.total_movement("SSTF")
+        self.assertEqual(sweep.requests(), [10])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests for the per-request latency and fairness metrics.
+"""
+
+import random
+import unittest
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.metrics import (
+    MetricsCollector, QuantileSketch, collect_metrics, metrics_report)
+from src.disk_scheduling_simulator.registry import algorithm_names
+
+class TestQuantileSketch(unittest.TestCase):
+    
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(3)
+        values = sorted(rng.randrange(1, 10 ** 6) for _ in range(20000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0.1, 0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * exact)
+        self.assertEqual(sketch.quantile(0), values[0])
+        self.assertEqual(sketch.quantile(1), values[-1])
+        self.assertAlmostEqual(sketch.mean, sum(values) / len(values))
+    
+    def test_zeros_and_empty(self):
+        sketch = QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        for value in (0, 0, 0, 10):
+            sketch.add(value)
+        self.assertEqual(sketch.quantile(0.5), 0)
+        self.assertEqual(sketch.percentiles().max, 10)
+        with self.assertRaises(ValueError):
+            sketch.add(-1)
+    
+    def test_merge_matches_single_sketch(self):
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 1001):
+            whole.add(value)
+            (left if value % 3 else right).add(value)
+        left.merge(right)
+        self.assertEqual(left.percentiles(), whole.percentiles())
+        with self.assertRaises(ValueError):
+            left.merge(QuantileSketch(relative_accuracy=0.05))
+
+class TestMetrics(unittest.TestCase):
+    
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+        self.scheduler = DiskScheduler(disk_size=200, initial_head=53)
+    
+    def test_iter_service_charges_turns_to_next_request(self):
+        served = list(self.scheduler.iter_service("SCAN", self.requests, "Left"))
+        self.assertEqual(served[:3], [(1, 37, 16), (2, 14, 23), (3, 65, 14 + 65)])
+        self.assertEqual([position for position, _, _ in served], list(range(1, 9)))
+    
+    def test_iter_service_covers_every_algorithm(self):
+        for backend in ("python", "numpy"):
+            try:
+                scheduler = DiskScheduler(200, 53, backend)
+            except ImportError:
+                continue
+            for algorithm in algorithm_names():
+                for direction in ("Right", "Left"):
+                    with self.subTest(backend=backend, algorithm=algorithm, direction=direction):
+                        served = list(scheduler.iter_service(algorithm, self.requests, direction))
+                        _, total_movement = scheduler.run_algorithm(
+                            algorithm, self.requests, direction)
+                        self.assertEqual(sorted(c for _, c, _ in served), sorted(self.requests))
+                        self.assertEqual(sum(seek for _, _, seek in served), total_movement)
+    
+    def test_report_total_matches_run_algorithm(self):
+        # From head 10 every request is on one side, so sweeps end with a turn
+        for head in (0, 10, 53, 199):
+            scheduler = DiskScheduler(disk_size=200, initial_head=head)
+            for algorithm in algorithm_names():
+                for direction in ("Right", "Left"):
+                    with self.subTest(head=head, algorithm=algorithm, direction=direction):
+                        report = collect_metrics(scheduler, algorithm, self.requests, direction)
+                        _, total_movement = scheduler.run_algorithm(
+                            algorithm, self.requests, direction)
+                        self.assertEqual(report.total_movement, total_movement)
+        scheduler = DiskScheduler(disk_size=200, initial_head=10)
+        self.assertEqual(collect_metrics(scheduler, "SCAN", self.requests).total_movement, 189)
+        self.assertEqual(collect_metrics(scheduler, "C-SCAN", self.requests).total_movement, 388)
+    
+    def test_fcfs_report(self):
+        report = collect_metrics(self.scheduler, "FCFS", self.requests)
+        self.assertIsNone(report.direction)
+        self.assertEqual(report.num_requests, 8)
+        self.assertEqual(report.total_movement, 640)
+        self.assertEqual(report.seek.max, 146)
+        self.assertEqual(report.wait.max, 640)
+        # Waits past two full strokes (398 cylinders): 14, 124, 65 and 67
+        self.assertEqual(report.starvation_limit, 398)
+        self.assertEqual(report.starved, 4)
+    
+    def test_band_waits(self):
+        report = collect_metrics(self.scheduler, "SSTF", self.requests, bands=2)
+        low, high = report.band_waits
+        self.assertEqual(low.count, 5)
+        self.assertEqual(high.count, 3)
+        # SSTF clears the lower half first; the upper half waits for the trip back
+        self.assertEqual(low.max, 151)
+        self.assertEqual(high.max, 236)
+        report = collect_metrics(self.scheduler, "LOOK", [10], bands=4)
+        self.assertEqual([band is None for band in report.band_waits], [False, True, True, True])
+    
+    def test_starvation_limit(self):
+        report = collect_metrics(self.scheduler, "SSTF", self.requests, starvation_limit=160)
+        # 98 (wait 151) is reached in time; 122, 124 and 183 are not
+        self.assertEqual(report.starved, 3)
+    
+    def test_metrics_report_covers_every_algorithm(self):
+        reports = metrics_report(self.requests, initial_head=53)
+        self.assertEqual([report.algorithm for report in reports], algorithm_names())
+        for report in reports:
+            self.assertEqual(report.wait.max, report.total_movement)
+    
+    def test_collector_rejects_bad_bands(self):
+        with self.assertRaises(ValueError):
+            MetricsCollector(200, bands=0)
+
+if __name__ == "__main__":
+    unittest.main()
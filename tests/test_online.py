@@ -0,0 +1,162 @@
+"""
+Tests for the online (event-driven) scheduler.
+"""
+
+import random
+import unittest
+from unittest import mock
+from src.disk_scheduling_simulator import online
+from src.disk_scheduling_simulator.algorithms import ONLINE_POLICIES, DiskScheduler
+from src.disk_scheduling_simulator.disk_model import DiskModel
+from src.disk_scheduling_simulator.online import OnlineScheduler, PendingCylinders
+
+class TestPendingCylinders(unittest.TestCase):
+    
+    def test_neighbours(self):
+        pending = PendingCylinders()
+        for cylinder in (14, 98, 98, 183):
+            pending.add(cylinder)
+        self.assertEqual(pending.size, 4)
+        self.assertEqual(pending.successor(50), 98)
+        self.assertEqual(pending.predecessor(50), 14)
+        self.assertEqual(pending.successor(98), 98)
+        self.assertIsNone(pending.successor(184))
+        self.assertIsNone(pending.predecessor(13))
+        pending.remove(98)
+        self.assertEqual(pending.successor(50), 98)
+        pending.remove(98)
+        self.assertEqual(pending.successor(50), 183)
+        with self.assertRaises(ValueError):
+            pending.remove(98)
+    
+    def test_matches_sorted_list(self):
+        rng = random.Random(7)
+        # Small blocks exercise splitting and dropping blocks
+        with mock.patch.object(online, "_LOAD", 2):
+            pending = PendingCylinders(rng.randrange(10 ** 9) for _ in range(20))
+            reference = sorted(pending)
+            for step in range(2000):
+                count = rng.choice((1, 1, 2))
+                if reference and rng.random() < 0.45:
+                    cylinder = rng.choice(reference)
+                    count = min(count, reference.count(cylinder))
+                    pending.remove(cylinder, count)
+                    for _ in range(count):
+                        reference.remove(cylinder)
+                else:
+                    cylinder = rng.choice(reference + [rng.randrange(10 ** 9)])
+                    pending.add(cylinder, count)
+                    reference.extend([cylinder] * count)
+                    reference.sort()
+                self.assertEqual(pending.count(cylinder), reference.count(cylinder))
+                if step % 100 == 0:
+                    self.assertEqual(list(pending), reference)
+                probe = rng.randrange(10 ** 9)
+                below = [c for c in reference if c <= probe]
+                above = [c for c in reference if c >= probe]
+                self.assertEqual(pending.predecessor(probe), below[-1] if below else None)
+                self.assertEqual(pending.successor(probe), above[0] if above else None)
+            self.assertEqual(list(pending), reference)
+            self.assertEqual(len(pending), len(reference))
+            self.assertEqual((pending.first(), pending.last()), (reference[0], reference[-1]))
+
+class TestOnlineScheduler(unittest.TestCase):
+    
+    def test_simultaneous_arrivals_match_offline(self):
+        rng = random.Random(4)
+        for _ in range(50):
+            requests = [rng.randrange(200) for _ in range(rng.randint(1, 20))]
+            head = rng.randrange(200)
+            for algorithm in ("FCFS", "SSTF", "LOOK"):
+                for direction in ("Right", "Left"):
+                    offline = DiskScheduler(200, head).run_algorithm(algorithm, requests, direction)
+                    online = OnlineScheduler(200, head, algorithm, direction).run(
+                        [(0.0, r) for r in requests], record_sequence=True)
+                    self.assertEqual((online.sequence, online.total_movement), offline)
+    
+    def test_wait_and_response_times(self):
+        scheduler = OnlineScheduler(200, 50, "FCFS", time_per_cylinder=1.0, service_time=0.0)
+        result = scheduler.run([(0.0, 60), (100.0, 40)])
+        self.assertEqual(list(result.wait_times), [0.0, 0.0])
+        self.assertEqual(list(result.response_times), [10.0, 20.0])
+        self.assertEqual(result.makespan, 120.0)
+        self.assertEqual(result.throughput, 2 / 120.0)
+        self.assertEqual(list(result.seek_distances), [10, 20])
+    
+    def test_sstf_serves_queued_requests_by_distance(self):
+        scheduler = OnlineScheduler(200, 50, "SSTF", time_per_cylinder=1.0, service_time=0.0)
+        result = scheduler.run([(0.0, 150), (1.0, 60), (1.0, 140)], record_sequence=True)
+        # 60 and 140 arrive while the head travels to 150
+        self.assertEqual(result.sequence, [50, 150, 140, 60])
+        self.assertEqual(result.wait_times[1], 109.0)
+    
+    def test_c_scan_wraps_around(self):
+        scheduler = OnlineScheduler(200, 50, "C-SCAN", service_time=0.0)
+        result = scheduler.run([(0.0, 60), (0.0, 40)], record_sequence=True)
+        self.assertEqual(result.sequence, [50, 60, 40])
+        self.assertEqual(result.total_movement, 10 + 139 + 199 + 40)
+    
+    def test_n_step_scan_serves_frozen_batches(self):
+        scheduler = OnlineScheduler(200, 50, "N-Step-SCAN", step_size=2)
+        result = scheduler.run([(0.0, 60), (0.0, 40), (0.0, 70), (0.0, 30)], record_sequence=True)
+        # Each batch of two is swept with SCAN, turning at the disk edges
+        self.assertEqual(result.sequence, [50, 60, 199, 40, 30, 0, 70])
+        self.assertEqual(result.total_movement, 10 + 139 + 159 + 10 + 30 + 70)
+    
+    def test_fscan_defers_new_arrivals(self):
+        scheduler = OnlineScheduler(200, 50, "FSCAN", time_per_cylinder=1.0, service_time=0.0)
+        result = scheduler.run([(0.0, 60), (0.0, 40), (5.0, 55)], record_sequence=True)
+        # 55 arrives while the first batch is frozen, so SCAN passes it by;
+        # the next batch starts heading left and turns at cylinder 0
+        self.assertEqual(result.sequence, [50, 60, 199, 40, 0, 55])
+    
+    def test_deadline_serves_expired_reads_first(self):
+        scheduler = OnlineScheduler(200, 100, "Deadline", time_per_cylinder=1.0,
+                                    service_time=0.0, read_expiry=10.0, write_expiry=1000.0)
+        arrivals = [(0.0, 150, True), (0.0, 20, False), (0.0, 120, True)]
+        result = scheduler.run(arrivals, record_sequence=True)
+        self.assertEqual(result.sequence, [100, 120, 20, 150])
+        relaxed = OnlineScheduler(200, 100, "Deadline", time_per_cylinder=1.0, service_time=0.0)
+        self.assertEqual(relaxed.run(arrivals, record_sequence=True).sequence, [100, 120, 150, 20])
+    
+    def test_satf_accounts_for_rotation(self):
+        model = DiskModel(settle_time=0.0, seek_sqrt=0.0, seek_linear=0.01, rpm=6000,
+                          transfer_rate=1e12)
+        scheduler = OnlineScheduler(200, 50, "SATF", model=model)
+        result = scheduler.run([(0.0, 51, False, 0.9), (0.0, 60, False, 0.1)], record_sequence=True)
+        # 60 is farther but its sector comes round much sooner
+        self.assertEqual(result.sequence, [50, 60, 51])
+        self.assertAlmostEqual(result.response_times[1], 0.1 + 0.9)
+    
+    def test_satf_without_rotation_matches_sstf(self):
+        rng = random.Random(8)
+        arrivals = [(i * 0.5, rng.randrange(200)) for i in range(200)]
+        satf = OnlineScheduler(200, 50, "SATF").run(arrivals, record_sequence=True)
+        sstf = OnlineScheduler(200, 50, "SSTF").run(arrivals, record_sequence=True)
+        self.assertEqual(satf.sequence, sstf.sequence)
+    
+    def test_offline_registry(self):
+        rng = random.Random(9)
+        requests = [rng.randrange(200) for _ in range(40)]
+        scheduler = DiskScheduler(200, 50, step_size=8)
+        for algorithm in ONLINE_POLICIES:
+            with self.subTest(algorithm=algorithm):
+                sequence, total = scheduler.run_algorithm(algorithm, requests)
+                # Batch policies also record the edges where their sweeps turn
+                turns = [c for c in sequence[1:] if c in (0, 199) and c not in requests]
+                self.assertEqual(sorted(requests + turns), sorted(sequence[1:]))
+                self.assertEqual(scheduler.total_movement(algorithm, requests), total)
+                seeks = [seek for _, _, seek in scheduler.iter_moves(algorithm, requests)]
+                self.assertEqual(sum(seeks), total)
+    
+    def test_invalid_arrivals(self):
+        scheduler = OnlineScheduler(200, 50)
+        with self.assertRaises(ValueError):
+            scheduler.run([(1.0, 10), (0.0, 20)])
+        with self.assertRaises(ValueError):
+            scheduler.run([(0.0, 200)])
+        with self.assertRaises(ValueError):
+            OnlineScheduler(algorithm="RANDOM")
+
+if __name__ == '__main__':
+    unittest.main()
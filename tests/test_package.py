@@ -0,0 +1,38 @@
+"""
+Tests for package-level imports.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+import src.disk_scheduling_simulator as package
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+def loaded_after_import(module):
+    """Return the heavy top-level modules loaded by importing module in a fresh interpreter."""
+    code = (f"import sys; import {module}; "
+            "print(' '.join(sorted({m.split('.')[0] for m in sys.modules} & "
+            "{'tkinter', 'matplotlib', 'numpy', 'tracemalloc'})))")
+    return subprocess.run([sys.executable, "-c", code], cwd=SRC,
+                          capture_output=True, text=True, check=True).stdout.split()
+
+class TestPackageImports(unittest.TestCase):
+    
+    def test_import_does_not_load_heavy_modules(self):
+        self.assertEqual(loaded_after_import("disk_scheduling_simulator"), [])
+    
+    def test_run_simulator_is_loaded_on_demand(self):
+        try:
+            import tkinter  # noqa: F401
+        except ImportError:
+            self.skipTest("tkinter is not available")
+        self.assertTrue(callable(package.run_simulator))
+    
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            package.does_not_exist
+
+if __name__ == '__main__':
+    unittest.main()
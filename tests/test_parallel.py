@@ -0,0 +1,40 @@
+"""
+Tests for the parallel grid runner.
+"""
+
+import unittest
+from src.disk_scheduling_simulator.batch import run_batch
+from src.disk_scheduling_simulator.parallel import generate_workload, run_grid
+from src.disk_scheduling_simulator.registry import algorithm_names
+from src.disk_scheduling_simulator.sequence import HeadSequence
+
+class TestParallel(unittest.TestCase):
+    
+    def test_generate_workload_is_reproducible(self):
+        first = generate_workload(100, 200, seed=5)
+        self.assertEqual(first, generate_workload(100, 200, seed=5))
+        self.assertTrue(all(0 <= r < 200 for r in first))
+    
+    def test_run_grid_matches_run_batch(self):
+        rows = list(run_grid(50, seeds=[1, 2], disk_sizes=[100, 200], initial_heads=[0, 50, 150],
+                             max_workers=2, chunk_size=5, totals_only=False))
+        # Head 150 is skipped for the 100-cylinder disk
+        self.assertEqual(len(rows), 2 * (3 + 2) * 2 * len(algorithm_names()))
+        for row in rows:
+            requests = generate_workload(50, row.disk_size, row.seed)
+            expected = run_batch(requests, [(row.algorithm, row.initial_head, row.direction)],
+                                 disk_size=row.disk_size)[0]
+            self.assertEqual(row.total_movement, expected.total_movement)
+            self.assertEqual(row.sequence, expected.sequence)
+    
+    def test_run_grid_compact(self):
+        rows = list(run_grid(20, seeds=[3], disk_sizes=[200], initial_heads=[50],
+                             max_workers=1, totals_only=False, compact=True))
+        requests = generate_workload(20, 200, 3)
+        for row in rows:
+            self.assertIsInstance(row.sequence, HeadSequence)
+            expected = run_batch(requests, [(row.algorithm, 50, row.direction)])[0]
+            self.assertEqual(row.sequence, expected.sequence)
+
+if __name__ == '__main__':
+    unittest.main()
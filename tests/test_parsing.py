@@ -0,0 +1,78 @@
+"""
+Tests for the streaming request parsers.
+"""
+
+import io
+import os
+import unittest
+from src.disk_scheduling_simulator.parsing import (
+    RequestParseError, detect_format, iter_request_batches, load_requests)
+
+class TestParsing(unittest.TestCase):
+    
+    def test_text_with_spaces_and_commas(self):
+        source = io.StringIO("98 183, 37\n122,14 124\n\n65 67\n")
+        self.assertEqual(load_requests(source).tolist(), [98, 183, 37, 122, 14, 124, 65, 67])
+    
+    def test_tokens_split_across_chunks(self):
+        text = " ".join(str(n) for n in range(1000, 1200))
+        for chunk_size in (1, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(load_requests(io.StringIO(text), chunk_size=chunk_size).tolist(),
+                                 list(range(1000, 1200)))
+    
+    def test_batches_are_incremental(self):
+        text = "\n".join(str(n) for n in range(100))
+        batches = list(iter_request_batches(io.StringIO(text), chunk_size=20))
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([r for batch in batches for r in batch], list(range(100)))
+    
+    def test_malformed_token_reports_line(self):
+        source = io.StringIO("98 183\n37 x12\n14\n")
+        with self.assertRaises(RequestParseError) as context:
+            load_requests(source, chunk_size=4)
+        self.assertEqual(context.exception.line_number, 2)
+    
+    def test_token_beyond_int64_reports_line(self):
+        for fmt, source in (("text", "1 2\n-99999999999999999999\n"),
+                            ("jsonl", "1\n[2, 99999999999999999999]\n")):
+            with self.subTest(fmt=fmt):
+                with self.assertRaises(RequestParseError) as context:
+                    load_requests(io.StringIO(source), fmt=fmt, chunk_size=8)
+                self.assertEqual(context.exception.line_number, 2)
+    
+    def test_disk_size_validation(self):
+        with self.assertRaises(RequestParseError) as context:
+            load_requests(io.StringIO("10\n20\n250\n"), disk_size=200)
+        self.assertEqual(context.exception.line_number, 3)
+    
+    def test_csv_header_selects_column(self):
+        source = io.StringIO("timestamp,cylinder\n0.0,98\n0.5,183\n")
+        self.assertEqual(load_requests(source, fmt="csv").tolist(), [98, 183])
+    
+    def test_csv_without_header(self):
+        source = io.StringIO("98,183\n37\n")
+        self.assertEqual(load_requests(source, fmt="csv").tolist(), [98, 183, 37])
+    
+    def test_jsonl(self):
+        source = io.StringIO('98\n[183, 37]\n{"cylinder": 122, "timestamp": 1.5}\n')
+        self.assertEqual(load_requests(source, fmt="jsonl", chunk_size=5).tolist(),
+                         [98, 183, 37, 122])
+    
+    def test_jsonl_errors(self):
+        with self.assertRaises(RequestParseError) as context:
+            load_requests(io.StringIO('98\n{"head": 1}\n'), fmt="jsonl")
+        self.assertEqual(context.exception.line_number, 2)
+        with self.assertRaises(RequestParseError):
+            load_requests(io.StringIO('"98"\n'), fmt="jsonl")
+    
+    def test_path_and_format_detection(self):
+        self.assertEqual(detect_format("trace.JSONL"), "jsonl")
+        self.assertEqual(detect_format("trace.csv"), "csv")
+        self.assertEqual(detect_format("sample_requests.txt"), "text")
+        sample = os.path.join(os.path.dirname(__file__), "..", "examples", "sample_requests.txt")
+        self.assertEqual(load_requests(sample, disk_size=200).tolist(),
+                         [98, 183, 37, 122, 14, 124, 65, 67])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for the decimated sequence plot.
+"""
+
+import random
+import unittest
+from collections import namedtuple
+
+try:
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+except ImportError:
+    np = None
+else:
+    from src.disk_scheduling_simulator.plotting import SequencePlot, decimate, plot_comparison
+
+@unittest.skipIf(np is None, "Matplotlib is not installed")
+class TestDecimate(unittest.TestCase):
+    
+    def test_short_ranges_are_kept(self):
+        values = np.array([5, 1, 9, 3])
+        self.assertEqual(decimate(values, 0, 4).tolist(), [0, 1, 2, 3])
+        self.assertEqual(decimate(values, 1, 10).tolist(), [1, 2, 3])
+    
+    def test_keeps_extremes_of_every_bucket(self):
+        rng = random.Random(2)
+        values = np.array([rng.randrange(1000) for _ in range(100003)])
+        steps = decimate(values, 0, len(values), max_points=1000)
+        self.assertLessEqual(len(steps), 1000)
+        self.assertTrue(np.all(np.diff(steps) > 0))
+        self.assertEqual((steps[0], steps[-1]), (0, len(values) - 1))
+        self.assertEqual(values[steps].max(), values.max())
+        self.assertEqual(values[steps].min(), values.min())
+        # A single spike survives decimation
+        values[54321] = 5000
+        self.assertIn(54321, decimate(values, 0, len(values), max_points=1000))
+    
+    def test_sub_range(self):
+        values = np.arange(10000)
+        steps = decimate(values, 2000, 3000, max_points=100)
+        self.assertEqual((steps[0], steps[-1]), (2000, 2999))
+        self.assertLessEqual(len(steps), 100)
+
+@unittest.skipIf(np is None, "Matplotlib is not installed")
+class TestSequencePlot(unittest.TestCase):
+    
+    def setUp(self):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        self.ax = figure.add_subplot()
+        self.plot = SequencePlot(self.ax, max_points=500, max_labels=20, max_markers=50)
+    
+    def test_small_sequence_is_drawn_in_full(self):
+        sequence = [53, 98, 183, 37, 122, 14, 124, 65, 67]
+        self.plot.show(sequence, 200)
+        self.ax.figure.canvas.draw()
+        steps, cylinders = self.plot.visible_points()
+        self.assertEqual(cylinders.tolist(), sequence)
+        self.assertEqual(len(self.plot.markers.get_xdata()), 9)
+        labels = [label.get_text() for label in self.plot.labels if label.get_visible()]
+        self.assertEqual(labels, [str(cylinder) for cylinder in sequence])
+    
+    def test_large_sequence_is_bounded_and_refined_on_zoom(self):
+        rng = random.Random(5)
+        sequence = [rng.randrange(100000) for _ in range(200000)]
+        self.plot.show(sequence, 100000)
+        self.ax.figure.canvas.draw()
+        steps, _ = self.plot.visible_points()
+        self.assertLessEqual(len(steps), 500)
+        self.assertEqual(len(self.plot.markers.get_xdata()), 0)
+        self.assertEqual(sum(label.get_visible() for label in self.plot.labels), 20)
+        
+        self.ax.set_xlim(1000, 1030)
+        steps, cylinders = self.plot.visible_points()
+        self.assertEqual(steps.tolist(), list(range(1000, 1031)))
+        self.assertEqual(cylinders.tolist(), sequence[1000:1031])
+        self.assertEqual(len(self.plot.markers.get_xdata()), 31)
+    
+    def test_same_limits_are_blitted(self):
+        self.plot.show([50, 60, 70], 200)
+        self.ax.figure.canvas.draw()
+        self.plot.show([50, 40, 30], 200)
+        self.assertEqual(self.plot.visible_points()[1].tolist(), [50, 40, 30])
+        self.plot.show([50, 400], 1000)
+        self.assertEqual(self.ax.get_ylim(), (-5, 1005))
+    
+    def test_partial_sequence_keeps_final_axis(self):
+        self.plot.show([50, 60], 200, steps=10)
+        self.assertEqual(self.ax.get_xlim(), (-0.5, 9.5))
+        self.assertEqual(self.plot.visible_points()[1].tolist(), [50, 60])
+    
+    def test_extend_copies_only_new_steps(self):
+        sequence = list(range(3000))
+        self.plot.extend(sequence[:10], 0, 5000, steps=3000)
+        buffer = self.plot._buffer
+        self.plot.extend(sequence[10:1000], 10, 5000, steps=3000)
+        self.assertIs(self.plot._buffer, buffer)
+        self.plot.extend(sequence[1000:], 1000, 5000, steps=3000)
+        self.assertEqual(self.plot.values.tolist(), sequence)
+        self.assertEqual(self.ax.get_xlim(), (-0.5, 2999.5))
+        # Starting over replaces the plotted steps
+        self.plot.extend([7, 8], 0, 5000)
+        self.assertEqual(self.plot.values.tolist(), [7, 8])
+        self.plot.show([1, 2, 3], 5000)
+        self.plot.extend([4], 3, 5000)
+        self.assertEqual(self.plot.values.tolist(), [1, 2, 3, 4])
+
+@unittest.skipIf(np is None, "Matplotlib is not installed")
+class TestPlotComparison(unittest.TestCase):
+    
+    def setUp(self):
+        self.figure = Figure()
+        FigureCanvasAgg(self.figure)
+        result = namedtuple("Result", ["algorithm", "total_movement", "sequence"])
+        self.results = [result("SSTF", 236, [53, 65, 67, 37, 14, 98, 122, 124, 183]),
+                        result("FCFS", 640, [53, 98, 183, 37, 122, 14, 124, 65, 67]),
+                        result("Long", 10 ** 6, list(range(100000)))]
+    
+    def test_small_multiples(self):
+        axes = plot_comparison(self.figure, self.results, 200, max_points=100)
+        self.assertEqual([ax.get_title() for ax in axes],
+                         ["SSTF (236)", "FCFS (640)", "Long (1,000,000)"])
+        # A 2x2 grid with the spare axes hidden
+        self.assertEqual(sum(ax.get_visible() for ax in self.figure.axes), 3)
+        self.assertEqual(axes[0].lines[0].get_ydata().tolist(), self.results[0].sequence)
+        self.assertLessEqual(len(axes[2].lines[0].get_xdata()), 100)
+        self.figure.canvas.draw()
+    
+    def test_overlay(self):
+        axes = plot_comparison(self.figure, self.results[:2], 200, overlay=True)
+        self.assertEqual(len(axes), 1)
+        self.assertEqual(len(axes[0].lines), 2)
+        self.assertEqual(axes[0].get_ylim(), (-5, 205))
+        self.assertEqual(plot_comparison(self.figure, [], 200), [])
+        self.assertEqual(self.figure.axes, [])
+
+if __name__ == "__main__":
+    unittest.main()
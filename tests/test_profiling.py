@@ -0,0 +1,116 @@
+"""
+Tests for the scheduler profiling hooks.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.cache import ResultCache
+from src.disk_scheduling_simulator.profiling import Profiler, counted_sort
+from src.disk_scheduling_simulator.utils import _load_numpy
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+class TestProfiler(unittest.TestCase):
+    
+    def test_phases_of_a_sweep(self):
+        profiler = Profiler()
+        scheduler = DiskScheduler(200, 53, profiler=profiler)
+        self.assertEqual(scheduler.run_algorithm("SCAN", REQUESTS),
+                         DiskScheduler(200, 53).run_algorithm("SCAN", REQUESTS))
+        stats = {stat.path: stat for stat in profiler.stats()}
+        self.assertEqual(list(stats), ["SCAN", "SCAN/convert", "SCAN/sort", "SCAN/partition",
+                                       "SCAN/plan", "SCAN/sequence"])
+        self.assertEqual(stats["SCAN"].counters, {"requests": 8})
+        self.assertIsNone(stats["SCAN"].peak_memory)
+        inner = sum(stat.total_time for path, stat in stats.items() if path != "SCAN")
+        self.assertLessEqual(inner, stats["SCAN"].total_time)
+    
+    def test_phases_accumulate_over_calls(self):
+        profiler = Profiler()
+        scheduler = DiskScheduler(200, 53, profiler=profiler, cache=ResultCache())
+        for _ in range(3):
+            scheduler.run_algorithm("SSTF", REQUESTS)
+        stats = {stat.path: stat for stat in profiler.stats()}
+        self.assertEqual(stats["SSTF"].calls, 3)
+        self.assertEqual(stats["SSTF"].counters["requests"], 24)
+        # One miss and store, then two hits; the algorithm itself ran once
+        self.assertEqual(stats["SSTF/cache"].calls, 4)
+        self.assertEqual(stats["SSTF/cache"].counters["hits"], 2)
+        self.assertEqual(stats["SSTF/walk"].calls, 1)
+        self.assertEqual(stats["SSTF/index"].counters["distinct"], 8)
+        profiler.clear()
+        self.assertEqual(profiler.stats(), [])
+    
+    def test_memory_and_comparisons(self):
+        values = list(range(1000, 0, -1))
+        self.assertEqual(counted_sort(values), 999)
+        self.assertEqual(values, list(range(1, 1001)))
+        
+        with Profiler(trace_memory=True, count_comparisons=True) as profiler:
+            DiskScheduler(2000, 0, profiler=profiler).run_algorithm("C-LOOK", list(range(1000, 0, -1)))
+        stats = {stat.path: stat for stat in profiler.stats()}
+        self.assertEqual(stats["C-LOOK/sort"].counters, {"comparisons": 999})
+        # The sequence holds 1001 references, so its phase allocates at least that much
+        self.assertGreaterEqual(stats["C-LOOK/sequence"].peak_memory, 1001 * 8)
+        self.assertGreaterEqual(stats["C-LOOK"].peak_memory, stats["C-LOOK/sequence"].peak_memory)
+        
+        with Profiler(count_comparisons=True) as profiler:
+            sequence = DiskScheduler(2000, 0, profiler=profiler).run_algorithm(
+                "SSTF", list(range(1000, 0, -1)))[0]
+        self.assertEqual(sequence, list(range(1001)))
+        stats = {stat.path: stat for stat in profiler.stats()}
+        self.assertEqual(stats["SSTF/index"].counters, {"distinct": 1000, "comparisons": 999})
+    
+    def test_online_policy_phases(self):
+        profiler = Profiler()
+        DiskScheduler(200, 53, profiler=profiler).run_algorithm("FSCAN", REQUESTS)
+        self.assertEqual([stat.path for stat in profiler.stats()],
+                         ["FSCAN", "FSCAN/convert", "FSCAN/prepare", "FSCAN/simulate"])
+    
+    @unittest.skipIf(_load_numpy() is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        profiler = Profiler()
+        DiskScheduler(200, 53, backend="numpy", profiler=profiler).run_algorithm("FCFS", REQUESTS)
+        self.assertEqual([stat.path for stat in profiler.stats()],
+                         ["FCFS", "FCFS/convert", "FCFS/sequence", "FCFS/movement"])
+    
+    def test_exports(self):
+        profiler = Profiler()
+        scheduler = DiskScheduler(200, 53, profiler=profiler)
+        scheduler.run_algorithm("LOOK", REQUESTS, "Left")
+        trace = profiler.chrome_trace()
+        events = trace["traceEvents"]
+        self.assertEqual([event["name"] for event in events],
+                         ["LOOK", "convert", "sort", "partition", "plan", "sequence"])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        self.assertEqual(events[0]["args"]["direction"], "Left")
+        # Nested phases lie within the algorithm's phase
+        for event in events[1:]:
+            self.assertGreaterEqual(event["ts"], events[0]["ts"])
+            self.assertLessEqual(event["ts"] + event["dur"], events[0]["ts"] + events[0]["dur"])
+        
+        folded = profiler.folded()
+        self.assertEqual([line.rsplit(" ", 1)[0] for line in folded],
+                         ["LOOK", "LOOK;convert", "LOOK;sort", "LOOK;partition", "LOOK;plan",
+                          "LOOK;sequence"])
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profiler.write_chrome_trace(path)
+            with open(path) as file:
+                self.assertEqual(len(json.load(file)["traceEvents"]), 6)
+    
+    def test_user_phases_nest(self):
+        profiler = Profiler()
+        with profiler.phase("experiment", size=8) as phase:
+            DiskScheduler(200, 53, profiler=profiler).run_algorithm("FCFS", REQUESTS)
+            phase.count("runs")
+        paths = [stat.path for stat in profiler.stats()]
+        self.assertEqual(paths[:2], ["experiment", "experiment/FCFS"])
+        self.assertEqual(profiler.stats()[0].counters, {"runs": 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for the algorithm registry and plugin discovery.
+"""
+
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator import registry
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import BatchScheduler
+from src.disk_scheduling_simulator.registry import (
+    algorithm_names, get_algorithm, register, unregister)
+
+def reverse(scheduler, requests, direction):
+    sequence = [scheduler.initial_head] + requests[::-1]
+    return sequence, sum(abs(b - a) for a, b in zip(sequence, sequence[1:]))
+
+class FakeEntryPoint:
+    
+    def __init__(self, name, target):
+        self.name = name
+        self.target = target
+    
+    def load(self):
+        if isinstance(self.target, Exception):
+            raise self.target
+        return self.target
+
+class TestRegistry(unittest.TestCase):
+    
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def tearDown(self):
+        for name in ("REVERSE", "PLUGIN"):
+            if name in registry._registry:
+                unregister(name)
+    
+    def test_builtin_capabilities(self):
+        self.assertEqual(algorithm_names()[:6], ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"])
+        self.assertEqual(algorithm_names(directional=True),
+                         ["SCAN", "C-SCAN", "LOOK", "C-LOOK", "N-Step-SCAN", "FSCAN"])
+        self.assertEqual(algorithm_names(vectorized=True), ["FCFS", "SCAN", "C-SCAN", "LOOK", "C-LOOK"])
+        self.assertFalse(get_algorithm("SATF").totals_only)
+        self.assertTrue(get_algorithm("SSTF").description)
+        with self.assertRaises(ValueError):
+            algorithm_names(fast=True)
+        with self.assertRaises(ValueError):
+            get_algorithm("RANDOM")
+    
+    def test_registered_algorithm_is_picked_up(self):
+        register("REVERSE", description="Serves requests in reverse order.")(reverse)
+        scheduler = DiskScheduler(200, 50)
+        self.assertIn("REVERSE", scheduler.algorithms)
+        sequence, total = scheduler.run_algorithm("REVERSE", self.requests)
+        self.assertEqual(sequence, [50] + self.requests[::-1])
+        self.assertEqual(scheduler.total_movement("REVERSE", self.requests), total)
+        self.assertEqual([c for _, c, _ in scheduler.iter_moves("REVERSE", self.requests)], sequence)
+        result = BatchScheduler(self.requests).run("REVERSE", 50, totals_only=True)
+        self.assertEqual(result.total_movement, total)
+        if np is not None:
+            numpy_sequence, numpy_total = DiskScheduler(200, 50, backend="numpy").run_algorithm(
+                "REVERSE", np.array(self.requests))
+            self.assertEqual((numpy_sequence.tolist(), numpy_total), (sequence, total))
+    
+    def test_plugin_streaming_and_totals_paths(self):
+        calls = []
+        
+        def reverse_moves(scheduler, requests, direction):
+            calls.append("moves")
+            return reversed(list(requests))
+        
+        def reverse_totals(scheduler, requests, direction):
+            calls.append("totals")
+            requests = list(requests)
+            total = abs(requests[-1] - scheduler.initial_head)
+            total += sum(abs(b - a) for a, b in zip(requests, requests[1:]))
+            return total, len(requests), len(requests)
+        
+        register("REVERSE")(reverse)
+        register("REVERSE", kind="moves")(reverse_moves)
+        register("REVERSE", kind="totals")(reverse_totals)
+        info = get_algorithm("REVERSE")
+        self.assertTrue(info.streaming and info.totals_only)
+        self.assertIn("REVERSE", algorithm_names(streaming=True, totals_only=True))
+        
+        scheduler = DiskScheduler(200, 50)
+        sequence, total = scheduler.run_algorithm("REVERSE", self.requests)
+        self.assertEqual([c for _, c, _ in scheduler.iter_moves("REVERSE", self.requests)], sequence)
+        self.assertEqual([c for _, c, _ in scheduler.iter_service("REVERSE", self.requests)],
+                         sequence[1:])
+        self.assertEqual(calls, ["moves", "moves"])
+        self.assertEqual(scheduler.summarize("REVERSE", self.requests)[:3],
+                         (total, len(self.requests), len(self.requests)))
+        self.assertEqual(BatchScheduler(self.requests).run("REVERSE", 50, totals_only=True)
+                         .total_movement, total)
+        self.assertEqual(calls.count("totals"), 2)
+        if np is not None:
+            self.assertGreater(scheduler.service_time("REVERSE", self.requests).total_time, 0)
+            self.assertEqual(calls.count("moves"), 3)
+    
+    def test_invalid_registrations(self):
+        with self.assertRaises(ValueError):
+            register("FCFS")(reverse)
+        with self.assertRaises(ValueError):
+            register("REVERSE", backend="numpy")(reverse)
+        with self.assertRaises(ValueError):
+            register("REVERSE", kind="moves")(reverse)
+        with self.assertRaises(ValueError):
+            register("FCFS", kind="moves", backend="numpy")(reverse)
+        with self.assertRaises(ValueError):
+            register("FCFS", kind="stream")
+    
+    def test_entry_point_discovery(self):
+        entry_points = [FakeEntryPoint("PLUGIN", reverse), FakeEntryPoint("BROKEN", ImportError("boom"))]
+        with mock.patch.object(registry, "_plugins_loaded", False), \
+                mock.patch.object(registry, "_entry_points", return_value=entry_points):
+            with self.assertWarns(UserWarning):
+                names = algorithm_names()
+        self.assertIn("PLUGIN", names)
+        self.assertNotIn("BROKEN", names)
+        self.assertFalse(get_algorithm("PLUGIN").directional)
+
+if __name__ == '__main__':
+    unittest.main()
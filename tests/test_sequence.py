@@ -0,0 +1,124 @@
+"""
+Tests for compact head movement sequences.
+"""
+
+import pickle
+import sys
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.batch import BatchScheduler, compare
+from src.disk_scheduling_simulator.cache import ResultCache
+from src.disk_scheduling_simulator.sequence import HeadSequence
+
+class TestHeadSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [53, 65, 67, 37, 14, 98, 122, 124, 183]
+        self.sequence = HeadSequence(self.values)
+
+    def test_behaves_like_the_list(self):
+        sequence = self.sequence
+        self.assertEqual(len(sequence), len(self.values))
+        self.assertEqual(sequence, self.values)
+        self.assertEqual(sequence, tuple(self.values))
+        self.assertNotEqual(sequence, self.values[:-1])
+        self.assertEqual(list(sequence), self.values)
+        self.assertEqual(list(reversed(sequence)), self.values[::-1])
+        self.assertEqual((sequence[0], sequence[-1]), (53, 183))
+        self.assertIn(98, sequence)
+        self.assertNotIn(99, sequence)
+        self.assertEqual(sequence.index(14), 4)
+        self.assertEqual(sequence + [7], self.values + [7])
+        self.assertEqual(sequence.tolist(), self.values)
+        with self.assertRaises(TypeError):
+            sequence[0] = 1
+        with self.assertRaises(TypeError):
+            hash(sequence)
+
+    def test_slices_are_views(self):
+        part = self.sequence[2:7:2]
+        self.assertIsInstance(part, HeadSequence)
+        self.assertEqual(part, self.values[2:7:2])
+        self.assertEqual(HeadSequence(part), part)
+        self.assertEqual(repr(part), "HeadSequence([67, 14, 122])")
+        self.assertIn("len=1000", repr(HeadSequence(range(1000))))
+
+    def test_wide_values(self):
+        values = [0, -1, 2 ** 40]
+        sequence = HeadSequence(values)
+        self.assertEqual(sequence, values)
+        self.assertEqual(sequence.buffer.format, "q")
+        self.assertEqual(self.sequence.buffer.format, "I")
+
+    def test_pickle(self):
+        for values in (self.values, [], [-5, 2 ** 40]):
+            copy = pickle.loads(pickle.dumps(HeadSequence(values)))
+            self.assertIsInstance(copy, HeadSequence)
+            self.assertEqual(copy, values)
+
+    def test_smaller_than_a_list(self):
+        values = list(range(1000, 11000))
+        sequence = HeadSequence(values)
+        self.assertEqual(sequence.nbytes, 4 * len(values))
+        list_bytes = sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+        self.assertLess(sequence.nbytes * 5, list_bytes)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy(self):
+        values = np.asarray(self.sequence)
+        self.assertEqual(values.tolist(), self.values)
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(np.asarray(self.sequence, dtype=np.int64).dtype, np.int64)
+        self.assertEqual(HeadSequence(np.array(self.values, dtype=np.int64)), self.values)
+        self.assertEqual(HeadSequence(np.array([-1, 2])).buffer.format, "q")
+
+    @unittest.skipIf(np is None or np.lib.NumpyVersion(np.__version__) < "2.0.0",
+                     "NumPy 2 is not installed")
+    def test_numpy_copy_keyword(self):
+        view = np.array(self.sequence, copy=False)
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.shares_memory(view, np.asarray(self.sequence)))
+        copied = np.array(self.sequence, copy=True)
+        self.assertTrue(copied.flags.writeable)
+        self.assertFalse(np.shares_memory(copied, view))
+        self.assertEqual(np.asarray(self.sequence, dtype=np.int64).tolist(), self.values)
+        with self.assertRaises(ValueError):
+            np.array(self.sequence, dtype=np.int64, copy=False)
+
+class TestCompactResults(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+
+    def test_scheduler(self):
+        cache = ResultCache()
+        plain = DiskScheduler(200, 53)
+        compact = DiskScheduler(200, 53, cache=cache, compact=True)
+        for algorithm in ("FCFS", "SSTF", "SCAN", "C-LOOK"):
+            expected = plain.run_algorithm(algorithm, self.requests, "Left")
+            for _ in range(2):
+                sequence, total = compact.run_algorithm(algorithm, self.requests, "Left")
+                self.assertIsInstance(sequence, HeadSequence)
+                self.assertEqual((sequence, total), expected)
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+        # Cached lists are still returned as lists to other schedulers
+        sequence = DiskScheduler(200, 53, cache=cache).run_algorithm("SSTF", self.requests)[0]
+        self.assertIsInstance(sequence, list)
+
+    def test_batch(self):
+        batch = BatchScheduler(self.requests, compact=True)
+        result = batch.run("LOOK", 53, "Right")
+        self.assertIsInstance(result.sequence, HeadSequence)
+        self.assertEqual(result.sequence, BatchScheduler(self.requests).run("LOOK", 53).sequence)
+        self.assertIsNone(batch.run("LOOK", 53, totals_only=True).sequence)
+        self.assertTrue(all(isinstance(r.sequence, HeadSequence)
+                            for r in compare(self.requests, 53, compact=True)))
+
+if __name__ == '__main__':
+    unittest.main()
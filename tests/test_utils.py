@@ -2,8 +2,20 @@
 Tests for utility functions.
 """
 
+import os
+import tempfile
 import unittest
-from src.disk_scheduling_simulator.utils import validate_requests, calculate_total_movement
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator import utils
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.utils import (
+    validate_requests, calculate_total_movement, read_trace, write_trace)
 
 class TestUtils(unittest.TestCase):
     
@@ -23,6 +35,77 @@ class TestUtils(unittest.TestCase):
         sequence = [50, 60, 40, 70]
         expected = abs(60-50) + abs(40-60) + abs(70-40)  # 10 + 20 + 30 = 60
         self.assertEqual(calculate_total_movement(sequence), expected)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_calculate_total_movement_ndarray(self):
+        sequence = np.array([50, 60, 40, 70], dtype=np.uint32)
+        self.assertEqual(calculate_total_movement(sequence), 60)
+
+class TestTraceFiles(unittest.TestCase):
+    
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=utils.TRACE_EXTENSION)
+        os.close(handle)
+        self.requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def test_round_trip(self):
+        write_trace(self.path, self.requests, disk_size=200)
+        trace = read_trace(self.path)
+        self.assertEqual(trace.requests.tolist(), self.requests)
+        self.assertIsNone(trace.timestamps)
+        self.assertEqual(trace.disk_size, 200)
+    
+    def test_round_trip_with_timestamps(self):
+        timestamps = [0.5 * i for i in range(len(self.requests))]
+        write_trace(self.path, self.requests[:-1], timestamps[:-1])
+        trace = read_trace(self.path)
+        self.assertEqual(trace.requests.tolist(), self.requests[:-1])
+        self.assertEqual(trace.timestamps.tolist(), timestamps[:-1])
+    
+    def test_empty_trace(self):
+        write_trace(self.path, [])
+        self.assertEqual(len(read_trace(self.path).requests), 0)
+    
+    def test_schedulers_accept_mapped_requests(self):
+        write_trace(self.path, self.requests)
+        requests = read_trace(self.path).requests
+        scheduler = DiskScheduler(disk_size=200, initial_head=50)
+        self.assertEqual(scheduler.run_algorithm("SSTF", requests),
+                         scheduler.run_algorithm("SSTF", self.requests))
+    
+    def test_memoryview_fallback(self):
+        write_trace(self.path, self.requests)
+        with mock.patch.object(utils, "_load_numpy", return_value=None):
+            requests = read_trace(self.path).requests
+        self.assertIsInstance(requests, memoryview)
+        self.assertEqual(requests.tolist(), self.requests)
+    
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"98 183 37 122 14 124 65 67 ...")
+        with self.assertRaises(ValueError):
+            read_trace(self.path)
+    
+    def test_rejects_cylinders_outside_uint32(self):
+        bad = ([-1], [2 ** 32], [1.5])
+        for requests in bad:
+            with self.subTest(requests=requests), self.assertRaises(ValueError):
+                write_trace(self.path, requests)
+        np = utils._load_numpy()
+        if np is None:
+            return
+        for requests in bad:
+            with self.subTest(array=requests), self.assertRaises(ValueError):
+                write_trace(self.path, np.array(requests))
+        write_trace(self.path, np.array([0, 2 ** 32 - 1], dtype=np.int64))
+        self.assertEqual(read_trace(self.path).requests.tolist(), [0, 2 ** 32 - 1])
+    
+    def test_mismatched_timestamps(self):
+        with self.assertRaises(ValueError):
+            write_trace(self.path, self.requests, [0.0])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Tests for the background simulation worker.
+"""
+
+import random
+import threading
+import time
+import unittest
+
+from src.disk_scheduling_simulator.algorithms import DiskScheduler
+from src.disk_scheduling_simulator.worker import SimulationWorker
+
+class TestSimulationWorker(unittest.TestCase):
+    
+    def setUp(self):
+        self.events = []
+        self.scheduler = DiskScheduler(200, 53)
+    
+    def run_worker(self, algorithm, requests, direction="Right", cancel=False, chunk_size=4):
+        worker = SimulationWorker(
+            self.scheduler, algorithm, requests, direction,
+            on_progress=lambda length, total: self.events.append(("progress", length)),
+            on_done=lambda sequence, total: self.events.append(("done", sequence, total)),
+            on_error=lambda error: self.events.append(("error", error)),
+            on_cancel=lambda: self.events.append(("cancelled",)),
+            chunk_size=chunk_size)
+        if cancel:
+            worker.cancel()
+        worker.start()
+        worker.join(10)
+        self.assertTrue(worker.running)
+        self.assertFalse(worker.dispatch())
+        self.assertFalse(worker.running)
+        return worker
+    
+    def test_result_matches_run_algorithm(self):
+        requests = [98, 183, 37, 122, 14, 124, 65, 67]
+        self.run_worker("SCAN", requests, "Left")
+        expected = self.scheduler.run_algorithm("SCAN", requests, "Left")
+        self.assertEqual(self.events[-1], ("done",) + expected)
+    
+    def test_cancel_stops_at_chunk_boundary(self):
+        rng = random.Random(1)
+        worker = self.run_worker("SSTF", [rng.randrange(200) for _ in range(1000)], cancel=True)
+        self.assertEqual(self.events, [("cancelled",)])
+        self.assertLessEqual(len(worker.sequence), 4)
+    
+    def test_progress_is_coalesced(self):
+        worker = SimulationWorker(self.scheduler, "FCFS", list(range(100)), chunk_size=10,
+                                  on_progress=lambda length, total: self.events.append(
+                                      (length, total)))
+        worker.start()
+        worker.join(10)
+        # The run finished, so the done event wins over the queued progress
+        self.assertFalse(worker.dispatch())
+        self.assertEqual(self.events, [])
+        self.assertEqual(len(worker.sequence), 101)
+    
+    def test_progress_while_running(self):
+        gate = threading.Event()
+        
+        class GatedScheduler:
+            def iter_moves(self, algorithm_name, requests, direction):
+                for step, cylinder in enumerate(requests):
+                    if step == 6:
+                        gate.wait(10)
+                    yield step, cylinder, 0
+        
+        worker = SimulationWorker(GatedScheduler(), "FCFS", list(range(10)), chunk_size=5,
+                                  on_progress=lambda length, total: self.events.append(
+                                      (worker.sequence[:length], total)))
+        worker.start()
+        deadline = time.monotonic() + 10
+        while not self.events and time.monotonic() < deadline:
+            self.assertTrue(worker.dispatch())
+            time.sleep(0.001)
+        self.assertEqual(self.events, [([0, 1, 2, 3, 4, 5], 10)])
+        gate.set()
+        worker.join(10)
+        self.assertFalse(worker.dispatch())
+    
+    def test_errors_are_reported(self):
+        self.run_worker("NOPE", [1, 2])
+        self.assertEqual(self.events[0][0], "error")
+        self.assertIsInstance(self.events[0][1], ValueError)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the synthetic workload generators.
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.disk_scheduling_simulator.utils import read_trace
+from src.disk_scheduling_simulator.workloads import PATTERNS, generate, write_workload
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestWorkloads(unittest.TestCase):
+    
+    def test_patterns_are_reproducible_and_in_range(self):
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                first = generate(pattern, 5000, 1000, seed=7)
+                second = generate(pattern, 5000, 1000, seed=7)
+                self.assertTrue(np.array_equal(first.requests, second.requests))
+                self.assertEqual(first.requests.dtype, np.uint32)
+                self.assertEqual(len(first.requests), 5000)
+                self.assertLess(int(first.requests.max()), 1000)
+                self.assertTrue(np.all(np.diff(first.timestamps) >= 0))
+    
+    def test_zipf_concentrates_on_hot_cylinders(self):
+        workload = generate("zipf", 20000, 10000, seed=1, hot_cylinders=10, exponent=1.0)
+        counts = np.sort(np.unique(workload.requests, return_counts=True)[1])[::-1]
+        self.assertEqual(len(counts), 10)
+        self.assertAlmostEqual(counts[0] / counts.sum(), 0.341, delta=0.02)
+        for hot_cylinders in (0, -5):
+            with self.assertRaises(ValueError):
+                generate("zipf", 10, 100, hot_cylinders=hot_cylinders)
+    
+    def test_sequential_runs_are_consecutive(self):
+        requests = generate("sequential", 1000, 100000, seed=3, mean_run=1000).requests
+        steps = np.diff(requests.astype(np.int64))
+        self.assertGreater(np.count_nonzero(steps == 1), 900)
+    
+    def test_mixed_sets_write_flags(self):
+        workload = generate("mixed", 10000, 1000, seed=2)
+        self.assertAlmostEqual(workload.is_write.mean(), 0.3, delta=0.03)
+        self.assertFalse(generate("uniform", 100, 1000, seed=2).is_write.any())
+    
+    def test_fills_output_array(self):
+        out = np.zeros(100, dtype=np.uint32)
+        workload = generate("uniform", 100, 50, seed=4, out=out)
+        self.assertIs(workload.requests, out)
+        self.assertTrue(np.array_equal(out, generate("uniform", 100, 50, seed=4).requests))
+    
+    def test_write_workload_round_trip(self):
+        workload = generate("bursty", 1000, 500, seed=5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bursty.dtrace")
+            write_workload(path, workload, 500)
+            trace = read_trace(path)
+            self.assertTrue(np.array_equal(trace.requests, workload.requests))
+            self.assertTrue(np.array_equal(trace.timestamps, workload.timestamps))
+            self.assertEqual(trace.disk_size, 500)
+            del trace
+    
+    def test_unknown_pattern(self):
+        with self.assertRaises(ValueError):
+            generate("random", 10, 100)
+
+if __name__ == '__main__':
+    unittest.main()